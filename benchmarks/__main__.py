@@ -0,0 +1,69 @@
+"""
+Run the benchmark suite.
+
+    python -m benchmarks                        # run and print everything
+    python -m benchmarks --only deck hand       # name prefixes
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --compare baseline.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+from .suite import benchmarks, compare, measure, run
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Py of Aces benchmarks")
+    parser.add_argument("--only", nargs="*", help="benchmark name prefixes to run")
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative change counted as a regression",
+    )
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, args.min_time)))
+        return 0
+
+    names = [
+        name
+        for name in benchmarks
+        if not args.only or any(name.startswith(prefix) for prefix in args.only)
+    ]
+    results = run(names, args.min_time)
+
+    print(f"{'benchmark':<26}{'ops/sec':>14}{'peak B/op':>12}{'kept blk/op':>13}{'RSS KiB':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<26}{result['ops_per_sec']:>14,.0f}"
+            f"{result['peak_bytes_per_op']:>12,.0f}"
+            f"{result['retained_blocks_per_op']:>13.2f}"
+            f"{result['peak_rss_kib']:>10,}"
+        )
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
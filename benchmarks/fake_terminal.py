@@ -0,0 +1,74 @@
+import re
+from contextlib import contextmanager
+
+ansi_pattern = re.compile(r"\x1b\[[0-9;]*m")
+
+style_codes = {
+    "normal": "\x1b[m",
+    "bold": "\x1b[1m",
+    "reverse": "\x1b[7m",
+    "red": "\x1b[31m",
+    "green": "\x1b[32m",
+    "yellow": "\x1b[33m",
+}
+
+
+class FormattingString(str):
+    """A style escape that can also wrap text, like blessed's."""
+
+    def __call__(self, text: str = "") -> str:
+        return f"{self}{text}{style_codes['normal']}"
+
+
+class FakeTerminal:
+    """
+    Headless stand-in for blessed.Terminal with the attributes the windows
+    use. Compound styles like `bold_green` are built from their parts.
+
+    args:
+        width: Reported terminal width.
+        height: Reported terminal height.
+        keys: Keystrokes returned by inkey(), in order.
+    """
+
+    clear = "\x1b[H\x1b[2J"
+
+    def __init__(self, width: int = 120, height: int = 50, keys: list[str] = None):
+        self.width = width
+        self.height = height
+        self.keys = list(keys or [])
+
+    def __getattr__(self, name: str) -> FormattingString:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        codes = [style_codes.get(part, "") for part in name.split("_")]
+        return FormattingString("".join(codes))
+
+    def center(self, text: str) -> str:
+        visible = len(ansi_pattern.sub("", text))
+        left = max((self.width - visible) // 2, 0)
+        right = max(self.width - visible - left, 0)
+        return " " * left + text + " " * right
+
+    def inkey(self, timeout: float = None) -> "FakeKeystroke":
+        if not self.keys:
+            return FakeKeystroke("")
+
+        return FakeKeystroke(self.keys.pop(0))
+
+    @contextmanager
+    def cbreak(self):
+        yield
+
+    @contextmanager
+    def hidden_cursor(self):
+        yield
+
+
+class FakeKeystroke(str):
+    """A keystroke whose `name` is set for named keys like "key_enter"."""
+
+    @property
+    def name(self) -> str | None:
+        return str(self) if self.startswith("key_") else None
@@ -0,0 +1,221 @@
+"""
+Keystroke replay benchmark for the TUI.
+
+A keystroke script is fed through the real TuiHandler and windows (as set
+up by py_of_aces.main) on a fake terminal. Each key is timed from the moment
+inkey() hands it over to the next inkey() call, which covers handle_input()
+and the render that follows, and the bytes printed in between make up its
+frame.
+
+    python -m benchmarks.replay                       # built-in script
+    python -m benchmarks.replay --script keys.json    # a JSON list of keys
+    python -m benchmarks.replay --save replay.json
+    python -m benchmarks.replay --compare replay.json --threshold 0.2
+
+Keys are what inkey() returns: characters, or names like "key_enter".
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+from contextlib import redirect_stdout
+from time import perf_counter
+from .fake_terminal import FakeKeystroke, FakeTerminal
+
+# Menu -> Play, then rounds of: pick a bet, nudge it, deal, hit, stand and
+# move on, then a look through the history and stats. Keys that don't apply
+# in the state the cards leave the game in are handled like a player
+# pressing them would be.
+round_keys: list[str] = ["2", "key_up", "key_down", "key_enter", "h", " ", " "]
+history_keys: list[str] = ["h", "key_down", "key_down", "key_pgdown", "key_up", "q"]
+default_script: list[str] = (
+    ["key_down", "key_up", "key_enter"]
+    + round_keys * 40
+    + history_keys
+    + ["t", "q", "q", "q"]
+)
+
+# Metric name -> noise floor; all of them are better lower
+metrics: dict[str, float] = {
+    "p50_ms": 0.02,
+    "p99_ms": 0.1,
+    "bytes_per_frame": 64,
+}
+
+
+class ReplayTerminal(FakeTerminal):
+    """
+    A FakeTerminal that times every key it hands out and counts the bytes
+    printed until the next inkey() call. Once the script runs out it stops
+    the TUI the way Ctrl+C would.
+
+    args:
+        keys: The keystroke script.
+        width: Reported terminal width.
+        height: Reported terminal height.
+    """
+
+    def __init__(self, keys: list[str], width: int = 120, height: int = 50):
+        super().__init__(width=width, height=height, keys=keys)
+        self.output = io.BytesIO()
+        self.stream = io.TextIOWrapper(
+            self.output, encoding="utf-8", write_through=True
+        )
+        # (window class, key, seconds, bytes) per key
+        self.frames: list[tuple[str, str, float, int]] = []
+        # Set once the TUI exists, to name the window a key went to
+        self.tui = None
+
+        self.__pending: tuple[str, str, float] | None = None
+
+    def inkey(self, timeout: float = None) -> FakeKeystroke:
+        now = perf_counter()
+        if self.__pending is not None:
+            window, key, started = self.__pending
+            self.frames.append((window, key, now - started, self.output.tell()))
+            self.__pending = None
+
+        self.output.seek(0)
+        self.output.truncate()
+
+        if not self.keys:
+            raise KeyboardInterrupt
+
+        key = self.keys.pop(0)
+        window = type(self.tui.active_window).__name__ if self.tui else ""
+        self.__pending = (window, key, perf_counter())
+        return FakeKeystroke(key)
+
+
+def replay(keys: list[str], seed: int = 0) -> ReplayTerminal:
+    """Play keys through a new TUI and game. Returns the terminal with its frames."""
+    from py_of_aces.game_logic import BlackjackGame
+    from py_of_aces.main import build_tui
+
+    terminal = ReplayTerminal(keys)
+    game = BlackjackGame(rng=random.Random(seed))
+    terminal.tui = build_tui(game, terminal_instance=terminal)
+
+    with redirect_stdout(terminal.stream):
+        terminal.tui.start("menu")
+
+    return terminal
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of values."""
+    ordered = sorted(values)
+    rank = max(int(fraction * len(ordered) + 0.5), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(frames: list[tuple[str, str, float, int]]) -> dict[str, dict]:
+    """Latency percentiles and bytes per frame, overall and per window."""
+    groups: dict[str, list[tuple[float, int]]] = {"all": []}
+    for window, _, seconds, size in frames:
+        groups["all"].append((seconds, size))
+        groups.setdefault(window, []).append((seconds, size))
+
+    summary = {}
+    for name, group in groups.items():
+        latencies = [seconds * 1000 for seconds, _ in group]
+        sizes = [size for _, size in group]
+        summary[name] = {
+            "keys": len(group),
+            "p50_ms": percentile(latencies, 0.50),
+            "p90_ms": percentile(latencies, 0.90),
+            "p99_ms": percentile(latencies, 0.99),
+            "max_ms": max(latencies),
+            "bytes_per_frame": sum(sizes) / len(sizes),
+            "max_bytes": max(sizes),
+        }
+
+    return summary
+
+
+def compare(
+    results: dict[str, dict], baseline: dict[str, dict], threshold: float
+) -> list[str]:
+    """Describe every metric that is worse than baseline by more than threshold."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+
+        for metric, noise_floor in metrics.items():
+            old, new = previous.get(metric), current.get(metric)
+            if old is None or new is None or new - old < noise_floor:
+                continue
+
+            if not old or (new - old) / old > threshold:
+                change = f"{(new - old) / old:+.1%}" if old else "new"
+                regressions.append(
+                    f"{name} {metric}: {old:,.2f} -> {new:,.2f} ({change})"
+                )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Py of Aces keystroke replay")
+    parser.add_argument("--script", help="JSON file with a list of keys to replay")
+    parser.add_argument(
+        "--runs", type=int, default=5, help="times to replay the script"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the game's shoe")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.20,
+        help="relative change counted as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    keys = default_script
+    if args.script:
+        with open(args.script) as file:
+            keys = json.load(file)
+
+    # The first run warms up imports and caches and isn't counted
+    replay(keys, args.seed)
+    frames = []
+    for _ in range(args.runs):
+        frames.extend(replay(keys, args.seed).frames)
+
+    results = summarize(frames)
+    print(
+        f"{'window':<20}{'keys':>7}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}"
+        f"{'max ms':>9}{'B/frame':>10}{'max B':>9}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<20}{result['keys']:>7}{result['p50_ms']:>9.3f}"
+            f"{result['p90_ms']:>9.3f}{result['p99_ms']:>9.3f}"
+            f"{result['max_ms']:>9.3f}{result['bytes_per_frame']:>10,.0f}"
+            f"{result['max_bytes']:>9,}"
+        )
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Import-time benchmark and startup budget check.
+
+Each target is imported in a fresh interpreter and timed. The engine import
+(py_of_aces.game_logic) must stay within the budget and must not pull in the
+TUI stack; the exit status is 1 when it does either.
+
+    python -m benchmarks.startup --runs 10 --budget-ms 100
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+targets = ["py_of_aces", "py_of_aces.game_logic", "py_of_aces.main"]
+engine_target = "py_of_aces.game_logic"
+tui_modules = ["blessed", "py_of_aces.tui_handler", "py_of_aces.windows.game_win"]
+
+probe = """
+import json, sys, time
+start = time.perf_counter()
+import {target}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def time_import(target: str) -> tuple[float, list[str]]:
+    """Import target in a new interpreter. Returns seconds and loaded modules."""
+    output = subprocess.run(
+        [sys.executable, "-c", probe.format(target=target)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output)
+    return result["seconds"], result["modules"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Py of Aces import-time benchmark")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=100.0,
+        help=f"median import time allowed for {engine_target}",
+    )
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{'module':<26}{'median ms':>11}{'min ms':>9}")
+    for target in targets:
+        timings = []
+        for _ in range(args.runs):
+            seconds, modules = time_import(target)
+            timings.append(seconds * 1000)
+
+        median = statistics.median(timings)
+        print(f"{target:<26}{median:>11.1f}{min(timings):>9.1f}")
+
+        if target != engine_target:
+            continue
+
+        if median > args.budget_ms:
+            failures.append(
+                f"{target} took {median:.1f} ms (budget {args.budget_ms} ms)"
+            )
+
+        leaked = [module for module in tui_modules if module in modules]
+        if leaked:
+            failures.append(f"{target} imported {', '.join(leaked)}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+"""
+Micro benchmarks for the game engine and rendering hot paths.
+
+A benchmark is a setup function registered with @benchmark. It builds its
+fixtures and returns the operation to time, a callable taking no arguments.
+"""
+
+import gc
+import io
+import json
+import math
+import resource
+import statistics
+import subprocess
+import sys
+import tracemalloc
+from contextlib import redirect_stdout
+from time import perf_counter
+from typing import Callable
+
+benchmarks: dict[str, Callable[[], Callable[[], object]]] = {}
+
+# Metric name -> True when higher is better
+metrics: dict[str, bool] = {
+    "ops_per_sec": True,
+    "peak_bytes_per_op": False,
+    "retained_blocks_per_op": False,
+    "peak_rss_kib": False,
+}
+
+# Changes smaller than this are noise, whatever the relative change
+noise_floors: dict[str, float] = {
+    "peak_bytes_per_op": 64,
+    "retained_blocks_per_op": 0.5,
+    "peak_rss_kib": 1024,
+}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function under name."""
+
+    def register(setup):
+        benchmarks[name] = setup
+        return setup
+
+    return register
+
+
+def _practice_game(**rules):
+    from py_of_aces.game_logic import BlackjackGame, Modes, Rules
+
+    game = BlackjackGame(rules=Rules(**rules))
+    game.select_mode(Modes.PRACTICE)
+    return game
+
+
+def _play_round(game) -> None:
+    """Play one round with a "hit below 17" strategy."""
+    from py_of_aces.game_logic import GameState
+
+    game.place_bet(10)
+    game.deal_initial_cards()
+    while game.state == GameState.PLAYER_TURN:
+        if game.current_hand.get_value() < 17:
+            game.hit()
+        else:
+            game.stand()
+
+    game.finish_round()
+    game.start_new_round()
+
+
+@benchmark("deck.deal")
+def deck_deal():
+    from py_of_aces.game_logic import BlackjackDeck, Rules
+
+    deck = BlackjackDeck(rules=Rules(num_decks=6))
+
+    def op():
+        if not deck.cards:
+            deck.reset_deck()
+        deck.deal(1)
+
+    return op
+
+
+@benchmark("deck.reset")
+def deck_reset():
+    from py_of_aces.game_logic import BlackjackDeck, Rules
+
+    deck = BlackjackDeck(rules=Rules(num_decks=6))
+    return deck.reset_deck
+
+
+@benchmark("deck.reset_from_bank")
+def deck_reset_from_bank():
+    import os
+    import tempfile
+    from py_of_aces.game_logic import BlackjackDeck, Rules
+    from py_of_aces.simulation.shoe_bank import ShoeBank
+
+    path = tempfile.mkstemp(suffix=".shoes")[1]
+    bank = ShoeBank.create(path, num_decks=6, count=64, seed=0)
+    os.unlink(path)  # The mapping outlives the file
+    deck = BlackjackDeck(rules=Rules(num_decks=6), shoes=bank.stream())
+    return deck.reset_deck
+
+
+@benchmark("hand.get_value")
+def hand_get_value():
+    from py_of_aces.game_logic import Card, Hand
+
+    hand = Hand()
+    for rank in ("A", "6", "9"):
+        hand.add_card(Card(rank, "s"))
+
+    return hand.get_value
+
+
+@benchmark("hand.add_card")
+def hand_add_card():
+    from py_of_aces.game_logic import Card, Hand
+
+    hand = Hand()
+    cards = [Card(rank, "h") for rank in ("A", "5", "K")]
+
+    def op():
+        for card in cards:
+            hand.add_card(card)
+        hand.reset()
+
+    return op
+
+
+@benchmark("game.round")
+def game_round():
+    game = _practice_game(num_decks=6)
+    return lambda: _play_round(game)
+
+
+@benchmark("batch.round_100")
+def batch_round():
+    """One round at each of 100 tables, same strategy as game.round."""
+    from py_of_aces.game_logic import Action, Rules
+    from py_of_aces.simulation.batch import TableBatch
+
+    batch = TableBatch(100, Rules(num_decks=6))
+    bets = [10] * batch.tables
+
+    def choose(hard_total, has_ace, pair, upcard, legal) -> Action:
+        total = hard_total + 10 if has_ace and hard_total <= 11 else hard_total
+        return Action.HIT if total < 17 else Action.STAND
+
+    def op():
+        batch.deal(bets)
+        batch.play(choose)
+        batch.finish_round()
+
+    return op
+
+
+@benchmark("side_bets.payout")
+def side_bets_payout():
+    """Settle all three side bets on one deal, tables already built."""
+    from py_of_aces.game_logic import SideBet, side_bet_payout
+
+    first_cards = (0, 13, 1)
+    for kind in SideBet:
+        side_bet_payout(kind, 10, first_cards, 3, True)
+
+    def op():
+        for kind in SideBet:
+            side_bet_payout(kind, 10, first_cards, 4, True)
+
+    return op
+
+
+def _split_ev(resplits: int):
+    """Uncached EV of splitting 2,2 against a 4 with up to resplits resplits."""
+    from py_of_aces.game_logic import Rules, full_shoe_counts
+    from py_of_aces.game_logic.ev import split_ev
+
+    rules = Rules(num_decks=6, max_splits=resplits + 1)
+    counts = list(full_shoe_counts(rules.num_decks))
+    counts[1] -= 2
+    counts[3] -= 1
+    counts = tuple(counts)
+    return lambda: split_ev.__wrapped__(2, counts, 4, rules)
+
+
+@benchmark("ev.split_1_resplit")
+def split_ev_1_resplit():
+    return _split_ev(1)
+
+
+@benchmark("ev.split_2_resplits")
+def split_ev_2_resplits():
+    return _split_ev(2)
+
+
+@benchmark("ev.split_3_resplits")
+def split_ev_3_resplits():
+    return _split_ev(3)
+
+
+def _game_window():
+    from .fake_terminal import FakeTerminal
+    from py_of_aces.game_logic import GameState
+    from py_of_aces.windows import GameWindow
+
+    game = _practice_game(num_decks=6)
+    while game.state != GameState.PLAYER_TURN:
+        game.start_new_round()
+        game.place_bet(10)
+        game.deal_initial_cards()
+
+    return GameWindow(
+        game=game,
+        menu_window="menu",
+        betting_window="betting",
+        terminal_instance=FakeTerminal(),
+        switch_win=lambda name: None,
+        stop_process=lambda: None,
+    )
+
+
+@benchmark("window.draw")
+def window_draw():
+    return _game_window().draw
+
+
+@benchmark("window.render")
+def window_render():
+    window = _game_window()
+    sink = io.StringIO()
+
+    def op():
+        with redirect_stdout(sink):
+            window.render()
+        sink.seek(0)
+        sink.truncate()
+
+    return op
+
+
+@benchmark("window.render_uncached")
+def window_render_uncached():
+    window = _game_window()
+    sink = io.StringIO()
+
+    def op():
+        # A new message changes the draw key, forcing a full draw.
+        window.message = "" if window.message else " "
+        with redirect_stdout(sink):
+            window.render()
+        sink.seek(0)
+        sink.truncate()
+
+    return op
+
+
+@benchmark("ascii.card")
+def ascii_card():
+    from py_of_aces.utils import get_card_ascii
+
+    return lambda: get_card_ascii("10", "h")
+
+
+@benchmark("ascii.join_cards")
+def ascii_join_cards():
+    from py_of_aces.utils import get_card_ascii, join_cards
+
+    cards = [get_card_ascii(rank, "s") for rank in ("A", "10", "5", "K")]
+    return lambda: join_cards(*cards)
+
+
+def _time(op: Callable, number: int) -> float:
+    start = perf_counter()
+    for _ in range(number):
+        op()
+    return perf_counter() - start
+
+
+def measure(name: str, min_time: float = 0.5, repeats: int = 5) -> dict:
+    """Run one benchmark in this process and return its metrics."""
+    op = benchmarks[name]()
+
+    number = 1
+    while _time(op, number) < min_time / repeats:
+        number *= 2
+
+    timings = [_time(op, number) for _ in range(repeats)]
+    ops_per_sec = number / statistics.median(timings)
+
+    # CPython has no cumulative allocation counter, so allocations are
+    # reported as the transient high-water mark of one op and the blocks
+    # still alive after many.
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    _time(op, number)
+    gc.collect()
+    retained_blocks = (sys.getallocatedblocks() - blocks_before) / number
+
+    peaks = []
+    tracemalloc.start()
+    for _ in range(min(number, 200)):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        op()
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": ops_per_sec,
+        "peak_bytes_per_op": statistics.mean(peaks),
+        "retained_blocks_per_op": max(retained_blocks, 0.0),
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def run(names: list[str], min_time: float = 0.5) -> dict[str, dict]:
+    """Run each benchmark in a fresh interpreter so peak RSS is its own."""
+    results = {}
+    for name in names:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks",
+                "--worker",
+                name,
+                "--min-time",
+                str(min_time),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        results[name] = json.loads(output)
+
+    return results
+
+
+def compare(
+    results: dict[str, dict], baseline: dict[str, dict], threshold: float
+) -> list[str]:
+    """Describe every metric that is worse than baseline by more than threshold."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+
+        for metric, higher_is_better in metrics.items():
+            old, new = previous.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+
+            if abs(new - old) < noise_floors.get(metric, 0):
+                continue
+
+            change = (new - old) / old if old else math.copysign(math.inf, new - old)
+            if (higher_is_better and change < -threshold) or (
+                not higher_is_better and change > threshold
+            ):
+                regressions.append(
+                    f"{name} {metric}: {old:,.1f} -> {new:,.1f} ({change:+.1%})"
+                )
+
+    return regressions
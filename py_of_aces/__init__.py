@@ -1,5 +1,30 @@
-from .main import run
+# The TUI stack (blessed and the windows) is only imported by the entry
+# points, so `import py_of_aces.game_logic` stays light for simulation
+# workers and short-lived tools.
+
+
+def __getattr__(name: str):
+    if name == "run":
+        from .main import run
+
+        return run
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def console_entry_point():
-    run()
+    from .main import main
+
+    main()
+
+
+def server_entry_point():
+    from .server import main
+
+    main()
+
+
+def headless_entry_point():
+    from .headless import main
+
+    main()
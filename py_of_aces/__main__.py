@@ -1,5 +1,5 @@
-from .main import run
+from .main import main
 
 
 if __name__ == "__main__":
-    run()
+    main()
@@ -1,3 +1,9 @@
 from .blackjack_game import *
 from .deck import *
+from .dealer import *
 from .game_modes import *
+from .rules import *
+from .strategy import *
+from .side_bets import *
+from .round_history import *
+from .histogram import *
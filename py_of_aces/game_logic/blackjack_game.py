@@ -1,8 +1,16 @@
+import random
 from enum import Enum
+from functools import lru_cache
+from typing import Iterator, Sequence
 from .deck import BlackjackDeck
+from .dealer import play_out
 from .hand import Hand
 from .game_modes import Modes, BaseGameMode, NormalMode, PracticeMode
-from ..config import init_starting_money, init_dealer_stand_value, init_max_splits
+from .observable import Observable
+from .round_record import RoundRecord
+from .rules import Rules
+from .side_bets import SideBet, side_bet_payout
+from ..config import init_starting_money
 
 
 class GameState(Enum):
@@ -18,38 +26,81 @@ class GameResult(Enum):
     PUSH = 2
     WIN = 3
     BLACKJACK = 4
+    SURRENDER = 5
 
 
-winnings_mult_map = {
-    GameResult.LOSE: 0,
-    GameResult.PUSH: 1,
-    GameResult.WIN: 2,
-    GameResult.BLACKJACK: 2.5,
-}
+class Action(Enum):
+    HIT = "hit"
+    STAND = "stand"
+    DOUBLE = "double"
+    SPLIT = "split"
+    SURRENDER = "surrender"
 
 
-class BlackjackGame:
+@lru_cache
+def payout_multipliers(rules: Rules) -> dict[GameResult, float]:
+    """Amount returned per unit bet for each result, stake included."""
+    return {
+        GameResult.LOSE: 0,
+        GameResult.PUSH: 1,
+        GameResult.WIN: 2,
+        GameResult.BLACKJACK: 1 + rules.blackjack_payout,
+        GameResult.SURRENDER: 0.5,
+    }
+
+
+class BlackjackGame(Observable):
+    """
+    A single-player blackjack table.
+
+    The game is observable: `revision` increases on every state transition and
+    on every change to its hands or game mode, and subscribers registered with
+    `subscribe` are called as callback(game, event). finish_round emits a
+    "round_finished" event once the round is settled.
+
+    rng and shoes are passed on to the BlackjackDeck. Games given the same
+    deck deal from one shoe, each taking the cards the others left.
+    """
+
     def __init__(
         self,
         starting_money: int = init_starting_money,
-        dealer_stand_value: int = init_dealer_stand_value,
-        max_splits: int = init_max_splits,
+        rules: Rules = None,
+        rng: random.Random = None,
+        shoes: Iterator[Sequence[int]] = None,
+        deck: BlackjackDeck = None,
     ):
+        super().__init__()
         self.starting_money = starting_money
-        self.max_splits = max_splits
+        self.rules = rules or Rules()
 
-        self.deck = BlackjackDeck()
-        self.dealer_hand = Hand(hidden_card_default=True)
-        self.dealer_stand_value = dealer_stand_value
-        self.player_hands: list[Hand] = [Hand()]
+        self.deck = deck or BlackjackDeck(rules=self.rules, rng=rng, shoes=shoes)
+        self.dealer_hand = self.__watch(Hand(hidden_card_default=True))
+        self.player_hands: list[Hand] = [self.__watch(Hand())]
         self.current_hand_index: int = 0
 
         self.bets: list[int] = [0]
+        self.initial_bet: int = 0
+        self.actions: list[tuple[int, Action]] = []
+        self.side_bets: dict[SideBet, int] = {}
+        # Card indices of the player's first two cards and the upcard
+        self.first_cards: tuple[int, int, int] | None = None
+        self.__round_settled = False
         self.current_mode: BaseGameMode | None = BaseGameMode
+        self.__unsubscribe_mode = None
 
-        self.state: GameState = GameState.BETTING
+        self._state: GameState = GameState.BETTING
         self.results: list[GameResult | None] = [None]
 
+    @property
+    def state(self) -> GameState:
+        return self._state
+
+    @state.setter
+    def state(self, new_state: GameState) -> None:
+        self._state = new_state
+        self._changed("state")
+
     @property
     def current_hand(self) -> Hand:
         """Get the currently active hand."""
@@ -69,7 +120,7 @@ class BlackjackGame:
 
     @property
     def total_bet(self) -> int:
-        return sum(self.bets)
+        return sum(self.bets) + sum(self.side_bets.values())
 
     @property
     def can_double_down(self) -> bool:
@@ -80,6 +131,9 @@ class BlackjackGame:
         if not self.current_hand.can_double_down:
             return False
 
+        if self.current_hand.is_split and not self.rules.double_after_split:
+            return False
+
         bet_amount = self.bets[self.current_hand_index]
         return self.current_mode.can_afford_bet(bet_amount)
 
@@ -90,15 +144,27 @@ class BlackjackGame:
             return False
 
         # max hands = max splits + 1 original hand
-        if len(self.player_hands) >= self.max_splits + 1:
+        if len(self.player_hands) >= self.rules.max_splits + 1:
             return False
 
         if not self.current_hand.can_split:
             return False
 
+        is_aces = self.current_hand.cards[0].rank == "A"
+        if is_aces and self.current_hand.is_split and not self.rules.resplit_aces:
+            return False
+
         bet_amount = self.bets[self.current_hand_index]
         return self.current_mode.can_afford_bet(bet_amount)
 
+    @property
+    def can_surrender(self) -> bool:
+        """Check if the player can surrender (late surrender on the first two cards)."""
+        if self.state != GameState.PLAYER_TURN or not self.rules.surrender:
+            return False
+
+        return len(self.player_hands) == 1 and len(self.current_hand.cards) == 2
+
     @property
     def get_money_display(self) -> str:
         return self.current_mode.get_money_display()
@@ -115,6 +181,24 @@ class BlackjackGame:
     def will_reshuffle(self) -> bool:
         return self.deck.needs_reshuffle
 
+    @property
+    def legal_actions(self) -> list[Action]:
+        """Actions the player can take on the current hand."""
+        if self.state != GameState.PLAYER_TURN:
+            return []
+
+        actions = [Action.HIT, Action.STAND]
+        if self.can_double_down:
+            actions.append(Action.DOUBLE)
+
+        if self.can_split:
+            actions.append(Action.SPLIT)
+
+        if self.can_surrender:
+            actions.append(Action.SURRENDER)
+
+        return actions
+
     def select_mode(self, selected_mode: Modes) -> None:
         """Select the game mode."""
         if selected_mode == self.mode:
@@ -122,21 +206,87 @@ class BlackjackGame:
 
         match selected_mode:
             case Modes.NORMAL:
-                self.current_mode = NormalMode(self.starting_money)
+                self.__set_mode(NormalMode(self.starting_money))
                 self.__reset_game()
             case Modes.PRACTICE:
-                self.current_mode = PracticeMode()
+                self.__set_mode(PracticeMode())
                 self.__reset_game()
 
+    def __set_mode(self, mode: BaseGameMode) -> None:
+        """Swap the game mode, forwarding its change notifications."""
+        if self.__unsubscribe_mode:
+            self.__unsubscribe_mode()
+
+        self.current_mode = mode
+        self.__unsubscribe_mode = mode.subscribe(self.__on_child_changed)
+        self._changed("mode")
+
+    def __watch(self, hand: Hand) -> Hand:
+        """Forward the hand's change notifications and return it."""
+        hand.subscribe(self.__on_child_changed)
+        return hand
+
+    def __on_child_changed(self, sender, event: str) -> None:
+        self._changed(event)
+
     def finish_round(self) -> None:
-        """Finish the round."""
+        """Finish the round. Calling it again before the next round does nothing."""
+        if self.__round_settled:
+            return
+
+        self.__round_settled = True
         winnings = self.get_winnings()
         total_bet = self.total_bet
 
         self.current_mode.finish_round(winnings, total_bet)
+        self.current_mode.stats.record_round(
+            net=winnings - total_bet,
+            initial_bet=self.initial_bet,
+            results=[result for result in self.results if result is not None],
+            doubles=sum(hand.is_doubled for hand in self.player_hands),
+            splits=len(self.player_hands) - 1,
+        )
+        self.current_mode.histograms.record_round(
+            net=winnings - total_bet,
+            bankroll=self.current_mode.get_balance(),
+            dealer_total=self.dealer_hand.get_value(),
+        )
+        self._changed("round_finished")
+
+    def void_round(self) -> None:
+        """
+        Call the round off and return every bet, as when a stacked shoe runs
+        out mid-round. Nothing is recorded and betting opens again.
+        """
+        if not self.__round_settled:
+            total_bet = self.total_bet
+            self.current_mode.finish_round(total_bet, total_bet)
+
+        self.start_new_round()
+        self._changed("round_voided")
+
+    def round_record(self) -> RoundRecord:
+        """Snapshot the current round for history and analysis."""
+        return RoundRecord(
+            mode=self.mode.name,
+            dealer_cards=[card.code for card in self.dealer_hand.cards],
+            dealer_total=self.dealer_hand.get_value(),
+            player_hands=[
+                [card.code for card in hand.cards] for hand in self.player_hands
+            ],
+            hand_totals=[hand.get_value() for hand in self.player_hands],
+            bets=list(self.bets),
+            results=[result.name if result else "" for result in self.results],
+            hand_payouts=[self.get_hand_payout(i) for i in range(len(self.results))],
+            actions=[(index, action.value) for index, action in self.actions],
+            initial_bet=self.initial_bet,
+            payout=self.get_winnings(),
+            side_bets=sum(self.side_bets.values()),
+        )
 
     def start_new_round(self):
         """Start a new round."""
+        self.deck.collect()
         if self.deck.needs_reshuffle:
             self.deck.reset_deck()
 
@@ -145,13 +295,18 @@ class BlackjackGame:
     def __reset_game(self):
         """Reset the game to initial state."""
         self.dealer_hand.reset()
-        self.player_hands = [Hand()]
+        self.player_hands = [self.__watch(Hand())]
         self.current_hand_index = 0
 
         self.bets = [0]
+        self.initial_bet = 0
+        self.actions = []
+        self.side_bets = {}
+        self.first_cards = None
+        self.__round_settled = False
 
-        self.state = GameState.BETTING
         self.results = [None]
+        self.state = GameState.BETTING
 
     def reset_money(self):
         """Reset the current game mode."""
@@ -163,6 +318,20 @@ class BlackjackGame:
             return False
 
         self.bets[self.current_hand_index] = amount
+        self.initial_bet = amount
+        self._changed("bet")
+        return True
+
+    def place_side_bet(self, kind: SideBet, amount: int) -> bool:
+        """Place a side bet before the deal. Returns True if successful."""
+        if self.state != GameState.BETTING or kind in self.side_bets:
+            return False
+
+        if not self.current_mode.place_bet(amount):
+            return False
+
+        self.side_bets[kind] = amount
+        self._changed("side_bet")
         return True
 
     def deal_initial_cards(self):
@@ -174,28 +343,41 @@ class BlackjackGame:
             self.player_hands[0].add_card(self.deck.deal(1)[0])
             self.dealer_hand.add_card(self.deck.deal(1)[0])
 
+        if self.side_bets:
+            first, second = self.player_hands[0].cards
+            self.first_cards = (
+                first.index,
+                second.index,
+                self.dealer_hand.cards[0].index,
+            )
+
         is_player_blackjack = self.player_hands[0].is_blackjack
         is_dealer_blackjack = self.dealer_hand.is_blackjack
 
-        self.state = GameState.ROUND_FINISHED
         match (is_player_blackjack, is_dealer_blackjack):
             case (True, True):
                 self.results = [GameResult.PUSH]
 
             case (True, False):
                 self.results = [GameResult.BLACKJACK]
+                if SideBet.DEALER_BUST in self.side_bets:
+                    self.__dealer_draw()
 
             case (False, True):
                 self.results = [GameResult.LOSE]
 
             case (False, False):
                 self.state = GameState.PLAYER_TURN
+                return
+
+        self.state = GameState.ROUND_FINISHED
 
     def hit(self) -> bool:
         """Player hits. Returns True if successful."""
         if self.state != GameState.PLAYER_TURN:
             return False
 
+        self.actions.append((self.current_hand_index, Action.HIT))
         self.current_hand.add_card(self.deck.deal(1)[0])
 
         if self.current_hand.is_bust:
@@ -208,6 +390,7 @@ class BlackjackGame:
         if self.state != GameState.PLAYER_TURN:
             return False
 
+        self.actions.append((self.current_hand_index, Action.STAND))
         self.__finish_current_hand()
         return True
 
@@ -221,7 +404,10 @@ class BlackjackGame:
         if not self.current_mode.double_down_bet(bet_amount):
             return False
 
+        self.actions.append((self.current_hand_index, Action.DOUBLE))
         self.bets[self.current_hand_index] *= 2
+        self.current_hand.is_doubled = True
+        self._changed("bet")
 
         self.current_hand.add_card(self.deck.deal(1)[0])
 
@@ -242,24 +428,53 @@ class BlackjackGame:
         if not self.current_mode.split_bet(bet_amount):
             return False
 
+        self.actions.append((self.current_hand_index, Action.SPLIT))
         original_hand = self.current_hand
         new_hand = self.__create_new_hand(bet_amount)
 
-        second_card = original_hand.cards.pop()
+        second_card = original_hand.pop_card()
         new_hand.add_card(second_card)
+        original_hand.is_split = True
+        new_hand.is_split = True
 
         original_hand.add_card(self.deck.deal(1)[0])
         new_hand.add_card(self.deck.deal(1)[0])
 
         return True
 
+    def surrender(self) -> bool:
+        """Player surrenders half the bet. Returns True if successful."""
+        if not self.can_surrender:
+            return False
+
+        self.actions.append((self.current_hand_index, Action.SURRENDER))
+        self.__finish_current_hand(GameResult.SURRENDER)
+        return True
+
+    def apply(self, action: Action) -> bool:
+        """Apply a player action. Returns True if successful."""
+        match action:
+            case Action.HIT:
+                return self.hit()
+            case Action.STAND:
+                return self.stand()
+            case Action.DOUBLE:
+                return self.double_down()
+            case Action.SPLIT:
+                return self.split()
+            case Action.SURRENDER:
+                return self.surrender()
+
+        return False
+
     def __create_new_hand(self, bet: int) -> Hand:
         """Create a new hand for the player and return it."""
-        new_hand = Hand()
+        new_hand = self.__watch(Hand())
 
         self.player_hands.append(new_hand)
         self.bets.append(bet)
         self.results.append(None)
+        self._changed("hand_added")
 
         return new_hand
 
@@ -270,6 +485,7 @@ class BlackjackGame:
 
         if self.has_more_hands:
             self.current_hand_index += 1
+            self._changed("hand_advanced")
             return
 
         self.state = GameState.DEALER_TURN
@@ -277,14 +493,24 @@ class BlackjackGame:
 
     def __dealer_play(self) -> None:
         """Automated dealer play."""
-        if self.__has_non_busted():
-            while self.dealer_hand.get_value() < self.dealer_stand_value:
-                self.dealer_hand.add_card(self.deck.deal(1)[0])
+        # A dealer bust bet is settled on the dealer's hand played out
+        if self.__has_non_busted() or SideBet.DEALER_BUST in self.side_bets:
+            self.__dealer_draw()
 
         self.__determine_winners()
-        self.dealer_hand.has_hidden_card = False
+        self.dealer_hand.reveal()
         self.state = GameState.ROUND_FINISHED
 
+    def __dealer_draw(self) -> None:
+        dealer_hand = self.dealer_hand
+
+        def draw() -> int:
+            card = self.deck.deal(1)[0]
+            dealer_hand.add_card(card)
+            return card.points
+
+        play_out(dealer_hand.hard_total, dealer_hand.aces > 0, draw, self.rules)
+
     def __has_non_busted(self) -> bool:
         """Check if there is at least one non-busted player hand."""
         if None in self.results:
@@ -317,17 +543,38 @@ class BlackjackGame:
 
             self.results[i] = GameResult.LOSE
 
+    def get_hand_payout(self, index: int) -> int:
+        """Amount returned for one hand, stake included."""
+        result = self.results[index]
+        if result is None:
+            return 0
+
+        mult = payout_multipliers(self.rules).get(result, 0)
+        return int(self.bets[index] * mult)
+
+    def get_side_bet_payout(self, kind: SideBet) -> int:
+        """Amount returned for a side bet, stake included."""
+        bet = self.side_bets.get(kind)
+        if (
+            not bet
+            or self.first_cards is None
+            or self.state != GameState.ROUND_FINISHED
+        ):
+            return 0
+
+        dealer_hand = self.dealer_hand
+        return side_bet_payout(
+            kind, bet, self.first_cards, len(dealer_hand.cards), dealer_hand.is_bust
+        )
+
     def get_winnings(self) -> int:
-        """Calculate total winnings based on all hand results."""
+        """Calculate total winnings based on all hand results and side bets."""
         total_winnings = 0
 
-        for i, result in enumerate(self.results):
-            if result is None:
-                continue
-
-            bet = self.bets[i]
-            mult = winnings_mult_map.get(result, 0)
+        for i in range(len(self.results)):
+            total_winnings += self.get_hand_payout(i)
 
-            total_winnings += int(bet * mult)
+        for kind in self.side_bets:
+            total_winnings += self.get_side_bet_payout(kind)
 
         return total_winnings
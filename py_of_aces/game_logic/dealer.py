@@ -0,0 +1,138 @@
+"""
+Dealer policy shared by the game, the simulators and the exact dealer
+probability engine.
+
+Hands are described by their hard total (aces counted as 1) and whether they
+hold an ace, so playing out a dealer hand needs no Card or Hand objects.
+"""
+
+from functools import lru_cache
+from typing import Callable
+from .rules import Rules
+
+BUST = 22
+NATURAL = 23
+OUTCOME_SLOTS = 24
+
+
+def hand_value(hard_total: int, has_ace: bool) -> tuple[int, bool]:
+    """Return the best total and whether it is soft (an ace counted as 11)."""
+    if has_ace and hard_total + 10 <= 21:
+        return hard_total + 10, True
+
+    return hard_total, False
+
+
+def dealer_should_hit(total: int, soft: bool, rules: Rules) -> bool:
+    """The dealer's hit/stand decision under the H17/S17 rule."""
+    if total < rules.dealer_stand_value:
+        return True
+
+    return soft and total == rules.dealer_stand_value and rules.dealer_hits_soft_17
+
+
+def play_out(
+    hard_total: int, has_ace: bool, draw: Callable[[], int], rules: Rules
+) -> int:
+    """
+    Draw for the dealer until they stand.
+
+    args:
+        hard_total: Hard total of the dealer's cards so far.
+        has_ace: Whether those cards include an ace.
+        draw: Returns the points (ace = 1) of the next card from the shoe.
+        rules: The rules deciding soft 17.
+
+    Returns:
+        The final total, above 21 if the dealer busted.
+    """
+    total, soft = hand_value(hard_total, has_ace)
+    while dealer_should_hit(total, soft, rules):
+        points = draw()
+        hard_total += points
+        has_ace = has_ace or points == 1
+        total, soft = hand_value(hard_total, has_ace)
+
+    return total
+
+
+def dealer_probabilities(
+    counts: tuple[int, ...], upcard: int, rules: Rules, peek: bool = True
+) -> tuple[float, ...]:
+    """
+    Exact distribution of the dealer's final hand.
+
+    args:
+        counts: Remaining shoe per point value (aces first), upcard removed.
+        upcard: Points of the dealer's upcard (ace = 1).
+        rules: The rules the dealer plays by.
+        peek: Condition on the dealer not having a natural, as the game ends
+        the round before the player acts when they do.
+
+    Returns:
+        Probabilities indexed by final total, with BUST and NATURAL slots.
+    """
+    return _cached_dealer_probabilities(tuple(counts), upcard, rules, peek)
+
+
+@lru_cache(maxsize=4096)
+def _cached_dealer_probabilities(
+    counts: tuple[int, ...], upcard: int, rules: Rules, peek: bool
+) -> tuple[float, ...]:
+    probabilities = [0.0] * OUTCOME_SLOTS
+    remaining = sum(counts)
+    kept = 0.0
+
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+
+        points = index + 1
+        chance = count / remaining
+        hard_total = upcard + points
+        has_ace = upcard == 1 or points == 1
+
+        if hand_value(hard_total, has_ace)[0] == 21:
+            if not peek:
+                probabilities[NATURAL] += chance
+            continue
+
+        kept += chance
+        rest = counts[:index] + (count - 1,) + counts[index + 1 :]
+        outcome = _play_out_probabilities(rest, hard_total, has_ace, rules)
+        for slot, probability in enumerate(outcome):
+            probabilities[slot] += chance * probability
+
+    if peek and kept:
+        probabilities = [probability / kept for probability in probabilities]
+
+    return tuple(probabilities)
+
+
+@lru_cache(maxsize=262_144)
+def _play_out_probabilities(
+    counts: tuple[int, ...], hard_total: int, has_ace: bool, rules: Rules
+) -> tuple[float, ...]:
+    """Distribution of final totals when the dealer keeps drawing from counts."""
+    total, soft = hand_value(hard_total, has_ace)
+    probabilities = [0.0] * OUTCOME_SLOTS
+
+    remaining = sum(counts)
+    if not remaining or not dealer_should_hit(total, soft, rules):
+        probabilities[min(total, BUST)] = 1.0
+        return tuple(probabilities)
+
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+
+        points = index + 1
+        chance = count / remaining
+        rest = counts[:index] + (count - 1,) + counts[index + 1 :]
+        outcome = _play_out_probabilities(
+            rest, hard_total + points, has_ace or points == 1, rules
+        )
+        for slot, probability in enumerate(outcome):
+            probabilities[slot] += chance * probability
+
+    return tuple(probabilities)
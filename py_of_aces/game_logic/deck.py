@@ -1,5 +1,24 @@
 import random
-from ..config import init_num_cards_reshuffle
+from collections import Counter
+from typing import Iterator, Sequence
+from .rules import Rules
+
+# Hard points per rank, aces count 1
+rank_points: dict[str, int] = {
+    "A": 1,
+    "2": 2,
+    "3": 3,
+    "4": 4,
+    "5": 5,
+    "6": 6,
+    "7": 7,
+    "8": 8,
+    "9": 9,
+    "10": 10,
+    "J": 10,
+    "Q": 10,
+    "K": 10,
+}
 
 
 class Card:
@@ -10,16 +29,28 @@ class Card:
     def __init__(self, rank: str, suit: str):
         self.rank = rank
         self.suit = suit
+        self.points = rank_points[rank]
 
-    def value(self) -> int | list[int]:
-        """Return Blackjack value of the card."""
-        if self.rank in ["J", "Q", "K"]:
-            return 10
+    @property
+    def code(self) -> str:
+        """Two character code, rank then suit, with "T" for tens ("As", "Td")."""
+        rank = "T" if self.rank == "10" else self.rank
+        return rank + self.suit
+
+    @classmethod
+    def from_code(cls, code: str) -> "Card":
+        rank = "10" if code[0] == "T" else code[0]
+        return cls(rank, code[1])
+
+    @property
+    def index(self) -> int:
+        """Card index 0-51, suit * 13 + rank, as stored in shoe banks."""
+        suit = BlackjackDeck.suits.index(self.suit)
+        return suit * 13 + BlackjackDeck.ranks.index(self.rank)
 
-        if self.rank == "A":
-            return [1, 11]
 
-        return int(self.rank)
+class ShoeExhausted(ValueError):
+    """Raised when a deal needs more cards than the shoe can give."""
 
 
 class BlackjackDeck:
@@ -28,28 +59,62 @@ class BlackjackDeck:
     - Supports shuffling
     - Dealing cards
     - Resetting to a new shuffled deck
+    - Continuous shuffling, when the rules ask for it
+
+    The remaining cards are kept with the next one to deal last, so dealing
+    is O(1) per card. Cards dealt this round stay in `in_play` until
+    `collect` returns them. If the shoe runs out mid-round, the discards are
+    shuffled back in under the cards left, like a dealer would; a stacked
+    deck raises ShoeExhausted instead.
+
+    args:
+        shuffle: Shuffle the new shoe.
+        rules: The rules setting the shoe size, penetration and shuffler.
+        rng: Random source for shuffles, for reproducible shoes.
+        shoes: Pre-shuffled shoes to use instead of shuffling, each a
+        sequence of card indices with the first card to deal last, such as
+        the rows of a ShoeBank.
     """
 
     suits = ["s", "h", "d", "c"]
     ranks = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
 
     def __init__(
-        self, shuffle: bool = True, num_cards_reshuffle: int = init_num_cards_reshuffle
+        self,
+        shuffle: bool = True,
+        rules: Rules = None,
+        rng: random.Random = None,
+        shoes: Iterator[Sequence[int]] = None,
     ):
-        self.cards = []
-        self.num_cards_reshuffle = num_cards_reshuffle
+        self.cards: list[Card] = []
+        self.in_play: list[Card] = []
+        self.rules = rules or Rules()
+        self.rng = rng or random.Random()
+        self.shoes = shoes
 
         self.reset_deck(shuffle=shuffle)
 
+    @classmethod
+    def stacked(
+        cls, cards: list[Card], rules: Rules = None, rng: random.Random = None
+    ) -> "BlackjackDeck":
+        """A deck that deals cards in the given order, for replays and fuzzing."""
+        deck = cls(shuffle=False, rules=rules, rng=rng)
+        deck.cards = cards[::-1]
+        deck.refills = False
+        return deck
+
     def __build_deck(self) -> None:
-        """Create the deck with the given number of decks."""
-        for suit in self.suits:
-            for rank in self.ranks:
-                self.cards.append(Card(rank, suit))
+        """Create the shoe with the number of decks set by the rules."""
+        self.cards = []
+        for _ in range(self.rules.num_decks):
+            for suit in self.suits:
+                for rank in self.ranks:
+                    self.cards.append(Card(rank, suit))
 
     def shuffle(self) -> None:
         """Shuffle the deck in place."""
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def deal(self, n: int = 1) -> list[Card]:
         """
@@ -57,23 +122,108 @@ class BlackjackDeck:
 
         Returns:
             List of Card objects.
+
+        Raises:
+            ShoeExhausted: Not enough cards, even with the discards.
         """
+        if n > len(self.cards) and self.refills:
+            self.__refill()
         if n > len(self.cards):
-            raise ValueError("Too many cards requested to deal.")
+            raise ShoeExhausted("Too many cards requested to deal.")
+
+        split_at = len(self.cards) - n
+        dealt = self.cards[split_at:][::-1]
+        del self.cards[split_at:]
 
-        dealt, self.cards = self.cards[:n], self.cards[n:]
+        self.in_play += dealt
         return dealt
 
+    def collect(self) -> None:
+        """
+        Clear the cards dealt this round off the table.
+
+        A continuous shuffler puts each one back at a uniformly random position
+        (an inside-out Fisher-Yates step), O(1) per card and with no full
+        reshuffle. Otherwise they go to the discard tray until the next reset.
+        """
+        if self.rules.continuous_shuffle:
+            cards = self.cards
+            randrange = self.rng.randrange
+            for card in self.in_play:
+                cards.append(card)
+                position = randrange(len(cards))
+                cards[position], cards[-1] = cards[-1], cards[position]
+
+        self.in_play = []
+
+    def __refill(self) -> None:
+        """Shuffle the discards, a fresh shoe less the cards held, under the rest."""
+        remaining, in_play = self.cards, self.in_play
+        held = Counter(card.index for card in remaining + in_play)
+
+        self.reset_deck()
+        discards = []
+        for card in self.cards:
+            if held[card.index]:
+                held[card.index] -= 1
+            else:
+                discards.append(card)
+
+        self.cards = discards + remaining
+        self.in_play = in_play
+
     def reset_deck(self, shuffle: bool = True) -> None:
-        """Reset to a full deck again."""
+        """Reset to a full deck again, taking the next pre-shuffled shoe if any."""
+        self.in_play = []
+        # Whether running out mid-round shuffles the discards back in
+        self.refills = True
+        if shuffle and self.shoes is not None:
+            self.__load_shoe(next(self.shoes))
+            return
+
         self.__build_deck()
         if shuffle:
             self.shuffle()
 
+    def __load_shoe(self, shoe: Sequence[int]) -> None:
+        if len(shoe) != self.rules.shoe_size:
+            raise ValueError(
+                f"Shoe of {len(shoe)} cards for a {self.rules.shoe_size} card shoe"
+            )
+
+        self.cards = list(map(card_table.__getitem__, shoe))
+
+    def counts(self) -> tuple[int, ...]:
+        """Remaining cards per point value, aces first and tens last."""
+        return shoe_counts(self.cards)
+
     @property
     def needs_reshuffle(self) -> bool:
-        """Check if the deck needs reshuffling."""
-        return len(self.cards) < self.num_cards_reshuffle
+        """Check if the deck needs reshuffling. Never with a continuous shuffler."""
+        if self.rules.continuous_shuffle:
+            return False
+
+        return len(self.cards) < self.rules.reshuffle_at
 
     def __len__(self) -> int:
         return len(self.cards)
+
+
+# One shared Card per card index, for shoes built from indices
+card_table: tuple[Card, ...] = tuple(
+    Card(rank, suit) for suit in BlackjackDeck.suits for rank in BlackjackDeck.ranks
+)
+
+
+def shoe_counts(cards: list[Card]) -> tuple[int, ...]:
+    """Count cards per point value (index 0 is aces, index 9 is ten-valued)."""
+    counts = [0] * 10
+    for card in cards:
+        counts[card.points - 1] += 1
+
+    return tuple(counts)
+
+
+def full_shoe_counts(num_decks: int) -> tuple[int, ...]:
+    """Composition of an undealt shoe of num_decks decks."""
+    return (4 * num_decks,) * 9 + (16 * num_decks,)
@@ -0,0 +1,169 @@
+"""
+Decision drills: starting hands dealt straight from a table of how often
+each one comes up, checked against basic strategy.
+
+A scenario is (low card points, high card points, upcard points), aces
+being 1. Rounds that end before the player acts (a player blackjack, or a
+dealer blackjack found on the peek) are left out of the table.
+"""
+
+import random
+from functools import lru_cache
+from itertools import accumulate
+from .blackjack_game import Action
+from .deck import BlackjackDeck, Card, card_table, full_shoe_counts
+from .hand import Hand
+from .observable import Observable
+from .rules import Rules
+from .strategy import basic_action
+
+Scenario = tuple[int, int, int]
+
+
+@lru_cache
+def scenario_table(rules: Rules) -> tuple[tuple[Scenario, ...], tuple[float, ...]]:
+    """
+    Every starting hand the player acts on, with cumulative deal
+    probabilities from a full shoe, for random.choices.
+    """
+    counts = full_shoe_counts(rules.num_decks)
+    cards = sum(counts)
+
+    scenarios: list[Scenario] = []
+    weights: list[float] = []
+    for low in range(1, 11):
+        for high in range(low, 11):
+            if (low, high) == (1, 10):
+                continue
+
+            # Dealt in either order unless it's a pair
+            player = counts[low - 1] * (counts[high - 1] - (low == high))
+            player *= 1 if low == high else 2
+
+            for upcard in range(1, 11):
+                rest = list(counts)
+                rest[low - 1] -= 1
+                rest[high - 1] -= 1
+                upcards = rest[upcard - 1]
+                rest[upcard - 1] -= 1
+
+                # Hole cards that would give the dealer a blackjack
+                natural = {1: 10, 10: 1}.get(upcard)
+                no_natural = 1.0
+                if natural is not None:
+                    no_natural -= rest[natural - 1] / (cards - 3)
+
+                chance = player * upcards / (cards * (cards - 1) * (cards - 2))
+                scenarios.append((low, high, upcard))
+                weights.append(chance * no_natural)
+
+    return tuple(scenarios), tuple(accumulate(weights))
+
+
+class Drill(Observable):
+    """
+    Rapid-fire basic strategy practice.
+
+    The current scenario is shown as game Hands so windows can draw it like
+    a round. Each answer is checked against basic_action and counted in the
+    scenario's accuracy before the next scenario is drawn.
+
+    args:
+        rules: The rules setting the shoe and the strategy.
+        rng: Random source for scenarios and suits.
+    """
+
+    def __init__(self, rules: Rules = None, rng: random.Random = None):
+        super().__init__()
+        self.rules = rules or Rules()
+        self.rng = rng or random.Random()
+        self.scenarios, self.cum_weights = scenario_table(self.rules)
+
+        # Scenario -> [correct, attempts]
+        self.accuracy: dict[Scenario, list[int]] = {}
+        self.correct = 0
+        self.attempts = 0
+        # (scenario, answer, basic strategy action) of the last answer
+        self.last: tuple[Scenario, Action, Action] | None = None
+
+        self.scenario: Scenario = self.scenarios[0]
+        self.player_hand = Hand()
+        self.dealer_hand = Hand(hidden_card_default=True)
+        self.next_scenario()
+
+    @property
+    def legal_actions(self) -> list[Action]:
+        """Actions allowed on a two-card starting hand."""
+        low, high, _ = self.scenario
+        actions = [Action.HIT, Action.STAND, Action.DOUBLE]
+        if low == high:
+            actions.append(Action.SPLIT)
+
+        if self.rules.surrender:
+            actions.append(Action.SURRENDER)
+
+        return actions
+
+    @property
+    def expected_action(self) -> Action:
+        """The basic strategy play of the current scenario."""
+        low, high, upcard = self.scenario
+        pair = low if low == high else None
+        return basic_action(
+            low + high, low == 1, pair, upcard, self.legal_actions, self.rules
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        return self.correct / self.attempts if self.attempts else 0.0
+
+    def answer(self, action: Action) -> bool:
+        """Check action against basic strategy and move to the next scenario."""
+        expected = self.expected_action
+        is_correct = action is expected
+
+        record = self.accuracy.get(self.scenario)
+        if record is None:
+            record = self.accuracy[self.scenario] = [0, 0]
+
+        record[0] += is_correct
+        record[1] += 1
+        self.correct += is_correct
+        self.attempts += 1
+        self.last = (self.scenario, action, expected)
+
+        self.next_scenario()
+        return is_correct
+
+    def weakest(self, n: int = 3, min_attempts: int = 3) -> list[Scenario]:
+        """The n scenarios answered least accurately, once tried enough."""
+        tried = [
+            (correct / attempts, scenario)
+            for scenario, (correct, attempts) in self.accuracy.items()
+            if attempts >= min_attempts and correct < attempts
+        ]
+        tried.sort()
+        return [scenario for _, scenario in tried[:n]]
+
+    def next_scenario(self) -> None:
+        """Draw a scenario by deal frequency and lay it out as hands."""
+        (self.scenario,) = self.rng.choices(
+            self.scenarios, cum_weights=self.cum_weights
+        )
+        low, high, upcard = self.scenario
+        cards = [self.__card(points) for points in (low, high, upcard)]
+
+        self.player_hand.reset()
+        self.dealer_hand.reset()
+        self.player_hand.add_card(cards[0])
+        self.player_hand.add_card(cards[1])
+        self.dealer_hand.add_card(cards[2])
+        # The hole card stays face down, any card will do
+        self.dealer_hand.add_card(cards[0])
+        self._changed("scenario")
+
+    def __card(self, points: int) -> Card:
+        """A card worth points, in a random suit and, for tens, a random rank."""
+        rank = points - 1 if points < 10 else self.rng.randint(9, 12)
+        suit = self.rng.randrange(len(BlackjackDeck.suits))
+        return card_table[suit * 13 + rank]
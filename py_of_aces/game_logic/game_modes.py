@@ -1,4 +1,7 @@
 from enum import Enum
+from .histogram import OutcomeHistograms
+from .observable import Observable
+from .session_stats import SessionStats
 
 
 class Modes(Enum):
@@ -7,9 +10,14 @@ class Modes(Enum):
     PRACTICE = 2
 
 
-class BaseGameMode:
+class BaseGameMode(Observable):
     mode_type = Modes.BASE
 
+    def __init__(self):
+        super().__init__()
+        self.stats = SessionStats()
+        self.histograms = OutcomeHistograms()
+
     def place_bet(self, amount: int) -> bool:
         """Place a bet. Returns True if successful."""
         raise NotImplementedError
@@ -34,6 +42,10 @@ class BaseGameMode:
         """Get available money for betting."""
         raise NotImplementedError
 
+    def get_balance(self) -> int:
+        """Get the money tracked by this mode (bankroll or net pot)."""
+        raise NotImplementedError
+
     @property
     def is_game_over(self) -> bool:
         """Check if the game should end (e.g., out of money)."""
@@ -52,6 +64,7 @@ class NormalMode(BaseGameMode):
     mode_type = Modes.NORMAL
 
     def __init__(self, starting_money: int = 1000):
+        super().__init__()
         self.starting_money = starting_money
         self.player_money = starting_money
 
@@ -60,6 +73,7 @@ class NormalMode(BaseGameMode):
             return False
 
         self.player_money -= amount
+        self._changed("money")
         return True
 
     def double_down_bet(self, current_bet: int) -> bool:
@@ -67,6 +81,7 @@ class NormalMode(BaseGameMode):
             return False
 
         self.player_money -= current_bet
+        self._changed("money")
         return True
 
     def split_bet(self, current_bet: int) -> bool:
@@ -74,10 +89,12 @@ class NormalMode(BaseGameMode):
             return False
 
         self.player_money -= current_bet
+        self._changed("money")
         return True
 
     def finish_round(self, winnings: int, total_bet: int):
         self.player_money += winnings
+        self._changed("money")
 
     def get_money_display(self) -> str:
         return f"Money: ${self.player_money}"
@@ -85,6 +102,9 @@ class NormalMode(BaseGameMode):
     def get_available_money(self) -> int:
         return self.player_money
 
+    def get_balance(self) -> int:
+        return self.player_money
+
     @property
     def is_game_over(self) -> bool:
         return self.player_money <= 0
@@ -94,12 +114,14 @@ class NormalMode(BaseGameMode):
 
     def reset_money(self):
         self.player_money = self.starting_money
+        self._changed("money")
 
 
 class PracticeMode(BaseGameMode):
     mode_type = Modes.PRACTICE
 
     def __init__(self):
+        super().__init__()
         self.practice_pot = 0
 
     def place_bet(self, amount: int) -> bool:
@@ -113,6 +135,7 @@ class PracticeMode(BaseGameMode):
 
     def finish_round(self, winnings: int, total_bet: int):
         self.practice_pot += winnings - total_bet
+        self._changed("money")
 
     def get_money_display(self) -> str:
         return f"Practice Pot: {self.practice_pot:+}$"
@@ -120,6 +143,9 @@ class PracticeMode(BaseGameMode):
     def get_available_money(self) -> int:
         return float("inf")
 
+    def get_balance(self) -> int:
+        return self.practice_pot
+
     @property
     def is_game_over(self) -> bool:
         return False
@@ -129,3 +155,4 @@ class PracticeMode(BaseGameMode):
 
     def reset_money(self):
         self.practice_pot = 0
+        self._changed("money")
@@ -1,16 +1,29 @@
 from typing import List
 from .deck import Card
+from .dealer import hand_value
+from .observable import Observable
 
 
-class Hand:
+class Hand(Observable):
+    """
+    A hand of cards. The hard total and ace count are kept up to date as
+    cards come and go, so totals and softness are O(1).
+    """
+
     def __init__(self, hidden_card_default: bool = False):
+        super().__init__()
         self.cards: List[Card] = []
         self.has_hidden_card = hidden_card_default
         self.hidden_card_default = hidden_card_default
+        self.is_split = False
+        self.is_doubled = False
+
+        self.hard_total = 0
+        self.aces = 0
 
     @property
     def is_bust(self) -> bool:
-        return self.get_value() > 21
+        return self.hard_total > 21
 
     @property
     def can_split(self) -> bool:
@@ -20,15 +33,34 @@ class Hand:
     def is_blackjack(self) -> bool:
         return len(self.cards) == 2 and self.get_value() == 21
 
+    @property
+    def is_soft(self) -> bool:
+        """Check if an ace is currently counted as 11."""
+        return hand_value(self.hard_total, self.aces > 0)[1]
+
     @property
     def can_double_down(self) -> bool:
         return len(self.cards) == 2
 
     def add_card(self, card: Card) -> None:
         self.cards.append(card)
+        self.hard_total += card.points
+        self.aces += card.points == 1
+        self._changed("card_added")
+
+    def pop_card(self) -> Card:
+        card = self.cards.pop()
+        self.hard_total -= card.points
+        self.aces -= card.points == 1
+        self._changed("card_removed")
+        return card
+
+    def reveal(self) -> None:
+        self.has_hidden_card = False
+        self._changed("revealed")
 
     def get_value(self) -> int:
-        return self.__count_cards(self.cards)
+        return hand_value(self.hard_total, self.aces > 0)[0]
 
     def get_showing_value(self) -> int:
         if not self.has_hidden_card:
@@ -46,24 +78,15 @@ class Hand:
         return self.cards[:-1]
 
     def __count_cards(self, cards) -> int:
-        total = 0
-        aces = 0
-
-        for card in cards:
-            value = card.value()
-            if isinstance(value, list):
-                aces += 1
-                total += 11
-            else:
-                total += value
-
-        # Adjust for aces
-        while total > 21 and aces:
-            total -= 10
-            aces -= 1
-
-        return total
+        hard_total = sum(card.points for card in cards)
+        has_ace = any(card.points == 1 for card in cards)
+        return hand_value(hard_total, has_ace)[0]
 
     def reset(self):
         self.cards = []
         self.has_hidden_card = self.hidden_card_default
+        self.is_split = False
+        self.is_doubled = False
+        self.hard_total = 0
+        self.aces = 0
+        self._changed("reset")
@@ -0,0 +1,294 @@
+"""
+Streaming histograms in constant memory.
+
+Histogram has fixed-width bins over a range, with the values outside it
+counted as underflow and overflow. LogHistogram buckets magnitudes
+logarithmically on each side of zero, so a few dozen buckets cover results
+from a dollar to millions with the same relative precision. Both merge
+exactly with another of the same layout, so histograms filled in separate
+worker processes add up to the one a single process would have built.
+"""
+
+import math
+from typing import Iterator
+
+# (low, high, count) of a bucket, low inclusive
+Bucket = tuple[float, float, int]
+
+csv_header = "histogram,low,high,count"
+
+
+class _BaseHistogram:
+    def __init__(self):
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        raise NotImplementedError
+
+    def merge(self, other: "_BaseHistogram") -> None:
+        """Add other's counts. Raises ValueError if the layouts differ."""
+        if type(other) is not type(self) or other.layout != self.layout:
+            raise ValueError("Only histograms with the same layout merge")
+
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._merge(other)
+
+    @property
+    def layout(self) -> tuple:
+        raise NotImplementedError
+
+    def buckets(self) -> Iterator[Bucket]:
+        """Every bucket holding values, lowest first."""
+        raise NotImplementedError
+
+    def _merge(self, other) -> None:
+        raise NotImplementedError
+
+    def quantile(self, fraction: float) -> float:
+        """
+        The value below which fraction of the values fall, interpolated
+        within its bucket and kept within the smallest and largest seen.
+        """
+        if not self.count:
+            return 0.0
+
+        target = fraction * self.count
+        seen = 0
+        for low, high, count in self.buckets():
+            if seen + count >= target:
+                low, high = max(low, self.min), min(high, self.max)
+                return low + (high - low) * (target - seen) / count
+            seen += count
+
+        return self.max
+
+    def csv_rows(self, name: str) -> list[str]:
+        """Lines of name,low,high,count for every bucket holding values."""
+        return [
+            f"{name},{low:g},{high:g},{count}" for low, high, count in self.buckets()
+        ]
+
+
+class Histogram(_BaseHistogram):
+    """
+    Fixed-width bins from low to high.
+
+    args:
+        low: Start of the first bin.
+        high: End of the last bin.
+        bins: Number of bins.
+    """
+
+    def __init__(self, low: float, high: float, bins: int):
+        super().__init__()
+        if high <= low or bins <= 0:
+            raise ValueError("A histogram needs low < high and at least one bin")
+
+        self.low = low
+        self.high = high
+        self.bins = bins
+        self.width = (high - low) / bins
+        self.counts = [0] * bins
+        self.underflow = 0
+        self.overflow = 0
+
+    @property
+    def layout(self) -> tuple:
+        return (self.low, self.high, self.bins)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value < self.low:
+            self.underflow += 1
+        elif value >= self.high:
+            self.overflow += 1
+        else:
+            self.counts[int((value - self.low) / self.width)] += 1
+
+    def _merge(self, other: "Histogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+    def buckets(self) -> Iterator[Bucket]:
+        if self.underflow:
+            yield -math.inf, self.low, self.underflow
+
+        for i, count in enumerate(self.counts):
+            if count:
+                low = self.low + i * self.width
+                yield low, low + self.width, count
+
+        if self.overflow:
+            yield self.high, math.inf, self.overflow
+
+
+class LogHistogram(_BaseHistogram):
+    """
+    Logarithmic buckets for values of either sign.
+
+    Magnitudes from smallest to largest are split into `per_doubling`
+    buckets per power of two, each a constant factor wider than the last.
+    Magnitudes below smallest share one bucket around zero, and those above
+    largest go in the outermost bucket.
+
+    args:
+        smallest: Smallest magnitude told apart from zero.
+        largest: Largest magnitude given its own bucket.
+        per_doubling: Buckets per power of two, the relative precision.
+    """
+
+    def __init__(
+        self, smallest: float = 1.0, largest: float = 1e9, per_doubling: int = 2
+    ):
+        super().__init__()
+        if not 0 < smallest < largest or per_doubling <= 0:
+            raise ValueError("A log histogram needs 0 < smallest < largest")
+
+        self.smallest = smallest
+        self.largest = largest
+        self.per_doubling = per_doubling
+        self.size = math.ceil(math.log2(largest / smallest) * per_doubling) + 1
+        self.negative = [0] * self.size
+        self.positive = [0] * self.size
+        self.zero = 0
+
+    @property
+    def layout(self) -> tuple:
+        return (self.smallest, self.largest, self.per_doubling)
+
+    def bucket_bounds(self, index: int) -> tuple[float, float]:
+        """Magnitudes covered by bucket index, on either side."""
+        low = self.smallest * 2 ** (index / self.per_doubling)
+        if index == self.size - 1:
+            return low, math.inf
+
+        return low, self.smallest * 2 ** ((index + 1) / self.per_doubling)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        magnitude = abs(value)
+        if magnitude < self.smallest:
+            self.zero += 1
+            return
+
+        index = int(math.log2(magnitude / self.smallest) * self.per_doubling)
+        side = self.positive if value > 0 else self.negative
+        side[min(index, self.size - 1)] += 1
+
+    def _merge(self, other: "LogHistogram") -> None:
+        self.negative = [a + b for a, b in zip(self.negative, other.negative)]
+        self.positive = [a + b for a, b in zip(self.positive, other.positive)]
+        self.zero += other.zero
+
+    def buckets(self) -> Iterator[Bucket]:
+        for index in range(self.size - 1, -1, -1):
+            if self.negative[index]:
+                low, high = self.bucket_bounds(index)
+                yield -high, -low, self.negative[index]
+
+        if self.zero:
+            yield -self.smallest, self.smallest, self.zero
+
+        for index, count in enumerate(self.positive):
+            if count:
+                low, high = self.bucket_bounds(index)
+                yield low, high, count
+
+
+def _number(value: float) -> str:
+    return f"{value:.0f}" if abs(value) >= 100 else f"{value:.3g}"
+
+
+def _bucket_label(low: float, high: float) -> str:
+    if high - low == 1 and float(low).is_integer():
+        return f"{low:g}"
+    if math.isinf(low):
+        return f"< {_number(high)}"
+    if math.isinf(high):
+        return f">= {_number(low)}"
+
+    return f"{_number(low)} to {_number(high)}"
+
+
+def chart_lines(
+    histogram: _BaseHistogram, width: int = 40, rows: int = 20
+) -> list[str]:
+    """
+    An ASCII bar chart of histogram, a bucket per line. Neighbouring buckets
+    are combined when there are more than rows of them.
+    """
+    buckets = list(histogram.buckets())
+    if not buckets:
+        return ["(no data)"]
+
+    group = math.ceil(len(buckets) / rows)
+    grouped = [
+        (part[0][0], part[-1][1], sum(count for _, _, count in part))
+        for part in (buckets[i : i + group] for i in range(0, len(buckets), group))
+    ]
+
+    labels = [_bucket_label(low, high) for low, high, _ in grouped]
+    label_width = max(len(label) for label in labels)
+    largest = max(count for _, _, count in grouped)
+
+    lines = []
+    for label, (_, _, count) in zip(labels, grouped):
+        bar = "#" * max(round(count / largest * width), 1)
+        lines.append(
+            f"{label:>{label_width}} |{bar:<{width}} {count / histogram.count:6.1%}"
+        )
+
+    return lines
+
+
+class OutcomeHistograms:
+    """
+    The distributions behind a session's mean and variance: net result per
+    round, the bankroll after each round and the dealer's final totals.
+
+    args:
+        per_doubling: Precision of the net and bankroll buckets.
+    """
+
+    names = ("net", "bankroll", "dealer_total")
+
+    def __init__(self, per_doubling: int = 2):
+        self.net = LogHistogram(per_doubling=per_doubling)
+        self.bankroll = LogHistogram(per_doubling=per_doubling)
+        # Dealer hands run from 4 (two deuces) to a bust of 26
+        self.dealer_total = Histogram(4, 27, 23)
+
+    def record_round(self, net: float, bankroll: float, dealer_total: int) -> None:
+        self.net.add(net)
+        self.bankroll.add(bankroll)
+        self.dealer_total.add(dealer_total)
+
+    def merge(self, other: "OutcomeHistograms") -> None:
+        for name in self.names:
+            getattr(self, name).merge(getattr(other, name))
+
+    def csv_rows(self, prefix: str = "") -> list[str]:
+        """Every histogram's rows under csv_header, names prefixed with prefix."""
+        rows = []
+        for name in self.names:
+            rows.extend(getattr(self, name).csv_rows(prefix + name))
+
+        return rows
+
+    def to_csv(self) -> str:
+        return "\n".join([csv_header, *self.csv_rows()]) + "\n"
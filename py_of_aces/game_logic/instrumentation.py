@@ -0,0 +1,102 @@
+import json
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter
+
+# Phase name -> BlackjackGame method it times
+game_phases: dict[str, str] = {
+    "deal_initial_cards": "deal_initial_cards",
+    "hit": "hit",
+    "split": "split",
+    "dealer_play": "_BlackjackGame__dealer_play",
+    "determine_winners": "_BlackjackGame__determine_winners",
+    "get_winnings": "get_winnings",
+}
+
+# Phase name -> BlackjackDeck method it times
+deck_phases: dict[str, str] = {
+    "reshuffle": "reset_deck",
+}
+
+
+class Instrumentation:
+    """
+    Per-phase call counts and inclusive timings for BlackjackGame.
+
+    Nothing is measured until attach() wraps the methods of a game instance,
+    so uninstrumented games run the plain class methods at no extra cost.
+    Several games can share one Instrumentation to aggregate a whole table
+    pool.
+    """
+
+    def __init__(self):
+        self.calls: dict[str, int] = defaultdict(int)
+        self.seconds: dict[str, float] = defaultdict(float)
+
+    def attach(self, game) -> None:
+        """Start timing the phases of game and of its deck."""
+        for target, phases in ((game, game_phases), (game.deck, deck_phases)):
+            for phase, method_name in phases.items():
+                if method_name in target.__dict__:
+                    continue
+
+                method = getattr(target, method_name)
+                setattr(target, method_name, self.__timed(phase, method))
+
+    def detach(self, game) -> None:
+        """Stop timing game, restoring the plain class methods."""
+        for target, phases in ((game, game_phases), (game.deck, deck_phases)):
+            for method_name in phases.values():
+                target.__dict__.pop(method_name, None)
+
+    def __timed(self, phase: str, method):
+        calls = self.calls
+        seconds = self.seconds
+
+        @wraps(method)
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                seconds[phase] += perf_counter() - start
+                calls[phase] += 1
+
+        return timed
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.seconds.clear()
+
+    def snapshot(self) -> dict:
+        """Return {phase: {"calls": int, "seconds": float}}."""
+        return {
+            phase: {"calls": self.calls[phase], "seconds": self.seconds[phase]}
+            for phase in sorted(self.calls)
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix: str = "py_of_aces") -> str:
+        """Render the snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_phase_calls_total Calls per game phase.",
+            f"# TYPE {prefix}_phase_calls_total counter",
+        ]
+        for phase, values in snapshot.items():
+            lines.append(
+                f'{prefix}_phase_calls_total{{phase="{phase}"}} {values["calls"]}'
+            )
+
+        lines.append(
+            f"# HELP {prefix}_phase_seconds_total Inclusive time spent per game phase."
+        )
+        lines.append(f"# TYPE {prefix}_phase_seconds_total counter")
+        for phase, values in snapshot.items():
+            lines.append(
+                f'{prefix}_phase_seconds_total{{phase="{phase}"}} {values["seconds"]:.9f}'
+            )
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,37 @@
+from typing import Callable
+
+
+class Observable:
+    """
+    Mixin that gives an object a revision counter and change subscribers.
+
+    Every state change bumps `revision` and calls each subscriber with
+    `(sender, event)`. Consumers can compare revisions to skip recomputing
+    anything derived from the object.
+    """
+
+    def __init__(self):
+        self.revision: int = 0
+        self._subscribers: list[Callable] = []
+
+    def subscribe(self, callback: Callable) -> Callable[[], None]:
+        """
+        args:
+            callback: Called as callback(sender, event) on every change.
+
+        Returns:
+            A function that removes the subscription.
+        """
+        self._subscribers.append(callback)
+
+        def unsubscribe():
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def _changed(self, event: str) -> None:
+        """Bump the revision and notify subscribers."""
+        self.revision += 1
+        for callback in tuple(self._subscribers):
+            callback(self, event)
@@ -0,0 +1,205 @@
+"""
+The last rounds of a session, kept compactly in a fixed-size ring buffer.
+
+Each round is packed into a few dozen bytes: cards as card indices (one
+byte each), results, actions and the mode as small enum indices, and bets
+and payouts as 64-bit ints. Once the buffer is full every new round
+overwrites the oldest, so a session of any length holds at most `capacity`
+entries. Entries are unpacked into RoundRecords only when read.
+"""
+
+import struct
+from typing import Iterator
+from .blackjack_game import Action, GameResult
+from .deck import card_table
+from .game_modes import Modes
+from .observable import Observable
+from .round_record import RoundRecord
+
+# mode, dealer total, dealer cards, hands, actions, initial bet, payout,
+# side bets, played at
+_round_header = struct.Struct("<BBBBBQQQd")
+# cards, total, result, bet, payout
+_hand_header = struct.Struct("<BBBQQ")
+
+_modes = list(Modes)
+_mode_codes = {mode.name: code for code, mode in enumerate(_modes)}
+# Code 0 is a hand without a result
+_results = [""] + [result.name for result in GameResult]
+_result_codes = {name: code for code, name in enumerate(_results)}
+_actions = list(Action)
+_action_codes = {action.value: code for code, action in enumerate(_actions)}
+_card_codes = {card.code: index for index, card in enumerate(card_table)}
+
+
+def encode_round(record: RoundRecord) -> bytes:
+    """Pack a round into bytes, see decode_round."""
+    parts = [
+        _round_header.pack(
+            _mode_codes[record.mode],
+            record.dealer_total,
+            len(record.dealer_cards),
+            len(record.player_hands),
+            len(record.actions),
+            record.initial_bet,
+            record.payout,
+            record.side_bets,
+            record.played_at,
+        ),
+        bytes(_card_codes[code] for code in record.dealer_cards),
+    ]
+
+    for i, cards in enumerate(record.player_hands):
+        parts.append(
+            _hand_header.pack(
+                len(cards),
+                record.hand_totals[i],
+                _result_codes[record.results[i]],
+                record.bets[i],
+                record.hand_payouts[i],
+            )
+        )
+        parts.append(bytes(_card_codes[code] for code in cards))
+
+    # Hand index in the high five bits (see Rules.max_splits), action in
+    # the low three
+    parts.append(
+        bytes(index << 3 | _action_codes[action] for index, action in record.actions)
+    )
+    return b"".join(parts)
+
+
+def decode_round(data: bytes) -> RoundRecord:
+    """Unpack a round packed by encode_round."""
+    (
+        mode,
+        dealer_total,
+        dealer_count,
+        hand_count,
+        action_count,
+        initial_bet,
+        payout,
+        side_bets,
+        played_at,
+    ) = _round_header.unpack_from(data)
+    offset = _round_header.size
+
+    dealer_cards = [
+        card_table[index].code for index in data[offset : offset + dealer_count]
+    ]
+    offset += dealer_count
+
+    player_hands, hand_totals, bets, results, hand_payouts = [], [], [], [], []
+    for _ in range(hand_count):
+        count, total, result, bet, hand_payout = _hand_header.unpack_from(data, offset)
+        offset += _hand_header.size
+        player_hands.append(
+            [card_table[index].code for index in data[offset : offset + count]]
+        )
+        offset += count
+
+        hand_totals.append(total)
+        results.append(_results[result])
+        bets.append(bet)
+        hand_payouts.append(hand_payout)
+
+    actions = [
+        (code >> 3, _actions[code & 7].value)
+        for code in data[offset : offset + action_count]
+    ]
+
+    return RoundRecord(
+        mode=_modes[mode].name,
+        dealer_cards=dealer_cards,
+        dealer_total=dealer_total,
+        player_hands=player_hands,
+        hand_totals=hand_totals,
+        bets=bets,
+        results=results,
+        hand_payouts=hand_payouts,
+        actions=actions,
+        initial_bet=initial_bet,
+        payout=payout,
+        side_bets=side_bets,
+        played_at=played_at,
+    )
+
+
+class RoundHistory(Observable):
+    """
+    The last `capacity` rounds played, oldest first.
+
+    Indexing works like a list, with -1 the latest round, and decodes the
+    entry on the spot. `recorded` counts every round ever appended, so round
+    numbers stay stable as old ones are overwritten.
+
+    args:
+        capacity: Most rounds kept.
+    """
+
+    def __init__(self, capacity: int = 500):
+        super().__init__()
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self.recorded = 0
+        self.__entries: list[bytes | None] = [None] * capacity
+
+    def append(self, record: RoundRecord) -> None:
+        self.__entries[self.recorded % self.capacity] = encode_round(record)
+        self.recorded += 1
+        self._changed("round")
+
+    def attach(self, game):
+        """
+        Keep every round game finishes.
+
+        Returns:
+            A function that stops recording.
+        """
+
+        def on_change(sender, event: str):
+            if event == "round_finished":
+                self.append(sender.round_record())
+
+        return game.subscribe(on_change)
+
+    def clear(self) -> None:
+        self.__entries = [None] * self.capacity
+        self.recorded = 0
+        self._changed("clear")
+
+    def round_number(self, index: int) -> int:
+        """The 1-based session round number of the entry at index."""
+        return self.recorded - len(self) + self.__position(index) + 1
+
+    def encoded(self, index: int) -> bytes:
+        """The packed entry at index, without decoding it."""
+        return self.__entries[
+            (self.recorded - len(self) + self.__position(index)) % self.capacity
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the packed entries."""
+        return sum(len(data) for data in self.__entries if data is not None)
+
+    def __position(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("round history index out of range")
+
+        return index
+
+    def __getitem__(self, index: int) -> RoundRecord:
+        return decode_round(self.encoded(index))
+
+    def __len__(self) -> int:
+        return min(self.recorded, self.capacity)
+
+    def __iter__(self) -> Iterator[RoundRecord]:
+        for index in range(len(self)):
+            yield self[index]
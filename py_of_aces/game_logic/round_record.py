@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from time import time
+
+
+@dataclass(slots=True)
+class RoundRecord:
+    """
+    Snapshot of a settled round, independent of the live game objects.
+
+    Cards are two character codes ("As", "Td"), results are GameResult names
+    and actions are (hand index, Action value) pairs in the order played.
+    The payout includes side bets, side_bets being their total stake.
+    """
+
+    mode: str
+    dealer_cards: list[str]
+    dealer_total: int
+    player_hands: list[list[str]]
+    hand_totals: list[int]
+    bets: list[int]
+    results: list[str]
+    hand_payouts: list[int]
+    actions: list[tuple[int, str]]
+    initial_bet: int
+    payout: int
+    side_bets: int = 0
+    played_at: float = field(default_factory=time)
+
+    @property
+    def net(self) -> int:
+        return self.payout - sum(self.bets) - self.side_bets
+
+    @property
+    def dealer_upcard(self) -> str | None:
+        return self.dealer_cards[0] if self.dealer_cards else None
@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Rules:
+    """
+    Immutable, hashable table rules.
+
+    Rule sets can be compared and used as cache keys, so several of them can
+    run side by side in one process.
+
+    args:
+        num_decks: Number of 52 card decks in the shoe.
+        penetration: Fraction of the shoe dealt before reshuffling.
+        dealer_hits_soft_17: H17 when True, S17 when False.
+        dealer_stand_value: Hard total the dealer stands on.
+        blackjack_payout: Profit per unit bet for a natural (1.5 is 3:2).
+        double_after_split: Whether split hands can double down.
+        resplit_aces: Whether a hand of split aces can be split again.
+        surrender: Whether late surrender is offered.
+        max_splits: Maximum number of splits per round, at most 31.
+        continuous_shuffle: Whether a continuous shuffling machine returns the
+        cards to the shoe after every round instead of reshuffling.
+    """
+
+    num_decks: int = 1
+    # Reshuffles a single deck with 15 cards left
+    penetration: float = 37 / 52
+    dealer_hits_soft_17: bool = False
+    dealer_stand_value: int = 17
+    blackjack_payout: float = 1.5
+    double_after_split: bool = True
+    resplit_aces: bool = True
+    surrender: bool = False
+    max_splits: int = 3
+    continuous_shuffle: bool = False
+
+    def __post_init__(self):
+        if self.num_decks < 1:
+            raise ValueError("A shoe needs at least one deck")
+
+        if not 0 < self.penetration <= 1:
+            raise ValueError("Penetration must be in (0, 1]")
+
+        # Packed round history keeps the hand index in five bits
+        if not 0 <= self.max_splits <= 31:
+            raise ValueError("max_splits must be between 0 and 31")
+
+    @property
+    def shoe_size(self) -> int:
+        return self.num_decks * 52
+
+    @property
+    def reshuffle_at(self) -> int:
+        """Remaining card count below which the shoe is reshuffled."""
+        return round(self.shoe_size * (1 - self.penetration))
@@ -0,0 +1,53 @@
+import math
+
+
+class RunningStats:
+    """
+    Streaming mean and variance (Welford), in O(1) memory.
+
+    Two instances merge exactly (Chan et al.), so batches accumulated in
+    separate workers combine into one.
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats") -> None:
+        if not other.count:
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    @property
+    def variance(self) -> float:
+        """Sample variance."""
+        if self.count < 2:
+            return 0.0
+
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def std_error(self) -> float:
+        """Standard error of the mean."""
+        if not self.count:
+            return 0.0
+
+        return self.std_dev / math.sqrt(self.count)
@@ -0,0 +1,140 @@
+import json
+from collections import Counter
+from .running_stats import RunningStats
+
+
+class SessionStats:
+    """
+    Streaming statistics for a session, in O(1) memory.
+
+    The per-round net result (winnings minus everything wagered) feeds a
+    RunningStats for its mean and variance. Alongside it the stats count results per hand,
+    doubles and splits, and track the maximum drawdown and the longest
+    winning and losing streaks.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.rounds = 0
+        self.hands = 0
+        self.won_rounds = 0
+        self.lost_rounds = 0
+        self.net = RunningStats()
+
+        self.total_net = 0.0
+        self.total_initial_bet = 0
+        self.result_counts: Counter = Counter()
+        self.doubles = 0
+        self.splits = 0
+
+        self.peak = 0.0
+        self.max_drawdown = 0.0
+
+        self.win_streak = 0
+        self.loss_streak = 0
+        self.longest_win_streak = 0
+        self.longest_loss_streak = 0
+
+    def record_round(
+        self, net: float, initial_bet: int, results: list, doubles: int, splits: int
+    ) -> None:
+        """
+        args:
+            net: Money won (positive) or lost (negative) over the round.
+            initial_bet: The bet placed before the deal.
+            results: The GameResult of every hand played.
+            doubles: Hands doubled down this round.
+            splits: Splits made this round.
+        """
+        self.rounds += 1
+        self.net.add(net)
+
+        self.total_net += net
+        self.total_initial_bet += initial_bet
+        self.hands += len(results)
+        self.result_counts.update(results)
+        self.doubles += doubles
+        self.splits += splits
+
+        self.peak = max(self.peak, self.total_net)
+        self.max_drawdown = max(self.max_drawdown, self.peak - self.total_net)
+
+        if net > 0:
+            self.won_rounds += 1
+            self.win_streak += 1
+            self.loss_streak = 0
+        elif net < 0:
+            self.lost_rounds += 1
+            self.loss_streak += 1
+            self.win_streak = 0
+        else:
+            self.win_streak = self.loss_streak = 0
+
+        self.longest_win_streak = max(self.longest_win_streak, self.win_streak)
+        self.longest_loss_streak = max(self.longest_loss_streak, self.loss_streak)
+
+    @property
+    def mean(self) -> float:
+        """Mean net result per round."""
+        return self.net.mean
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the net result per round."""
+        return self.net.variance
+
+    @property
+    def std_dev(self) -> float:
+        return self.net.std_dev
+
+    @property
+    def std_error(self) -> float:
+        """Standard error of the mean net result per round."""
+        return self.net.std_error
+
+    @property
+    def ev_per_unit(self) -> float:
+        """Net result per unit of initial bet (the player's edge)."""
+        if not self.total_initial_bet:
+            return 0.0
+
+        return self.total_net / self.total_initial_bet
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of rounds that ended with a net gain."""
+        if not self.rounds:
+            return 0.0
+
+        return self.won_rounds / self.rounds
+
+    def as_dict(self) -> dict:
+        """Machine-readable dump of every statistic."""
+        return {
+            "rounds": self.rounds,
+            "hands": self.hands,
+            "won_rounds": self.won_rounds,
+            "lost_rounds": self.lost_rounds,
+            "win_rate": self.win_rate,
+            "ev_per_round": self.mean,
+            "ev_per_unit": self.ev_per_unit,
+            "variance": self.variance,
+            "std_dev": self.std_dev,
+            "std_error": self.std_error,
+            "total_net": self.total_net,
+            "total_initial_bet": self.total_initial_bet,
+            "results": {
+                getattr(result, "name", str(result)): count
+                for result, count in self.result_counts.items()
+            },
+            "doubles": self.doubles,
+            "splits": self.splits,
+            "max_drawdown": self.max_drawdown,
+            "longest_win_streak": self.longest_win_streak,
+            "longest_loss_streak": self.longest_loss_streak,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.as_dict())
@@ -0,0 +1,270 @@
+"""
+Side bets scored from the round's first cards.
+
+Perfect Pairs looks at the player's first two cards and 21+3 at those plus
+the dealer's upcard. Both are scored through tables indexed by card index
+(suit * 13 + rank, see Card.index), built once per process, so settling a
+round is a single lookup. Dealer Bust pays when the dealer busts, by the
+number of cards they took.
+
+Payouts are "to one": a win returns the stake plus the bet times the
+payout, a loss returns nothing.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from .dealer import dealer_should_hit, hand_value
+from .deck import BlackjackDeck, Card
+from .rules import Rules
+
+
+class SideBet(Enum):
+    PERFECT_PAIRS = "perfect_pairs"
+    TWENTY_ONE_PLUS_THREE = "21+3"
+    DEALER_BUST = "dealer_bust"
+
+
+perfect_pairs_pays: dict[str, int] = {"perfect": 25, "colored": 12, "mixed": 6}
+
+twenty_one_plus_three_pays: dict[str, int] = {
+    "suited_trips": 100,
+    "straight_flush": 40,
+    "trips": 30,
+    "straight": 10,
+    "flush": 5,
+}
+
+# Payout by the number of cards in the dealer's busted hand, 8 or more
+# paying the last entry
+dealer_bust_pays: tuple[int, ...] = (0, 0, 0, 1, 2, 9, 50, 100, 250)
+
+# More cards than any dealer hand can hold
+_max_dealer_cards = 24
+
+card_slots = len(BlackjackDeck.suits) * len(BlackjackDeck.ranks)
+
+
+def _suit(index: int) -> int:
+    return index // 13
+
+
+def _rank(index: int) -> int:
+    return index % 13
+
+
+def _is_red(index: int) -> bool:
+    return BlackjackDeck.suits[_suit(index)] in ("h", "d")
+
+
+@lru_cache
+def perfect_pairs_table() -> bytes:
+    """Payout of every ordered pair of card indices, at first * 52 + second."""
+    pays = perfect_pairs_pays
+    table = bytearray(card_slots * card_slots)
+    for first in range(card_slots):
+        for second in range(card_slots):
+            if _rank(first) != _rank(second):
+                continue
+
+            if _suit(first) == _suit(second):
+                pay = pays["perfect"]
+            elif _is_red(first) == _is_red(second):
+                pay = pays["colored"]
+            else:
+                pay = pays["mixed"]
+            table[first * card_slots + second] = pay
+
+    return bytes(table)
+
+
+def _three_card_pay(first: int, second: int, third: int) -> int:
+    pays = twenty_one_plus_three_pays
+    ranks = sorted({_rank(first), _rank(second), _rank(third)})
+    suited = _suit(first) == _suit(second) == _suit(third)
+
+    if len(ranks) == 1:
+        return pays["suited_trips"] if suited else pays["trips"]
+
+    # Aces play high or low: A23 and QKA are both straights
+    straight = len(ranks) == 3 and (ranks[2] - ranks[0] == 2 or ranks == [0, 11, 12])
+    if straight and suited:
+        return pays["straight_flush"]
+    if straight:
+        return pays["straight"]
+    if suited:
+        return pays["flush"]
+    return 0
+
+
+@lru_cache
+def twenty_one_plus_three_table() -> bytes:
+    """
+    Payout of every ordered card index triple (player, player, upcard), at
+    (first * 52 + second) * 52 + upcard.
+    """
+    table = bytearray(card_slots**3)
+    for first in range(card_slots):
+        for second in range(card_slots):
+            offset = (first * card_slots + second) * card_slots
+            for third in range(card_slots):
+                table[offset + third] = _three_card_pay(first, second, third)
+
+    return bytes(table)
+
+
+def perfect_pairs(first: int, second: int) -> int:
+    """Payout of the player's first two card indices."""
+    return perfect_pairs_table()[first * card_slots + second]
+
+
+def twenty_one_plus_three(first: int, second: int, upcard: int) -> int:
+    """Payout of the player's first two card indices and the upcard's."""
+    return twenty_one_plus_three_table()[
+        (first * card_slots + second) * card_slots + upcard
+    ]
+
+
+def dealer_bust(dealer_cards: int, busted: bool) -> int:
+    """Payout of a dealer hand of dealer_cards cards."""
+    if not busted:
+        return 0
+
+    return dealer_bust_pays[min(dealer_cards, len(dealer_bust_pays) - 1)]
+
+
+def side_bet_payout(
+    kind: SideBet,
+    bet: int,
+    first_cards: tuple[int, int, int],
+    dealer_cards: int,
+    dealer_busted: bool,
+) -> int:
+    """
+    Amount returned for a side bet, stake included.
+
+    args:
+        kind: The side bet.
+        bet: Its stake.
+        first_cards: Card indices of the player's first two cards and the
+        dealer's upcard.
+        dealer_cards: Number of cards in the dealer's final hand.
+        dealer_busted: Whether the dealer busted.
+    """
+    match kind:
+        case SideBet.PERFECT_PAIRS:
+            pay = perfect_pairs(first_cards[0], first_cards[1])
+        case SideBet.TWENTY_ONE_PLUS_THREE:
+            pay = twenty_one_plus_three(*first_cards)
+        case SideBet.DEALER_BUST:
+            pay = dealer_bust(dealer_cards, dealer_busted)
+
+    return bet * (1 + pay) if pay else 0
+
+
+def card_counts(cards: list[Card]) -> tuple[int, ...]:
+    """Cards per card index, the composition the exact edges are taken on."""
+    counts = [0] * card_slots
+    for card in cards:
+        counts[card.index] += 1
+
+    return tuple(counts)
+
+
+def full_card_counts(num_decks: int) -> tuple[int, ...]:
+    """Count of every card index in a full shoe of num_decks decks."""
+    return (num_decks,) * card_slots
+
+
+def house_edge(kind: SideBet, counts: tuple[int, ...], rules: Rules = None) -> float:
+    """
+    Exact house edge of a side bet dealt from a shoe of counts (per card
+    index), as a fraction of the bet.
+
+    Dealer Bust treats the dealer's cards as the first out of the shoe,
+    which ignores how the player's draws change it.
+    """
+    remaining = sum(counts)
+    ev = 0.0
+
+    match kind:
+        case SideBet.PERFECT_PAIRS:
+            table = perfect_pairs_table()
+            pairs = remaining * (remaining - 1)
+            for first, first_count in enumerate(counts):
+                for second, second_count in enumerate(counts):
+                    second_count -= first == second
+                    pay = table[first * card_slots + second]
+                    if pay and first_count and second_count > 0:
+                        ev += first_count * second_count / pairs * (pay + 1)
+            ev -= 1
+
+        case SideBet.TWENTY_ONE_PLUS_THREE:
+            table = twenty_one_plus_three_table()
+            triples = remaining * (remaining - 1) * (remaining - 2)
+            for first, first_count in enumerate(counts):
+                if not first_count:
+                    continue
+                for second, second_count in enumerate(counts):
+                    second_count -= first == second
+                    if second_count <= 0:
+                        continue
+                    offset = (first * card_slots + second) * card_slots
+                    for third, third_count in enumerate(counts):
+                        third_count -= (first == third) + (second == third)
+                        pay = table[offset + third]
+                        if pay and third_count > 0:
+                            chance = first_count * second_count * third_count
+                            ev += chance / triples * (pay + 1)
+            ev -= 1
+
+        case SideBet.DEALER_BUST:
+            points = [0] * 10
+            for index, count in enumerate(counts):
+                points[min(_rank(index), 9)] += count
+
+            busts = _dealer_bust_cards(tuple(points), 0, False, 0, rules or Rules())
+            ev = -1.0
+            for cards, chance in enumerate(busts):
+                ev += chance * (dealer_bust(cards, True) + 1)
+
+    return -ev
+
+
+@lru_cache(maxsize=65_536)
+def _dealer_bust_cards(
+    counts: tuple[int, ...], hard_total: int, has_ace: bool, cards: int, rules: Rules
+) -> tuple[float, ...]:
+    """
+    Chance the dealer busts holding each number of cards, dealing the two
+    first cards and playing out from counts (per point value).
+    """
+    busts = [0.0] * _max_dealer_cards
+    if hard_total > 21:
+        busts[cards] = 1.0
+        return tuple(busts)
+
+    total, soft = hand_value(hard_total, has_ace)
+    if cards == 2 and total == 21:
+        return tuple(busts)
+    if cards >= 2 and not dealer_should_hit(total, soft, rules):
+        return tuple(busts)
+
+    remaining = sum(counts)
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+
+        rest = counts[:index] + (count - 1,) + counts[index + 1 :]
+        outcome = _dealer_bust_cards(
+            rest, hard_total + index + 1, has_ace or index == 0, cards + 1, rules
+        )
+        for slot, chance in enumerate(outcome):
+            busts[slot] += count / remaining * chance
+
+    return tuple(busts)
+
+
+def shoe_house_edges(rules: Rules) -> dict[SideBet, float]:
+    """House edge of every side bet off the top of a full shoe."""
+    counts = full_card_counts(rules.num_decks)
+    return {kind: house_edge(kind, counts, rules) for kind in SideBet}
@@ -0,0 +1,227 @@
+"""
+Basic strategy for multi-deck, dealer stands on soft 17, double after split
+and late surrender tables.
+
+Each chart row is indexed by the player's total (or the points of a pair)
+and has one code per dealer upcard, 2 through 10 then ace:
+
+    H hit, S stand, P split,
+    D double (hit if doubling isn't allowed),
+    d double (stand if doubling isn't allowed),
+    R surrender (hit if surrender isn't allowed).
+"""
+
+import json
+from typing import Collection
+from .blackjack_game import Action
+from .dealer import hand_value
+from .hand import Hand
+from .rules import Rules
+
+#            2345678910A
+hard_chart: dict[int, str] = {
+    9: "HDDDDHHHHH",
+    10: "DDDDDDDDHH",
+    11: "DDDDDDDDDH",
+    12: "HHSSSHHHHH",
+    13: "SSSSSHHHHH",
+    14: "SSSSSHHHHH",
+    15: "SSSSSHHHRH",
+    16: "SSSSSHHRRR",
+}
+
+soft_chart: dict[int, str] = {
+    13: "HHHDDHHHHH",
+    14: "HHHDDHHHHH",
+    15: "HHDDDHHHHH",
+    16: "HHDDDHHHHH",
+    17: "HDDDDHHHHH",
+    18: "SddddSSHHH",
+}
+
+# Keyed by the points of one card of the pair, tens are never split
+pair_chart: dict[int, str] = {
+    1: "PPPPPPPPPP",
+    2: "PPPPPPHHHH",
+    3: "PPPPPPHHHH",
+    4: "HHHPPHHHHH",
+    6: "PPPPPHHHHH",
+    7: "PPPPPPHHHH",
+    8: "PPPPPPPPPP",
+    9: "PPPPPSPPSS",
+}
+
+# Pairs that are only worth splitting when the split hands can double
+no_das_pair_chart: dict[int, str] = {
+    **pair_chart,
+    2: "HHPPPPHHHH",
+    3: "HHPPPPHHHH",
+    4: "HHHHHHHHHH",
+    6: "HPPPPHHHHH",
+}
+
+
+def chart_code(
+    hard_total: int, has_ace: bool, pair: int | None, upcard: int, rules: Rules
+) -> str:
+    """
+    The chart entry for a hand.
+
+    args:
+        hard_total: Hard total of the player's cards (aces count 1).
+        has_ace: Whether the hand holds an ace.
+        pair: Points of the pair when the hand can be split, else None.
+        upcard: Points of the dealer's upcard (ace = 1).
+        rules: The table rules, for double after split.
+    """
+    column = (upcard - 2) % 10
+
+    if pair is not None:
+        chart = pair_chart if rules.double_after_split else no_das_pair_chart
+        row = chart.get(pair)
+        if row and row[column] == "P":
+            return "P"
+
+    total, soft = hand_value(hard_total, has_ace)
+    row = (soft_chart if soft else hard_chart).get(total)
+    if row:
+        return row[column]
+
+    # Off the charts: soft 19+ and hard 17+ stand, anything lower hits
+    return "S" if total >= (19 if soft else 17) else "H"
+
+
+def code_action(code: str, legal: Collection[Action]) -> Action:
+    """The action a chart code stands for, given the legal actions."""
+    match code:
+        case "P" if Action.SPLIT in legal:
+            return Action.SPLIT
+        case "D" | "d" if Action.DOUBLE in legal:
+            return Action.DOUBLE
+        case "R" if Action.SURRENDER in legal:
+            return Action.SURRENDER
+        case "S" | "d":
+            return Action.STAND
+
+    return Action.HIT
+
+
+def basic_action(
+    hard_total: int,
+    has_ace: bool,
+    pair: int | None,
+    upcard: int,
+    legal: Collection[Action],
+    rules: Rules,
+) -> Action:
+    """Basic strategy action among the legal ones (see chart_code for args)."""
+    code = chart_code(hard_total, has_ace, pair, upcard, rules)
+    if code == "P" and Action.SPLIT not in legal:
+        # Can't split again: play the pair as an ordinary total
+        code = chart_code(hard_total, has_ace, None, upcard, rules)
+
+    return code_action(code, legal)
+
+
+def hand_action(
+    hand: Hand, upcard: int, legal: Collection[Action], rules: Rules
+) -> Action:
+    """Basic strategy action for a game Hand against the dealer's upcard points."""
+    pair = hand.cards[0].points if hand.can_split else None
+    return basic_action(hand.hard_total, hand.aces > 0, pair, upcard, legal, rules)
+
+
+class IndexTable:
+    """
+    Count-dependent strategy: chart codes that change with the true count,
+    as written by `python -m py_of_aces.simulation.indices`.
+
+    A cell is written as its code at the lowest counts followed by
+    "count:code" breakpoints, "H 0:S" being hit below a true count of 0 and
+    stand from 0 up. Pair cells hold "P" (split) or "-" (play the total).
+    Hands the table doesn't cover fall back to basic strategy.
+
+    args:
+        cells: (kind, total or pair points, upcard points) -> breakpoints,
+        kind being "hard", "soft" or "pair" and breakpoints a list of
+        (lowest true count, code) sorted by count, the first count None.
+    """
+
+    upcard_labels = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "T"]
+
+    def __init__(self, cells: dict[tuple[str, int, int], list[tuple]]):
+        self.cells = cells
+
+    @staticmethod
+    def parse_cell(text: str) -> list[tuple]:
+        first, *breakpoints = text.split()
+        cell: list[tuple] = [(None, first)]
+        for breakpoint in breakpoints:
+            count, code = breakpoint.split(":")
+            cell.append((float(count), code))
+        return cell
+
+    @staticmethod
+    def format_cell(cell: list[tuple]) -> str:
+        parts = [cell[0][1]] + [f"{count:g}:{code}" for count, code in cell[1:]]
+        return " ".join(parts)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IndexTable":
+        cells = {}
+        for kind in ("hard", "soft", "pair"):
+            for key, row in data.get(kind, {}).items():
+                for label, text in row.items():
+                    upcard = cls.upcard_labels.index(label) + 1
+                    cells[(kind, int(key), upcard)] = cls.parse_cell(text)
+        return cls(cells)
+
+    def to_dict(self) -> dict:
+        data: dict = {"hard": {}, "soft": {}, "pair": {}}
+        for (kind, key, upcard), cell in sorted(self.cells.items()):
+            label = self.upcard_labels[upcard - 1]
+            data[kind].setdefault(str(key), {})[label] = self.format_cell(cell)
+        return data
+
+    @classmethod
+    def load(cls, path: str) -> "IndexTable":
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
+
+    def code(self, kind: str, key: int, upcard: int, true_count: float) -> str | None:
+        """The cell's code at true_count, or None if the table has no cell."""
+        cell = self.cells.get((kind, key, upcard))
+        if cell is None:
+            return None
+
+        code = cell[0][1]
+        for count, breakpoint_code in cell[1:]:
+            if true_count < count:
+                break
+            code = breakpoint_code
+        return code
+
+    def action(
+        self,
+        hard_total: int,
+        has_ace: bool,
+        pair: int | None,
+        upcard: int,
+        true_count: float,
+        legal: Collection[Action],
+        rules: Rules,
+    ) -> Action:
+        """Action at true_count, see basic_action for the other args."""
+        if pair is not None and Action.SPLIT in legal:
+            code = self.code("pair", pair, upcard, true_count)
+            if code is None:
+                code = chart_code(hard_total, has_ace, pair, upcard, rules)
+            if code == "P":
+                return Action.SPLIT
+
+        total, soft = hand_value(hard_total, has_ace)
+        code = self.code("soft" if soft else "hard", total, upcard, true_count)
+        if code is None:
+            code = chart_code(hard_total, has_ace, None, upcard, rules)
+
+        return code_action(code, legal)
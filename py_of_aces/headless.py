@@ -0,0 +1,241 @@
+"""
+Headless engine mode: drive a BlackjackGame over stdin/stdout with
+newline-delimited JSON, without the TUI.
+
+Each input line is one command object or a JSON array of commands. The
+reply line is one reply object or an array of replies in the same order.
+All lines available in a single read are answered with a single write, so
+a client can pipeline as many commands as it likes.
+
+Commands:
+    {"op": "mode", "mode": "normal" | "practice"}
+    {"op": "side_bet", "kind": "perfect_pairs" | "21+3" | "dealer_bust",
+     "amount": 5}                  Place a side bet, before "bet"
+    {"op": "bet", "amount": 10}    Place a bet and deal
+    {"op": "hit" | "stand" | "double" | "split" | "surrender"}
+    {"op": "next"}                 Settle the round and start a new one
+    {"op": "state"}
+    {"op": "stats"}                Session statistics of the current mode
+    {"op": "quit"}
+
+Replies are {"ok": bool, "state": {...}}, plus "error" when ok is false.
+An "id" in a command is echoed back and "quiet": true drops the state. A
+stats reply holds "stats" instead of the state, quiet or not.
+
+If the shoe runs out mid-round the command fails with "shoe exhausted": the
+round is void, the bets are returned and betting opens again.
+"""
+
+import argparse
+import json
+import os
+import sys
+from .game_logic.blackjack_game import Action, BlackjackGame, GameState
+from .game_logic.deck import ShoeExhausted
+from .game_logic.game_modes import Modes
+from .game_logic.side_bets import SideBet
+
+READ_SIZE = 1 << 20
+
+mode_names = {"normal": Modes.NORMAL, "practice": Modes.PRACTICE}
+
+
+class QuitSession(Exception):
+    """Raised by the quit command to end the session."""
+
+    reply: str | None = None
+
+
+class HeadlessEngine:
+    """
+    Executes JSON commands against a BlackjackGame.
+
+    args:
+        game: The game to drive, a practice game by default.
+    """
+
+    def __init__(self, game: BlackjackGame = None):
+        self.game = game or BlackjackGame()
+        if self.game.mode == Modes.BASE:
+            self.game.select_mode(Modes.PRACTICE)
+
+        self.__encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def state(self) -> dict:
+        game = self.game
+        dealer = [card.code for card in game.dealer_hand.get_showing_cards()]
+        if game.dealer_hand.has_hidden_card and game.dealer_hand.cards:
+            dealer.append("??")
+
+        return {
+            "state": game.state.name,
+            "hand": game.current_hand_index,
+            "hands": [[card.code for card in hand.cards] for hand in game.player_hands],
+            "values": [hand.get_value() for hand in game.player_hands],
+            "dealer": dealer,
+            "bets": list(game.bets),
+            "side_bets": {kind.value: bet for kind, bet in game.side_bets.items()},
+            "results": [result and result.name for result in game.results],
+            "balance": game.current_mode.get_balance(),
+            "legal": [action.value for action in game.legal_actions],
+        }
+
+    def execute(self, command: dict) -> dict:
+        """Run one command and return its reply."""
+        if not isinstance(command, dict):
+            return {"ok": False, "error": "command must be an object"}
+
+        error = self.__run(command.get("op"), command)
+        reply = {"ok": error is None}
+        if error:
+            reply["error"] = error
+
+        if "id" in command:
+            reply["id"] = command["id"]
+
+        if command.get("op") == "stats":
+            reply["stats"] = self.game.current_mode.stats.as_dict()
+        elif not command.get("quiet"):
+            reply["state"] = self.state()
+
+        return reply
+
+    def __run(self, op: str, command: dict) -> str | None:
+        """Run one command. Returns the error message, if any."""
+        game = self.game
+
+        match op:
+            case "hit" | "stand" | "double" | "split" | "surrender":
+                try:
+                    if not game.apply(Action(op)):
+                        return f"cannot {op} now"
+                except ShoeExhausted:
+                    game.void_round()
+                    return "shoe exhausted"
+
+            case "bet":
+                if game.state != GameState.BETTING:
+                    return "betting is closed"
+
+                amount = command.get("amount")
+                if type(amount) is not int or not game.place_bet(amount):
+                    return "invalid bet amount"
+
+                try:
+                    game.deal_initial_cards()
+                except ShoeExhausted:
+                    game.void_round()
+                    return "shoe exhausted"
+
+            case "side_bet":
+                if game.state != GameState.BETTING:
+                    return "betting is closed"
+
+                try:
+                    kind = SideBet(command.get("kind"))
+                except ValueError:
+                    return "unknown side bet"
+
+                amount = command.get("amount")
+                if type(amount) is not int or not game.place_side_bet(kind, amount):
+                    return "invalid side bet"
+
+            case "next":
+                if game.state != GameState.ROUND_FINISHED:
+                    return "round is not finished"
+
+                game.finish_round()
+                game.start_new_round()
+
+            case "mode":
+                mode = command.get("mode")
+                if not isinstance(mode, str) or mode not in mode_names:
+                    return "unknown mode"
+
+                game.select_mode(mode_names[mode])
+
+            case "state" | "stats":
+                pass
+
+            case "quit":
+                raise QuitSession
+
+            case _:
+                return f"unknown op {op!r}"
+
+        return None
+
+    def handle_line(self, line: bytes) -> str:
+        """Run a command line (object or batch array) and return the reply line."""
+        try:
+            payload = json.loads(line)
+        except ValueError:
+            return self.__encoder.encode({"ok": False, "error": "invalid json"})
+
+        if isinstance(payload, list):
+            replies = []
+            for command in payload:
+                try:
+                    replies.append(self.execute(command))
+                except QuitSession as quit:
+                    # Commands before the quit in a batch are still answered.
+                    quit.reply = self.__encoder.encode(replies) if replies else None
+                    raise
+
+            return self.__encoder.encode(replies)
+
+        return self.__encoder.encode(self.execute(payload))
+
+    def serve(self, stdin_fd: int = 0, stdout=None) -> None:
+        """Answer commands until stdin closes or a quit command arrives."""
+        stdout = stdout or sys.stdout.buffer
+        pending = b""
+
+        while chunk := os.read(stdin_fd, READ_SIZE):
+            *lines, pending = (pending + chunk).split(b"\n")
+
+            replies = []
+            try:
+                for line in lines:
+                    if line.strip():
+                        replies.append(self.handle_line(line))
+            except QuitSession as quit:
+                if quit.reply:
+                    replies.append(quit.reply)
+                self.__write(stdout, replies)
+                return
+
+            self.__write(stdout, replies)
+
+        # A last command without a trailing newline
+        if pending.strip():
+            try:
+                self.__write(stdout, [self.handle_line(pending)])
+            except QuitSession as quit:
+                if quit.reply:
+                    self.__write(stdout, [quit.reply])
+
+    def __write(self, stdout, replies: list[str]) -> None:
+        if not replies:
+            return
+
+        stdout.write(("\n".join(replies) + "\n").encode())
+        stdout.flush()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Py of Aces headless JSON engine")
+    parser.add_argument("--mode", choices=list(mode_names), default="practice")
+    args = parser.parse_args(argv)
+
+    game = BlackjackGame()
+    game.select_mode(mode_names[args.mode])
+
+    try:
+        HeadlessEngine(game).serve()
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
+
+
+if __name__ == "__main__":
+    main()
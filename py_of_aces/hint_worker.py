@@ -0,0 +1,138 @@
+"""
+Background computation of action EVs for the hand being played.
+
+Hints are keyed by the hand state, the dealer's upcard and the cards the
+player hasn't seen, so the UI thread only builds a key and looks it up.
+One worker thread computes the newest request. A request still being
+computed when a newer one arrives is abandoned between actions.
+"""
+
+import threading
+from collections import OrderedDict
+from .game_logic.blackjack_game import Action, BlackjackGame, GameState
+from .game_logic.ev import action_evs
+
+# (hard total, has ace, pair points, upcard points, unseen counts, legal
+# actions, rules)
+HintKey = tuple
+
+
+def hint_key(game: BlackjackGame) -> HintKey | None:
+    """The hint request for game's current hand, None outside the player's turn."""
+    if game.state != GameState.PLAYER_TURN:
+        return None
+
+    hand = game.current_hand
+    upcard, *hole_cards = game.dealer_hand.cards
+
+    # The hole card is still unseen, as far as the player knows
+    counts = list(game.deck.counts())
+    for card in hole_cards:
+        counts[card.points - 1] += 1
+
+    pair = hand.cards[0].points if hand.can_split else None
+    return (
+        hand.hard_total,
+        hand.aces > 0,
+        pair,
+        upcard.points,
+        tuple(counts),
+        tuple(game.legal_actions),
+        game.rules,
+    )
+
+
+class HintWorker:
+    """
+    Computes action EVs off the UI thread.
+
+    args:
+        cache_size: Most results kept, least recently used dropped first.
+    """
+
+    def __init__(self, cache_size: int = 256):
+        self.cache_size = cache_size
+        # Bumped whenever a result lands, for windows to notice
+        self.completed = 0
+
+        self.__cache: OrderedDict[HintKey, dict[Action, float]] = OrderedDict()
+        self.__wanted: HintKey | None = None
+        self.__stopped = False
+        self.__condition = threading.Condition()
+        self.__thread: threading.Thread | None = None
+
+    def request(self, key: HintKey) -> dict[Action, float] | None:
+        """
+        Ask for the EVs of key, replacing any older request.
+
+        Returns:
+            The EVs by action if already known, else None until computed.
+        """
+        with self.__condition:
+            evs = self.__cache.get(key)
+            if evs is not None:
+                self.__cache.move_to_end(key)
+                self.__wanted = None
+                return evs
+
+            self.__wanted = key
+            if self.__thread is None:
+                self.__thread = threading.Thread(
+                    target=self.__work_loop, name="hint-worker", daemon=True
+                )
+                self.__thread.start()
+
+            self.__condition.notify()
+            return None
+
+    def get(self, key: HintKey) -> dict[Action, float] | None:
+        """The EVs of key if computed, without requesting them."""
+        with self.__condition:
+            return self.__cache.get(key)
+
+    def close(self) -> None:
+        """Stop the worker, abandoning any request in progress."""
+        with self.__condition:
+            self.__stopped = True
+            self.__wanted = None
+            self.__condition.notify()
+
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __work_loop(self) -> None:
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(
+                    lambda: self.__wanted is not None or self.__stopped
+                )
+                if self.__stopped:
+                    return
+
+                key = self.__wanted
+
+            evs = self.__compute(key)
+
+            with self.__condition:
+                if self.__wanted == key:
+                    self.__wanted = None
+
+                if evs is not None:
+                    self.__cache[key] = evs
+                    if len(self.__cache) > self.cache_size:
+                        self.__cache.popitem(last=False)
+                    self.completed += 1
+
+    def __compute(self, key: HintKey) -> dict[Action, float] | None:
+        """Value each legal action in turn. None if key went stale meanwhile."""
+        hard_total, has_ace, pair, upcard, counts, legal, rules = key
+        evs = {}
+        for action in legal:
+            if self.__wanted != key:
+                return None
+
+            evs.update(
+                action_evs(hard_total, has_ace, pair, counts, upcard, rules, (action,))
+            )
+
+        return evs
@@ -0,0 +1,301 @@
+"""
+Persistent hand history in SQLite.
+
+Rounds are handed to a background writer thread through an unbounded queue,
+so recording never waits on the disk. The writer commits them in batched
+transactions. One HistoryStore should own a database file at a time.
+
+If the writer hits an error it logs it and stops. From then on, like after
+close(), rounds are dropped instead of queued and `error` holds the cause.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+from .game_logic.round_record import RoundRecord
+from .game_logic.dealer import hand_value
+from .game_logic.deck import Card
+
+schema = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    mode TEXT NOT NULL,
+    dealer_upcard TEXT,
+    dealer_cards TEXT NOT NULL,
+    dealer_total INTEGER NOT NULL,
+    starting_total INTEGER NOT NULL,
+    initial_bet INTEGER NOT NULL,
+    total_bet INTEGER NOT NULL,
+    payout INTEGER NOT NULL,
+    net INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS hands (
+    round_id INTEGER NOT NULL REFERENCES rounds (id),
+    hand_index INTEGER NOT NULL,
+    cards TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    bet INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    payout INTEGER NOT NULL,
+    PRIMARY KEY (round_id, hand_index)
+);
+
+CREATE TABLE IF NOT EXISTS actions (
+    round_id INTEGER NOT NULL REFERENCES rounds (id),
+    seq INTEGER NOT NULL,
+    hand_index INTEGER NOT NULL,
+    action TEXT NOT NULL,
+    PRIMARY KEY (round_id, seq)
+);
+
+CREATE INDEX IF NOT EXISTS rounds_by_mode ON rounds (mode, played_at);
+CREATE INDEX IF NOT EXISTS rounds_by_upcard ON rounds (dealer_upcard, starting_total);
+CREATE INDEX IF NOT EXISTS rounds_by_starting_total ON rounds (starting_total);
+CREATE INDEX IF NOT EXISTS actions_by_action ON actions (action);
+"""
+
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+
+def starting_total(record: RoundRecord) -> int:
+    """Total of the player's first two cards, before any split."""
+    first_hand = record.player_hands[0]
+    if record.actions and record.actions[0][1] == "split":
+        # A split replaced the second card, the pair shows in the split hand.
+        cards = [first_hand[0], first_hand[0]]
+    else:
+        cards = first_hand[:2]
+
+    points = [Card.from_code(code).points for code in cards]
+    return hand_value(sum(points), 1 in points)[0]
+
+
+class HistoryStore:
+    """
+    SQLite-backed round history with a background batching writer.
+
+    args:
+        path: The database file, created if missing.
+        batch_size: Most rounds committed in one transaction.
+        flush_interval: Seconds the writer waits to fill a batch.
+        max_pending: If set, rounds beyond this many queued are dropped and
+        counted in `dropped` instead of growing memory.
+
+    Rounds recorded after close() or a writer error are dropped too.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 1000,
+        flush_interval: float = 0.5,
+        max_pending: int = None,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self.dropped = 0
+        self.written = 0
+        # Set when the writer stops on an error
+        self.error: Exception | None = None
+        self.__running = True
+        self.__queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.__pending = 0
+        self.__pending_changed = threading.Condition()
+
+        # Create the schema before returning so readers can query right away.
+        connection = self.__connect()
+        connection.executescript(schema)
+        connection.close()
+
+        self.__writer = threading.Thread(
+            target=self.__write_loop, name="history-writer", daemon=True
+        )
+        self.__writer.start()
+
+    def __connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def record(self, record: RoundRecord) -> bool:
+        """Queue a round for writing. Never blocks. Returns False if dropped."""
+        with self.__pending_changed:
+            if not self.__running or (
+                self.max_pending is not None and self.__pending >= self.max_pending
+            ):
+                self.dropped += 1
+                return False
+
+            self.__pending += 1
+
+        self.__queue.put(record)
+        return True
+
+    def attach(self, game):
+        """
+        Record every round game finishes.
+
+        Returns:
+            A function that stops recording.
+        """
+
+        def on_change(sender, event: str):
+            if event == "round_finished":
+                self.record(sender.round_record())
+
+        return game.subscribe(on_change)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait until every queued round is committed. Returns False on timeout,
+        or at once if the writer has stopped on an error.
+        """
+        with self.__pending_changed:
+            done = self.__pending_changed.wait_for(
+                lambda: self.__pending == 0 or self.error is not None, timeout
+            )
+            return done and self.error is None
+
+    def close(self) -> None:
+        """Commit the remaining rounds and stop the writer."""
+        with self.__pending_changed:
+            if not self.__running:
+                self.__writer.join()
+                return
+
+            self.__running = False
+
+        self.__queue.put(_STOP)
+        self.__writer.join()
+
+    def query(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        """Run a read query on its own connection."""
+        connection = sqlite3.connect(self.path)
+        try:
+            return connection.execute(sql, parameters).fetchall()
+        finally:
+            connection.close()
+
+    def __next_batch(self) -> tuple[list[RoundRecord], bool]:
+        """Block for a round, then gather a batch. Returns it and a stop flag."""
+        item = self.__queue.get()
+        if item is _STOP:
+            return [], True
+
+        batch = [item]
+        while len(batch) < self.batch_size:
+            try:
+                item = self.__queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                break
+
+            if item is _STOP:
+                return batch, True
+
+            batch.append(item)
+
+        return batch, False
+
+    def __write_loop(self) -> None:
+        connection = None
+        try:
+            connection = self.__connect()
+            next_id = connection.execute(
+                "SELECT COALESCE(MAX(id), 0) + 1 FROM rounds"
+            ).fetchone()[0]
+
+            stopping = False
+            while not stopping:
+                batch, stopping = self.__next_batch()
+                if not batch:
+                    continue
+
+                try:
+                    next_id = self.__write_batch(connection, batch, next_id)
+                except Exception as error:
+                    # Set before the batch leaves pending, so flush sees it
+                    self.__fail(error)
+                    raise
+                finally:
+                    with self.__pending_changed:
+                        self.__pending -= len(batch)
+                        if self.error is not None:
+                            self.dropped += len(batch)
+                        self.__pending_changed.notify_all()
+        except Exception as error:
+            logger.exception("History writer for %s stopped", self.path)
+            self.__fail(error)
+            with self.__pending_changed:
+                # Nothing will write the rounds still queued
+                self.dropped += self.__pending
+                self.__pending = 0
+                self.__pending_changed.notify_all()
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def __fail(self, error: Exception) -> None:
+        with self.__pending_changed:
+            self.error = self.error or error
+            self.__running = False
+            self.__pending_changed.notify_all()
+
+    def __write_batch(
+        self, connection: sqlite3.Connection, batch: list[RoundRecord], next_id: int
+    ) -> int:
+        """Commit a batch in one transaction. Returns the next free round id."""
+        rounds, hands, actions = [], [], []
+
+        for round_id, record in enumerate(batch, start=next_id):
+            rounds.append(
+                (
+                    round_id,
+                    record.played_at,
+                    record.mode,
+                    record.dealer_upcard,
+                    "".join(record.dealer_cards),
+                    record.dealer_total,
+                    starting_total(record),
+                    record.initial_bet,
+                    sum(record.bets) + record.side_bets,
+                    record.payout,
+                    record.net,
+                )
+            )
+
+            for index, cards in enumerate(record.player_hands):
+                hands.append(
+                    (
+                        round_id,
+                        index,
+                        "".join(cards),
+                        record.hand_totals[index],
+                        record.bets[index],
+                        record.results[index],
+                        record.hand_payouts[index],
+                    )
+                )
+
+            for seq, (hand_index, action) in enumerate(record.actions):
+                actions.append((round_id, seq, hand_index, action))
+
+        with connection:
+            connection.executemany(
+                "INSERT INTO rounds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rounds
+            )
+            connection.executemany(
+                "INSERT INTO hands VALUES (?, ?, ?, ?, ?, ?, ?)", hands
+            )
+            connection.executemany("INSERT INTO actions VALUES (?, ?, ?, ?)", actions)
+
+        self.written += len(batch)
+        return next_id + len(batch)
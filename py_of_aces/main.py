@@ -1,22 +1,64 @@
+import argparse
+import cProfile
+import pstats
+from typing import TYPE_CHECKING
 from .tui_handler import TuiHandler
-from .windows import MenuWindow, GameWindow, BettingWindow, SizeWarningWindow
+from .windows import (
+    MenuWindow,
+    GameWindow,
+    BettingWindow,
+    SizeWarningWindow,
+    StatsWindow,
+    DrillWindow,
+    HistoryWindow,
+)
 from .game_logic.blackjack_game import BlackjackGame
+from .game_logic.drill import Drill
+from .game_logic.instrumentation import Instrumentation
+from .game_logic.round_history import RoundHistory
+from .history_store import HistoryStore
 
+if TYPE_CHECKING:
+    from blessed import Terminal
 
-def run():
-    """Start Py of Aces"""
-    MIN_HEIGHT = 30
-    MIN_WIDTH = 25
 
-    tui = TuiHandler(min_height=MIN_HEIGHT, min_width=MIN_WIDTH)
-    game_instance = BlackjackGame()
+MIN_HEIGHT = 30
+MIN_WIDTH = 25
+
+
+def build_tui(
+    game_instance: BlackjackGame, terminal_instance: "Terminal" = None
+) -> TuiHandler:
+    """
+    Set up the TUI and its windows around game_instance, ready to start at
+    "menu".
+
+    args:
+        game_instance: The game the windows play.
+        terminal_instance: The terminal to draw on, a new one if not given.
+    """
+    tui = TuiHandler(
+        min_height=MIN_HEIGHT,
+        min_width=MIN_WIDTH,
+        terminal_instance=terminal_instance,
+    )
+    round_history = RoundHistory()
+    round_history.attach(game_instance)
 
-    tui.add_window("menu", MenuWindow, betting_window="betting", game=game_instance)
+    tui.add_window(
+        "menu",
+        MenuWindow,
+        betting_window="betting",
+        drill_window="drill",
+        game=game_instance,
+    )
     tui.add_window(
         "betting",
         BettingWindow,
         menu_window="menu",
         game_window="game",
+        stats_window="stats",
+        history_window="history",
         game=game_instance,
     )
     tui.add_window(
@@ -26,8 +68,78 @@ def run():
         betting_window="betting",
         game=game_instance,
     )
+    tui.add_window("stats", StatsWindow, return_window="betting", game=game_instance)
+    tui.add_window(
+        "history", HistoryWindow, return_window="betting", history=round_history
+    )
+    tui.add_window(
+        "drill", DrillWindow, menu_window="menu", drill=Drill(game_instance.rules)
+    )
     tui.add_window(
         "size_warning", SizeWarningWindow, min_width=MIN_WIDTH, min_height=MIN_HEIGHT
     )
 
-    tui.start("menu")
+    return tui
+
+
+def run(instrumentation: Instrumentation = None, history: HistoryStore = None):
+    """
+    Start Py of Aces
+
+    args:
+        instrumentation: If given, times the phases of the game played.
+        history: If given, records every round played.
+    """
+    game_instance = BlackjackGame()
+    if instrumentation:
+        instrumentation.attach(game_instance)
+    if history:
+        history.attach(game_instance)
+
+    build_tui(game_instance).start("menu")
+
+
+def main(argv: list[str] | None = None):
+    """Parse the command line and start Py of Aces."""
+    parser = argparse.ArgumentParser(description="Py of Aces, a blackjack TUI")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="py_of_aces.prof",
+        metavar="FILE",
+        help="run under cProfile and save the stats to FILE (py_of_aces.prof)",
+    )
+    parser.add_argument(
+        "--instrument",
+        metavar="FILE",
+        help="save per-phase game timings on exit, Prometheus text if FILE "
+        "ends in .prom, JSON otherwise",
+    )
+    parser.add_argument(
+        "--history",
+        metavar="FILE",
+        help="record every round played to the SQLite database FILE",
+    )
+    args = parser.parse_args(argv)
+
+    instrumentation = Instrumentation() if args.instrument else None
+    history = HistoryStore(args.history) if args.history else None
+
+    try:
+        if args.profile:
+            profiler = cProfile.Profile()
+            profiler.runcall(run, instrumentation, history)
+            profiler.dump_stats(args.profile)
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+        else:
+            run(instrumentation, history)
+    finally:
+        if history:
+            history.close()
+
+    if instrumentation:
+        with open(args.instrument, "w") as file:
+            if args.instrument.endswith(".prom"):
+                file.write(instrumentation.to_prometheus())
+            else:
+                file.write(instrumentation.to_json())
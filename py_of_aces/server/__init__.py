@@ -0,0 +1 @@
+from .server import TableServer, main
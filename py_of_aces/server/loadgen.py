@@ -0,0 +1,120 @@
+"""
+Load generator for the table server.
+
+Opens one connection per table and plays rounds with a simple "hit below 17"
+strategy, timing every request. Reports action latency percentiles and, when
+it spawns the server itself, how many such tables one fully used core could
+host.
+
+    python -m py_of_aces.server.loadgen --spawn-server --tables 2000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import resource
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+from .protocol import TableState
+from ..game_logic.blackjack_game import GameState
+
+
+async def play_table(
+    host: str, port: int, rounds: int, bet: int, latencies: list[float]
+) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def request(line: bytes) -> TableState:
+        start = perf_counter()
+        writer.write(line + b"\n")
+        reply = await reader.readline()
+        latencies.append(perf_counter() - start)
+        return TableState(reply.decode())
+
+    for _ in range(rounds):
+        state = await request(b"B %d" % bet)
+        while state.state == GameState.PLAYER_TURN:
+            action = b"H" if state.current_hand_value < 17 else b"S"
+            state = await request(action)
+
+        await request(b"N")
+
+    writer.write(b"Q\n")
+    writer.close()
+    await writer.wait_closed()
+
+
+async def generate_load(
+    host: str, port: int, tables: int, rounds: int, bet: int
+) -> tuple[list[float], float]:
+    """Play every table concurrently. Returns the latencies and wall time."""
+    latencies: list[float] = []
+    start = perf_counter()
+    await asyncio.gather(
+        *(play_table(host, port, rounds, bet, latencies) for _ in range(tables))
+    )
+    return latencies, perf_counter() - start
+
+
+def spawn_server(host: str) -> tuple[subprocess.Popen, int]:
+    """Start a server on a free port. Returns the process and the port."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "py_of_aces.server", "--host", host, "--port", "0"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    banner = process.stdout.readline()
+    port = int(banner.rsplit(":", 1)[1])
+    return process, port
+
+
+def stop_server(process: subprocess.Popen) -> float:
+    """Stop a spawned server. Returns the CPU seconds it used."""
+    process.terminate()
+    process.wait()
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Py of Aces server load generator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7700)
+    parser.add_argument("--tables", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--bet", type=int, default=10)
+    parser.add_argument(
+        "--spawn-server",
+        action="store_true",
+        help="run a local server for the test and measure its CPU time",
+    )
+    args = parser.parse_args(argv)
+
+    server = None
+    port = args.port
+    if args.spawn_server:
+        server, port = spawn_server(args.host)
+
+    try:
+        latencies, wall = asyncio.run(
+            generate_load(args.host, port, args.tables, args.rounds, args.bet)
+        )
+    finally:
+        server_cpu = stop_server(server) if server else None
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"tables:      {args.tables}")
+    print(f"actions:     {len(latencies)} in {wall:.2f}s")
+    print(f"throughput:  {len(latencies) / wall:,.0f} actions/s")
+    print(f"latency p50: {percentiles[49] * 1000:.3f} ms")
+    print(f"latency p99: {percentiles[98] * 1000:.3f} ms")
+
+    if server_cpu:
+        # Tables a single saturated core could run at this per-table pace.
+        print(f"server cpu:  {server_cpu:.2f}s")
+        print(f"tables/core: {args.tables * wall / server_cpu:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Line protocol spoken by the table server.
+
+Every request is one ASCII line, every request gets exactly one reply line.
+
+Requests:
+    B <amount>  Place a bet and deal the initial cards
+    H           Hit
+    S           Stand
+    D           Double down
+    P           Split
+    R           Surrender
+    N           Settle the finished round and start a new one
+    G           Get the table state
+    Q           Close the connection (no reply)
+
+Replies:
+    OK <state>
+    ER <reason> <state>
+
+If the shoe runs out mid-round the reply is "ER shoe_exhausted": the round
+is void, the bets are returned and the table is back to betting.
+
+The state is six space separated fields:
+    <game state> <current hand> <player hands> <dealer cards> <results> <balance>
+
+Cards are two characters, rank then suit, with "T" for tens ("As", "Td").
+Hands are separated by ",", an empty hand is "-" and a hidden dealer card is
+"??". Results hold one character per hand: "-" unsettled, "L" lose, "P" push,
+"W" win, "B" blackjack and "R" surrender.
+"""
+
+from ..game_logic.blackjack_game import Action, BlackjackGame, GameResult, GameState
+from ..game_logic.deck import Card, ShoeExhausted
+from ..game_logic.hand import Hand
+
+action_codes: dict[bytes, Action] = {
+    b"H": Action.HIT,
+    b"S": Action.STAND,
+    b"D": Action.DOUBLE,
+    b"P": Action.SPLIT,
+    b"R": Action.SURRENDER,
+}
+
+result_codes: dict[GameResult | None, str] = {
+    None: "-",
+    GameResult.LOSE: "L",
+    GameResult.PUSH: "P",
+    GameResult.WIN: "W",
+    GameResult.BLACKJACK: "B",
+    GameResult.SURRENDER: "R",
+}
+
+QUIT = b"Q"
+
+
+def encode_hand(cards: list[Card]) -> str:
+    return "".join(card.code for card in cards) or "-"
+
+
+def decode_hand(text: str) -> list[Card]:
+    if text == "-":
+        return []
+
+    return [Card.from_code(text[i : i + 2]) for i in range(0, len(text), 2)]
+
+
+def encode_state(game: BlackjackGame) -> str:
+    dealer_hand = game.dealer_hand
+    dealer = "".join(card.code for card in dealer_hand.get_showing_cards())
+    if dealer_hand.has_hidden_card and dealer_hand.cards:
+        dealer += "??"
+    dealer = dealer or "-"
+
+    hands = ",".join(encode_hand(hand.cards) for hand in game.player_hands)
+    results = "".join(result_codes[result] for result in game.results)
+    balance = game.current_mode.get_balance()
+
+    return (
+        f"{game.state.value} {game.current_hand_index} {hands} {dealer} "
+        f"{results} {balance}"
+    )
+
+
+def execute(game: BlackjackGame, line: bytes) -> bytes:
+    """Run one request line against the game and return the reply line."""
+    command, _, argument = line.strip().partition(b" ")
+    reason = None
+
+    if command in action_codes:
+        try:
+            if not game.apply(action_codes[command]):
+                reason = "rejected"
+        except ShoeExhausted:
+            game.void_round()
+            reason = "shoe_exhausted"
+
+    elif command == b"B":
+        reason = _bet(game, argument)
+
+    elif command == b"N":
+        if game.state == GameState.ROUND_FINISHED:
+            game.finish_round()
+            game.start_new_round()
+        else:
+            reason = "unfinished"
+
+    elif command != b"G":
+        reason = "unknown"
+
+    if reason:
+        return f"ER {reason} {encode_state(game)}\n".encode()
+
+    return f"OK {encode_state(game)}\n".encode()
+
+
+def _bet(game: BlackjackGame, argument: bytes) -> str | None:
+    """Place a bet and deal. Returns the failure reason, if any."""
+    if game.state != GameState.BETTING:
+        return "betting_closed"
+
+    try:
+        amount = int(argument)
+    except ValueError:
+        return "bad_amount"
+
+    if not game.place_bet(amount):
+        return "rejected"
+
+    try:
+        game.deal_initial_cards()
+    except ShoeExhausted:
+        game.void_round()
+        return "shoe_exhausted"
+
+    return None
+
+
+class TableState:
+    """Client side view of a decoded state line."""
+
+    def __init__(self, reply: str):
+        fields = reply.split()
+        self.ok = fields[0] == "OK"
+        if not self.ok:
+            self.reason = fields[1]
+            fields = fields[1:]
+
+        self.state = GameState(int(fields[1]))
+        self.current_hand_index = int(fields[2])
+        self.player_hands = [decode_hand(hand) for hand in fields[3].split(",")]
+        self.dealer_cards = decode_hand(fields[4].replace("??", ""))
+        self.results = fields[5]
+        self.balance = int(fields[6])
+
+    @property
+    def current_hand_value(self) -> int:
+        hand = Hand()
+        for card in self.player_hands[self.current_hand_index]:
+            hand.add_card(card)
+
+        return hand.get_value()
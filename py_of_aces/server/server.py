@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+from .protocol import QUIT, encode_state, execute
+from ..game_logic.blackjack_game import BlackjackGame
+from ..game_logic.game_modes import Modes
+
+READ_SIZE = 64 * 1024
+
+
+class TableServer:
+    """
+    Asyncio server hosting one BlackjackGame table, with its own shoe, per
+    connection. See `protocol` for the wire format.
+
+    args:
+        host: The address to listen on.
+        port: The port to listen on, 0 picks a free one.
+        mode: The game mode every table plays.
+        high_water: Pending output bytes per connection before the server
+        stops reading from that client until its writes drain.
+        max_line: Longest request line accepted before dropping the client.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 7700,
+        mode: Modes = Modes.PRACTICE,
+        high_water: int = 64 * 1024,
+        max_line: int = 64,
+    ):
+        self.host = host
+        self.port = port
+        self.mode = mode
+        self.high_water = high_water
+        self.max_line = max_line
+
+        self.open_tables = 0
+        self.server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(
+            self.__handle_client, self.host, self.port, backlog=1024
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self.server is None:
+            await self.start()
+
+        async with self.server:
+            await self.server.serve_forever()
+
+    def __new_table(self) -> BlackjackGame:
+        game = BlackjackGame()
+        game.select_mode(self.mode)
+        return game
+
+    async def __handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        game = self.__new_table()
+        self.open_tables += 1
+        writer.transport.set_write_buffer_limits(high=self.high_water)
+        pending = b""
+
+        try:
+            while chunk := await reader.read(READ_SIZE):
+                *lines, pending = (pending + chunk).split(b"\n")
+                if len(pending) > self.max_line:
+                    writer.write(f"ER line_too_long {encode_state(game)}\n".encode())
+                    break
+
+                # Every pipelined request in the chunk is answered with a
+                # single write.
+                replies = []
+                closing = False
+                for line in lines:
+                    if line.strip() == QUIT:
+                        closing = True
+                        break
+                    replies.append(execute(game, line))
+
+                writer.write(b"".join(replies))
+                if closing:
+                    break
+
+                if writer.transport.get_write_buffer_size() > self.high_water:
+                    await writer.drain()
+
+        except ConnectionError:
+            pass
+
+        finally:
+            self.open_tables -= 1
+            writer.close()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Py of Aces table server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7700)
+    parser.add_argument(
+        "--mode", choices=["practice", "normal"], default="practice"
+    )
+    args = parser.parse_args(argv)
+
+    mode = Modes.NORMAL if args.mode == "normal" else Modes.PRACTICE
+    server = TableServer(host=args.host, port=args.port, mode=mode)
+
+    async def serve():
+        await server.start()
+        print(f"listening on {server.host}:{server.port}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
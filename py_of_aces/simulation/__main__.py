@@ -0,0 +1,112 @@
+import argparse
+from dataclasses import replace
+from ..game_logic.histogram import csv_header
+from ..game_logic.rules import Rules
+from ..game_logic.strategy import IndexTable
+from .shoe_bank import ShoeBank
+from .simulator import SimulationResult, simulate
+
+
+def report(name: str, result: SimulationResult) -> list[str]:
+    flat, spread, unit = result.flat, result.spread, result.unit
+    lines = [
+        f"{name}: {flat.rounds} rounds in {result.seconds:.1f}s "
+        f"({result.rounds_per_second:,.0f}/s)",
+        f"  flat edge:        {flat.ev_per_unit:+.3%} "
+        f"(± {flat.std_error / unit:.3%})",
+        f"  spread win rate:  {spread.mean / unit * 100:+.2f} units/100 rounds "
+        f"(± {spread.std_error / unit * 100:.2f})",
+        f"  spread edge:      {spread.ev_per_unit:+.3%} of money wagered",
+        f"  rounds at TC +2:  {result.share_at(2):.1%}",
+        "  flat net per round by percentile (units): "
+        + "  ".join(
+            f"{percent}% {result.histograms.net.quantile(percent / 100) / unit:+.1f}"
+            for percent in (1, 5, 50, 95, 99)
+        ),
+        "  edge by true count:",
+    ]
+
+    for count in sorted(result.by_true_count):
+        stats = result.by_true_count[count]
+        if stats.rounds < flat.rounds * 0.005:
+            continue
+
+        lines.append(
+            f"    {count:+3d}  {stats.ev_per_unit:+7.2%}  "
+            f"({stats.rounds / flat.rounds:.1%} of rounds)"
+        )
+
+    return lines
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Simulate basic strategy with a Hi-Lo count"
+    )
+    parser.add_argument("--rounds", type=int, default=200_000)
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--penetration", type=float, default=0.75)
+    parser.add_argument("--h17", action="store_true", help="dealer hits soft 17")
+    parser.add_argument("--surrender", action="store_true")
+    parser.add_argument("--no-das", action="store_true")
+    parser.add_argument("--spread", type=int, default=8, help="max bet in units")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--shoe-bank", metavar="FILE", help="deal pre-shuffled shoes from FILE"
+    )
+    parser.add_argument(
+        "--indices", metavar="FILE", help="play count deviations from FILE"
+    )
+    parser.add_argument(
+        "--shuffler",
+        choices=["shoe", "csm", "both"],
+        default="both",
+        help="hand-shuffled shoe, continuous shuffler, or both side by side",
+    )
+    parser.add_argument(
+        "--histograms",
+        metavar="FILE",
+        help="write the net, bankroll and dealer total histograms to FILE as CSV",
+    )
+    args = parser.parse_args(argv)
+
+    rules = Rules(
+        num_decks=args.decks,
+        penetration=args.penetration,
+        dealer_hits_soft_17=args.h17,
+        surrender=args.surrender,
+        double_after_split=not args.no_das,
+    )
+
+    shufflers = {
+        "shoe": [("Shoe", rules)],
+        "csm": [("CSM", replace(rules, continuous_shuffle=True))],
+    }
+    shufflers["both"] = shufflers["shoe"] + shufflers["csm"]
+
+    bank = ShoeBank(args.shoe_bank) if args.shoe_bank else None
+    if bank and not bank.matches(rules):
+        parser.error(f"{args.shoe_bank} holds {bank.num_decks}-deck shoes")
+    indices = IndexTable.load(args.indices) if args.indices else None
+
+    csv_rows = []
+    for name, table_rules in shufflers[args.shuffler]:
+        shoes = bank.stream() if bank else None
+        result = simulate(
+            table_rules,
+            args.rounds,
+            args.seed,
+            args.spread,
+            shoes=shoes,
+            indices=indices,
+        )
+        print("\n".join(report(name, result)))
+        csv_rows.extend(result.histograms.csv_rows(f"{name.lower()}_"))
+
+    if args.histograms:
+        with open(args.histograms, "w") as file:
+            file.write("\n".join([csv_header, *csv_rows]) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Simulation that runs until a target precision is reached.
+
+Rounds are played in batches. Each batch is seeded from the run seed and its
+index, and merged into the running statistics in index order, so a seeded
+run gives the same answer with any number of workers. After every batch the
+standard error of the edge is checked against the target, and the rounds
+still needed are estimated from the variance so far.
+
+    python -m py_of_aces.simulation.adaptive --ci-width 0.005
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Callable
+from ..game_logic.rules import Rules
+from ..game_logic.running_stats import RunningStats
+from .backends import backends
+from .simulator import strategies
+
+
+@dataclass
+class Progress:
+    """Where an adaptive run stands after a batch."""
+
+    stats: RunningStats
+    target_se: float
+    seconds: float
+    done: bool = False
+
+    @property
+    def rounds_needed(self) -> int:
+        """Total rounds the target needs, at the variance seen so far."""
+        if not self.target_se:
+            return 0
+
+        return math.ceil(self.stats.variance / self.target_se**2)
+
+    @property
+    def eta(self) -> float:
+        """Seconds left at the current rate."""
+        if not self.stats.count:
+            return math.inf
+
+        remaining = max(self.rounds_needed - self.stats.count, 0)
+        return remaining * self.seconds / self.stats.count
+
+    def describe(self) -> str:
+        stats = self.stats
+        return (
+            f"{stats.count:>10,} rounds  edge {stats.mean:+.3%} "
+            f"± {stats.std_error:.3%} (target {self.target_se:.3%})  "
+            f"ETA {self.eta:.0f}s"
+        )
+
+
+@dataclass
+class AdaptiveResult:
+    stats: RunningStats = field(default_factory=RunningStats)
+    target_se: float = 0.0
+    seconds: float = 0.0
+    converged: bool = False
+
+    def interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        """Confidence interval on the edge per unit bet."""
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        margin = z * self.stats.std_error
+        return self.stats.mean - margin, self.stats.mean + margin
+
+
+def target_std_error(
+    target_se: float = None, ci_width: float = None, confidence: float = 0.95
+) -> float:
+    """The standard error that meets either target, a full CI width or an SE."""
+    if ci_width is not None:
+        return ci_width / (2 * NormalDist().inv_cdf((1 + confidence) / 2))
+
+    if target_se is None:
+        raise ValueError("Give a target standard error or CI width")
+
+    return target_se
+
+
+def _play_batch(
+    backend: str, rules: Rules, strategy: str, seed: int, rounds: int
+) -> RunningStats:
+    return backends[backend](rules, strategy, seed).play(rounds)
+
+
+def simulate_until(
+    rules: Rules,
+    target_se: float = None,
+    ci_width: float = None,
+    confidence: float = 0.95,
+    batch: int = 20_000,
+    max_rounds: int = None,
+    backend: str = "engine",
+    strategy: str = "basic",
+    seed: int = None,
+    workers: int = 1,
+    progress: Callable[[Progress], None] = None,
+) -> AdaptiveResult:
+    """
+    Play batches until the edge is known to the target precision.
+
+    args:
+        rules: The table rules.
+        target_se: Standard error wanted on the edge per unit bet.
+        ci_width: Or the full width wanted of its confidence interval.
+        confidence: Confidence level of ci_width.
+        batch: Rounds per batch, the granularity of the stopping check.
+        max_rounds: Give up after this many rounds.
+        backend: A name from backends.backends.
+        strategy: A name from simulator.strategies.
+        seed: Seeds the batches, for reproducible runs.
+        workers: Processes playing batches in parallel.
+        progress: Called with a Progress after every batch.
+    """
+    target = target_std_error(target_se, ci_width, confidence)
+    seed = random.randrange(2**32) if seed is None else seed
+    result = AdaptiveResult(target_se=target)
+    started = time.perf_counter()
+
+    def batch_seed(index: int) -> int:
+        return hash((seed, index)) & 0xFFFFFFFF
+
+    def finished() -> bool:
+        stats = result.stats
+        if stats.count >= 2 and stats.std_error <= target:
+            result.converged = True
+            return True
+
+        return max_rounds is not None and stats.count >= max_rounds
+
+    def merge(stats: RunningStats) -> bool:
+        result.stats.merge(stats)
+        result.seconds = time.perf_counter() - started
+        done = finished()
+        if progress:
+            progress(Progress(result.stats, target, result.seconds, done))
+        return done
+
+    if workers <= 1:
+        index = 0
+        while True:
+            stats = _play_batch(backend, rules, strategy, batch_seed(index), batch)
+            if merge(stats):
+                return result
+            index += 1
+
+    with ProcessPoolExecutor(workers) as pool:
+        pending = []
+        index = 0
+        while True:
+            # Keep a batch queued behind every worker
+            while len(pending) < workers * 2:
+                pending.append(
+                    pool.submit(
+                        _play_batch, backend, rules, strategy, batch_seed(index), batch
+                    )
+                )
+                index += 1
+
+            if merge(pending.pop(0).result()):
+                for future in pending:
+                    future.cancel()
+                return result
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Simulate until the house edge is known to a target precision"
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "--target-se", type=float, help="standard error wanted on the edge"
+    )
+    target.add_argument(
+        "--ci-width", type=float, help="full confidence interval width wanted"
+    )
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--batch", type=int, default=20_000)
+    parser.add_argument("--max-rounds", type=int)
+    parser.add_argument("--backend", choices=sorted(backends), default="engine")
+    parser.add_argument("--strategy", choices=sorted(strategies), default="basic")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--penetration", type=float, default=0.75)
+    parser.add_argument("--h17", action="store_true", help="dealer hits soft 17")
+    parser.add_argument("--surrender", action="store_true")
+    args = parser.parse_args(argv)
+
+    rules = Rules(
+        num_decks=args.decks,
+        penetration=args.penetration,
+        dealer_hits_soft_17=args.h17,
+        surrender=args.surrender,
+    )
+
+    def show(progress: Progress) -> None:
+        print(f"\r{progress.describe()}", end="", file=sys.stderr, flush=True)
+
+    result = simulate_until(
+        rules,
+        target_se=args.target_se,
+        ci_width=args.ci_width,
+        confidence=args.confidence,
+        batch=args.batch,
+        max_rounds=args.max_rounds,
+        backend=args.backend,
+        strategy=args.strategy,
+        seed=args.seed,
+        workers=args.workers,
+        progress=show,
+    )
+    print(file=sys.stderr)
+
+    low, high = result.interval(args.confidence)
+    status = "converged" if result.converged else "stopped at max rounds"
+    print(
+        f"{status} after {result.stats.count:,} rounds in {result.seconds:.1f}s: "
+        f"edge {result.stats.mean:+.3%}, {args.confidence:.0%} CI "
+        f"[{low:+.3%}, {high:+.3%}]"
+    )
+
+
+if __name__ == "__main__":
+    main()
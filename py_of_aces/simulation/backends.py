@@ -0,0 +1,90 @@
+"""
+Execution backends that play batches of rounds with a strategy.
+
+Every backend returns the net result per round, in units of the initial
+bet, as a RunningStats, so batches from any backend and any process merge.
+"""
+
+import random
+from typing import Iterator, Sequence
+from ..game_logic.blackjack_game import BlackjackGame, GameState
+from ..game_logic.game_modes import Modes
+from ..game_logic.rules import Rules
+from ..game_logic.running_stats import RunningStats
+from .engine import play_round
+from .shoe import RankShoe
+from .simulator import strategies
+
+
+class EngineBackend:
+    """Rounds on the fast simulation engine."""
+
+    def __init__(
+        self,
+        rules: Rules,
+        strategy: str = "basic",
+        seed: int = None,
+        shoes: Iterator[Sequence[int]] = None,
+        unit: int = 10,
+    ):
+        self.rules = rules
+        self.unit = unit
+        self.player = strategies[strategy](rules)
+        self.shoe = RankShoe(rules=rules, rng=random.Random(seed), shoes=shoes)
+
+    def play(self, rounds: int) -> RunningStats:
+        stats = RunningStats()
+        shoe, rules, unit, player = self.shoe, self.rules, self.unit, self.player
+
+        for _ in range(rounds):
+            bets, _, payout, _, _ = play_round(shoe, unit, rules, player)
+            stats.add((payout - sum(bets)) / unit)
+            shoe.collect()
+            if shoe.needs_reshuffle:
+                shoe.reset_deck()
+
+        return stats
+
+
+class GameBackend:
+    """Rounds on BlackjackGame itself, slower but the reference rules."""
+
+    def __init__(
+        self,
+        rules: Rules,
+        strategy: str = "basic",
+        seed: int = None,
+        shoes: Iterator[Sequence[int]] = None,
+        unit: int = 10,
+    ):
+        self.unit = unit
+        self.player = strategies[strategy](rules)
+        self.game = BlackjackGame(rules=rules, rng=random.Random(seed), shoes=shoes)
+        self.game.select_mode(Modes.PRACTICE)
+
+    def play(self, rounds: int) -> RunningStats:
+        stats = RunningStats()
+        game, unit, player = self.game, self.unit, self.player
+
+        for _ in range(rounds):
+            game.place_bet(unit)
+            game.deal_initial_cards()
+            upcard = game.dealer_hand.cards[0].points
+            while game.state == GameState.PLAYER_TURN:
+                hand = game.current_hand
+                pair = hand.cards[0].points if hand.can_split else None
+                legal = game.legal_actions
+                game.apply(player(hand.hard_total, hand.aces > 0, pair, upcard, legal))
+
+            stats.add((game.get_winnings() - game.total_bet) / unit)
+            game.finish_round()
+            game.start_new_round()
+
+        return stats
+
+
+# Backend name -> class, constructed as backend(rules, strategy, seed, shoes)
+backends: dict[str, type] = {
+    "engine": EngineBackend,
+    "game": GameBackend,
+}
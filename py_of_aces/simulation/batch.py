@@ -0,0 +1,337 @@
+"""
+Many tables stepped together, their state kept in parallel arrays.
+
+A TableBatch holds N tables the way BlackjackGame holds one, but instead of
+Hand objects, Enum states and observers per table it keeps flat `array`s:
+one slot per table for the round state and the dealer, and max_splits + 1
+slots per table for the player's hands. Every table moves through the same
+GameState machine (BETTING, PLAYER_TURN, ROUND_FINISHED, with dealing and
+the dealer's turn run in between) and is paid by the same rules; the
+differential fuzzer checks a one-table batch against BlackjackGame.
+"""
+
+import random
+from array import array
+from typing import Iterator, Sequence
+from ..game_logic.blackjack_game import (
+    Action,
+    GameResult,
+    GameState,
+    payout_multipliers,
+)
+from ..game_logic.dealer import hand_value, play_out
+from ..game_logic.rules import Rules
+from .engine import points_by_rank
+from .shoe import RankShoe
+from .simulator import Player
+
+BETTING = GameState.BETTING.value
+PLAYER_TURN = GameState.PLAYER_TURN.value
+ROUND_FINISHED = GameState.ROUND_FINISHED.value
+
+# Result slot of a hand still being played
+UNSETTLED = 0
+results_by_value: dict[int, GameResult] = {
+    result.value: result for result in GameResult
+}
+
+
+class TableBatch:
+    """
+    N independent tables under one set of rules.
+
+    Hand slots of table t are t * hands_per_table onwards. Cards are rank
+    indices, as in engine.play_round.
+
+    args:
+        tables: Number of tables.
+        rules: The table rules.
+        seed: Seeds every table's shuffles, for reproducible runs.
+        shoes: Pre-shuffled shoes shared by all tables, such as
+        ShoeBank.stream(), used instead of shuffling.
+    """
+
+    def __init__(
+        self,
+        tables: int,
+        rules: Rules = None,
+        seed: int = None,
+        shoes: Iterator[Sequence[int]] = None,
+    ):
+        self.tables = tables
+        self.rules = rules or Rules()
+        self.hands_per_table = self.rules.max_splits + 1
+        self.multipliers = payout_multipliers(self.rules)
+
+        rng = random.Random(seed)
+        self.shoes = [
+            RankShoe(
+                rules=self.rules, rng=random.Random(rng.getrandbits(64)), shoes=shoes
+            )
+            for _ in range(tables)
+        ]
+
+        # Per table
+        self.states = array("b", [BETTING]) * tables
+        self.dealer_hard = array("b", [0]) * tables
+        self.dealer_ace = array("b", [0]) * tables
+        self.dealer_totals = array("b", [0]) * tables
+        self.upcards = array("b", [0]) * tables
+        self.hand_counts = array("b", [0]) * tables
+        self.current = array("b", [0]) * tables
+        self.payouts = array("q", [0]) * tables
+
+        # Per hand slot
+        slots = tables * self.hands_per_table
+        self.firsts = array("b", [0]) * slots
+        self.seconds = array("b", [0]) * slots
+        self.sizes = array("b", [0]) * slots
+        self.hards = array("b", [0]) * slots
+        self.aces = array("b", [0]) * slots
+        self.split = array("b", [0]) * slots
+        self.bets = array("q", [0]) * slots
+        self.results = array("b", [UNSETTLED]) * slots
+
+    def state(self, table: int) -> GameState:
+        return GameState(self.states[table])
+
+    def in_state(self, state: GameState) -> list[int]:
+        """The tables currently in state."""
+        value = state.value
+        return [table for table, current in enumerate(self.states) if current == value]
+
+    def deal(self, bets: Sequence[int]) -> None:
+        """
+        Place each table's bet and deal. A table with a bet of 0, or not in
+        BETTING, sits the round out. Tables with a natural on either side
+        are settled at once; the rest wait in PLAYER_TURN.
+
+        Raises:
+            IndexError: A shoe ran out mid-round.
+        """
+        points = points_by_rank
+        stride = self.hands_per_table
+        for table, bet in enumerate(bets):
+            if bet <= 0 or self.states[table] != BETTING:
+                continue
+
+            deal = self.shoes[table].deal
+            # Dealt alternately, player first
+            p1 = deal()
+            d1 = deal()
+            p2 = deal()
+            d2 = deal()
+
+            slot = table * stride
+            self.firsts[slot] = p1
+            self.seconds[slot] = p2
+            self.sizes[slot] = 2
+            self.hards[slot] = points[p1] + points[p2]
+            self.aces[slot] = p1 == 0 or p2 == 0
+            self.split[slot] = False
+            self.bets[slot] = bet
+            self.results[slot] = UNSETTLED
+
+            self.dealer_hard[table] = points[d1] + points[d2]
+            self.dealer_ace[table] = d1 == 0 or d2 == 0
+            self.dealer_totals[table] = hand_value(
+                self.dealer_hard[table], self.dealer_ace[table]
+            )[0]
+            self.upcards[table] = points[d1]
+            self.hand_counts[table] = 1
+            self.current[table] = 0
+            self.payouts[table] = 0
+
+            player_natural = hand_value(self.hards[slot], self.aces[slot])[0] == 21
+            dealer_natural = self.dealer_totals[table] == 21
+            if not (player_natural or dealer_natural):
+                self.states[table] = PLAYER_TURN
+                continue
+
+            if player_natural and dealer_natural:
+                result = GameResult.PUSH
+            elif player_natural:
+                result = GameResult.BLACKJACK
+            else:
+                result = GameResult.LOSE
+
+            self.results[slot] = result.value
+            self.payouts[table] = int(bet * self.multipliers[result])
+            self.states[table] = ROUND_FINISHED
+
+    def decision(self, table: int) -> tuple[int, bool, int | None, int, list[Action]]:
+        """
+        The current hand of a table in PLAYER_TURN, as the arguments of a
+        Player: (hard total, has ace, pair points, upcard, legal actions).
+        """
+        rules = self.rules
+        slot = table * self.hands_per_table + self.current[table]
+        hand_count = self.hand_counts[table]
+        two_cards = self.sizes[slot] == 2
+        is_split = self.split[slot]
+
+        legal = [Action.HIT, Action.STAND]
+        if two_cards and (rules.double_after_split or not is_split):
+            legal.append(Action.DOUBLE)
+
+        pair = None
+        first = self.firsts[slot]
+        if two_cards and first == self.seconds[slot]:
+            pair = points_by_rank[first]
+            if hand_count < rules.max_splits + 1 and not (
+                first == 0 and is_split and not rules.resplit_aces
+            ):
+                legal.append(Action.SPLIT)
+
+        if rules.surrender and hand_count == 1 and two_cards:
+            legal.append(Action.SURRENDER)
+
+        return self.hards[slot], bool(self.aces[slot]), pair, self.upcards[table], legal
+
+    def step(self, actions: Sequence[Action | None]) -> list[bool]:
+        """
+        Apply one action to the current hand of every table in PLAYER_TURN.
+        Tables whose hands are all played then get the dealer's turn and are
+        settled, ending in ROUND_FINISHED.
+
+        args:
+            actions: An action per table, None for tables not acting.
+
+        Returns:
+            Per table, whether its action was legal and applied.
+        """
+        applied = [False] * self.tables
+        for table, action in enumerate(actions):
+            if action is None or self.states[table] != PLAYER_TURN:
+                continue
+
+            if action not in self.decision(table)[4]:
+                continue
+
+            applied[table] = True
+            self.__apply(table, action)
+            if self.current[table] >= self.hand_counts[table]:
+                self.__dealer_play(table)
+
+        return applied
+
+    def play(self, choose: Player) -> None:
+        """Step every table until none is left in PLAYER_TURN."""
+        playing = self.in_state(GameState.PLAYER_TURN)
+        while playing:
+            actions: list[Action | None] = [None] * self.tables
+            for table in playing:
+                actions[table] = choose(*self.decision(table))
+
+            self.step(actions)
+            playing = [table for table in playing if self.states[table] == PLAYER_TURN]
+
+    def finish_round(self) -> None:
+        """Clear finished tables for the next round, reshuffling when due."""
+        for table, state in enumerate(self.states):
+            if state != ROUND_FINISHED:
+                continue
+
+            shoe = self.shoes[table]
+            shoe.collect()
+            if shoe.needs_reshuffle:
+                shoe.reset_deck()
+
+            self.states[table] = BETTING
+
+    def hand_results(self, table: int) -> tuple[list[int], list[GameResult | None]]:
+        """Bets and results of a table's hands this round."""
+        start = table * self.hands_per_table
+        end = start + self.hand_counts[table]
+        results = [results_by_value.get(value) for value in self.results[start:end]]
+        return list(self.bets[start:end]), results
+
+    def net(self, table: int) -> int:
+        """What a finished table won or lost this round."""
+        start = table * self.hands_per_table
+        return self.payouts[table] - sum(
+            self.bets[start : start + self.hand_counts[table]]
+        )
+
+    def __apply(self, table: int, action: Action) -> None:
+        points = points_by_rank
+        stride = self.hands_per_table
+        slot = table * stride + self.current[table]
+        deal = self.shoes[table].deal
+
+        if action is Action.HIT or action is Action.DOUBLE:
+            if action is Action.DOUBLE:
+                self.bets[slot] *= 2
+
+            rank = deal()
+            self.sizes[slot] += 1
+            self.hards[slot] += points[rank]
+            self.aces[slot] = self.aces[slot] or rank == 0
+
+            if self.hards[slot] > 21:
+                self.results[slot] = GameResult.LOSE.value
+                self.current[table] += 1
+            elif action is Action.DOUBLE:
+                self.current[table] += 1
+
+        elif action is Action.STAND:
+            self.current[table] += 1
+
+        elif action is Action.SURRENDER:
+            self.results[slot] = GameResult.SURRENDER.value
+            self.current[table] += 1
+
+        elif action is Action.SPLIT:
+            rank = self.firsts[slot]
+            first_card = deal()
+            second_card = deal()
+
+            self.seconds[slot] = first_card
+            self.hards[slot] = points[rank] + points[first_card]
+            self.aces[slot] = rank == 0 or first_card == 0
+            self.split[slot] = True
+
+            new = table * stride + self.hand_counts[table]
+            self.firsts[new] = rank
+            self.seconds[new] = second_card
+            self.sizes[new] = 2
+            self.hards[new] = points[rank] + points[second_card]
+            self.aces[new] = rank == 0 or second_card == 0
+            self.split[new] = True
+            self.bets[new] = self.bets[slot]
+            self.results[new] = UNSETTLED
+            self.hand_counts[table] += 1
+
+    def __dealer_play(self, table: int) -> None:
+        """The dealer's turn and settlement, as BlackjackGame does it."""
+        start = table * self.hands_per_table
+        end = start + self.hand_counts[table]
+        if UNSETTLED in self.results[start:end]:
+            deal = self.shoes[table].deal
+            self.dealer_totals[table] = play_out(
+                self.dealer_hard[table],
+                self.dealer_ace[table],
+                lambda: points_by_rank[deal()],
+                self.rules,
+            )
+
+        dealer_total = self.dealer_totals[table]
+        dealer_busted = dealer_total > 21
+        payout = 0
+        for slot in range(start, end):
+            if self.results[slot] == UNSETTLED:
+                player_total = hand_value(self.hards[slot], self.aces[slot])[0]
+                if dealer_busted or player_total > dealer_total:
+                    result = GameResult.WIN
+                elif player_total == dealer_total:
+                    result = GameResult.PUSH
+                else:
+                    result = GameResult.LOSE
+                self.results[slot] = result.value
+            else:
+                result = results_by_value[self.results[slot]]
+
+            payout += int(self.bets[slot] * self.multipliers[result])
+
+        self.payouts[table] = payout
+        self.states[table] = ROUND_FINISHED
@@ -0,0 +1,187 @@
+"""
+Paired comparison of strategies and rule variants with common random numbers.
+
+Every variant plays every round from the same shoe position, so they all
+see the same deal and draw the same cards in the same order. The shoe then
+advances by the cards the first variant (the baseline) used. Outcomes of the
+variants are strongly correlated round by round, and the standard error of
+the per-round difference is far smaller than the two standard errors of
+independent runs combined.
+
+    python -m py_of_aces.simulation.compare basic basic,surrender=1 mimic-dealer
+"""
+
+import argparse
+import dataclasses
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, Sequence
+from ..game_logic.rules import Rules
+from ..game_logic.running_stats import RunningStats
+from .engine import play_round
+from .shoe import RankShoe
+from .shoe_bank import ShoeBank
+from .simulator import Player, strategies
+
+# Rules that shape the shared shoe, so every variant must agree on them
+shoe_rules = ("num_decks", "penetration", "continuous_shuffle")
+
+
+@dataclass
+class Variant:
+    """
+    A strategy played under a rule set.
+
+    args:
+        name: Label for reports.
+        rules: The table rules.
+        strategy: A name from simulator.strategies.
+    """
+
+    name: str
+    rules: Rules
+    strategy: str = "basic"
+    # Net result per round, in units of the initial bet
+    results: RunningStats = field(default_factory=RunningStats)
+    # Per-round difference from the baseline, in units
+    difference: RunningStats = field(default_factory=RunningStats)
+
+    @classmethod
+    def parse(cls, spec: str, base: Rules) -> "Variant":
+        """
+        Build a variant from "strategy[,rule=value,...]", e.g.
+        "basic,dealer_hits_soft_17=1,blackjack_payout=1.2".
+        """
+        strategy, *overrides = spec.split(",")
+        if strategy not in strategies:
+            raise ValueError(f"Unknown strategy {strategy!r}")
+
+        changes = {}
+        fields = {rule.name: rule for rule in dataclasses.fields(Rules)}
+        for override in overrides:
+            name, _, value = override.partition("=")
+            if name not in fields:
+                raise ValueError(f"Unknown rule {name!r}")
+
+            kind = type(getattr(base, name))
+            changes[name] = bool(int(value)) if kind is bool else kind(value)
+
+        return cls(spec, dataclasses.replace(base, **changes), strategy)
+
+
+def compare(
+    variants: list[Variant],
+    rounds: int,
+    seed: int = None,
+    unit: int = 10,
+    shoes: Iterator[Sequence[int]] = None,
+) -> float:
+    """
+    Play rounds through every variant on common cards. Results accumulate
+    in the variants, the first one being the baseline.
+
+    Returns:
+        Seconds taken.
+    """
+    baseline = variants[0]
+    for variant in variants[1:]:
+        for rule in shoe_rules:
+            if getattr(variant.rules, rule) != getattr(baseline.rules, rule):
+                raise ValueError(f"Variants must share {rule} to share a shoe")
+
+    shoe = RankShoe(rules=baseline.rules, rng=random.Random(seed), shoes=shoes)
+    players: list[Player] = [
+        strategies[variant.strategy](variant.rules) for variant in variants
+    ]
+    view = RankShoe(shuffle=False, rules=baseline.rules)
+    nets = [0.0] * len(variants)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        used = 0
+        for i, variant in enumerate(variants):
+            view.cards = shoe.cards[:]
+            view.in_play = []
+            bets, _, payout, _, _ = play_round(view, unit, variant.rules, players[i])
+
+            nets[i] = (payout - sum(bets)) / unit
+            variant.results.add(nets[i])
+            if i == 0:
+                used = len(view.in_play)
+            else:
+                variant.difference.add(nets[i] - nets[0])
+
+        for _ in range(used):
+            shoe.deal()
+        shoe.collect()
+        if shoe.needs_reshuffle:
+            shoe.reset_deck()
+
+    return time.perf_counter() - started
+
+
+def report(variants: list[Variant], seconds: float) -> list[str]:
+    baseline = variants[0]
+    results = baseline.results
+    lines = [
+        f"{results.count} rounds per variant in {seconds:.1f}s",
+        f"baseline {baseline.name}: {results.mean:+.3%} "
+        f"(± {results.std_error:.3%}) per unit bet",
+        "",
+        f"{'variant':<32} {'EV':>9} {'Δ vs baseline':>14} {'paired SE':>10} "
+        f"{'indep. SE':>10} {'rounds saved':>12}",
+    ]
+
+    for variant in variants[1:]:
+        difference = variant.difference
+        independent = (
+            results.std_error**2 + variant.results.std_error**2
+        ) ** 0.5
+        saved = (
+            (independent / difference.std_error) ** 2
+            if difference.std_error
+            else float("inf")
+        )
+        lines.append(
+            f"{variant.name:<32} {variant.results.mean:>+9.3%} "
+            f"{difference.mean:>+14.3%} {difference.std_error:>10.3%} "
+            f"{independent:>10.3%} {saved:>11.0f}x"
+        )
+
+    return lines
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Compare strategies and rule variants on common cards"
+    )
+    parser.add_argument(
+        "variants",
+        nargs="+",
+        metavar="VARIANT",
+        help="strategy[,rule=value,...], the first is the baseline "
+        f"(strategies: {', '.join(strategies)})",
+    )
+    parser.add_argument("--rounds", type=int, default=100_000)
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--penetration", type=float, default=0.75)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--shoe-bank", metavar="FILE", help="deal pre-shuffled shoes from FILE"
+    )
+    args = parser.parse_args(argv)
+
+    base = Rules(num_decks=args.decks, penetration=args.penetration)
+    shoes = ShoeBank(args.shoe_bank).stream() if args.shoe_bank else None
+    try:
+        variants = [Variant.parse(spec, base) for spec in args.variants]
+        seconds = compare(variants, args.rounds, args.seed, shoes=shoes)
+    except ValueError as error:
+        parser.error(str(error))
+
+    print("\n".join(report(variants, seconds)))
+
+
+if __name__ == "__main__":
+    main()
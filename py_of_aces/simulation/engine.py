@@ -0,0 +1,184 @@
+"""
+A fast round engine for simulations.
+
+Cards are rank indices into BlackjackDeck.ranks (0 is an ace, 12 a king),
+dealt from a RankShoe, so a round allocates no Card, Hand or game objects.
+The rules follow BlackjackGame exactly; the differential fuzz harness in
+`fuzz.py` keeps the two in agreement.
+"""
+
+from typing import Callable, Sequence
+from ..game_logic.blackjack_game import Action, GameResult, payout_multipliers
+from ..game_logic.dealer import hand_value, play_out
+from ..game_logic.deck import BlackjackDeck, Card, rank_points
+from ..game_logic.rules import Rules
+from .shoe import RankShoe
+
+rank_index: dict[str, int] = {rank: i for i, rank in enumerate(BlackjackDeck.ranks)}
+points_by_rank: tuple[int, ...] = tuple(
+    rank_points[rank] for rank in BlackjackDeck.ranks
+)
+
+# (bets, results, payout, actions, dealer total) for one round, actions as
+# (hand index, Action)
+RoundOutcome = tuple[list[int], list[GameResult], int, list[tuple[int, Action]], int]
+
+
+def ranks_to_cards(ranks: Sequence[int]) -> list[Card]:
+    """Cards for a shoe of rank indices, suits cycling so codes stay distinct."""
+    suits = BlackjackDeck.suits
+    return [
+        Card(BlackjackDeck.ranks[rank], suits[i % len(suits)])
+        for i, rank in enumerate(ranks)
+    ]
+
+
+def cards_to_ranks(cards: Sequence[Card]) -> list[int]:
+    return [rank_index[card.rank] for card in cards]
+
+
+def play_round(
+    shoe: RankShoe,
+    bet: int,
+    rules: Rules,
+    choose: Callable[[int, bool, int | None, int, list[Action]], Action],
+) -> RoundOutcome:
+    """
+    Play one round from shoe.
+
+    args:
+        shoe: The shoe to deal from. The round's cards are left in play.
+        bet: The initial bet.
+        rules: The table rules.
+        choose: Picks the action for the current hand, called as
+        choose(hard_total, has_ace, pair, upcard, legal) where pair is the
+        points of a splittable pair (else None) and upcard the points of the
+        dealer's upcard. legal lists the actions allowed, in the order
+        BlackjackGame.legal_actions gives them.
+
+    Raises:
+        IndexError: The shoe ran out mid-round.
+    """
+    points = points_by_rank
+    deal = shoe.deal
+
+    # Dealt alternately, player first
+    p1 = deal()
+    d1 = deal()
+    p2 = deal()
+    d2 = deal()
+
+    dealer_hard = points[d1] + points[d2]
+    dealer_ace = d1 == 0 or d2 == 0
+    player_hard = points[p1] + points[p2]
+    player_ace = p1 == 0 or p2 == 0
+
+    player_natural = hand_value(player_hard, player_ace)[0] == 21
+    dealer_natural = hand_value(dealer_hard, dealer_ace)[0] == 21
+    if player_natural or dealer_natural:
+        if player_natural and dealer_natural:
+            result = GameResult.PUSH
+        elif player_natural:
+            result = GameResult.BLACKJACK
+        else:
+            result = GameResult.LOSE
+
+        payout = int(bet * payout_multipliers(rules)[result])
+        return [bet], [result], payout, [], hand_value(dealer_hard, dealer_ace)[0]
+
+    upcard = points[d1]
+
+    # Per hand: first two ranks, card count, hard total, has ace, split flag
+    firsts = [p1]
+    seconds = [p2]
+    sizes = [2]
+    hards = [player_hard]
+    has_aces = [player_ace]
+    splits = [False]
+    bets = [bet]
+    results: list[GameResult | None] = [None]
+    actions: list[tuple[int, Action]] = []
+
+    index = 0
+    while index < len(bets):
+        legal = [Action.HIT, Action.STAND]
+        pair = None
+        two_cards = sizes[index] == 2
+        if two_cards and (rules.double_after_split or not splits[index]):
+            legal.append(Action.DOUBLE)
+
+        if two_cards and firsts[index] == seconds[index]:
+            pair = points[firsts[index]]
+            if len(bets) < rules.max_splits + 1 and not (
+                firsts[index] == 0 and splits[index] and not rules.resplit_aces
+            ):
+                legal.append(Action.SPLIT)
+
+        if rules.surrender and len(bets) == 1 and two_cards:
+            legal.append(Action.SURRENDER)
+
+        action = choose(hards[index], has_aces[index], pair, upcard, legal)
+        actions.append((index, action))
+
+        if action is Action.HIT or action is Action.DOUBLE:
+            if action is Action.DOUBLE:
+                bets[index] *= 2
+
+            rank = deal()
+            sizes[index] += 1
+            hards[index] += points[rank]
+            has_aces[index] = has_aces[index] or rank == 0
+
+            if hards[index] > 21:
+                results[index] = GameResult.LOSE
+                index += 1
+            elif action is Action.DOUBLE:
+                index += 1
+
+        elif action is Action.STAND:
+            index += 1
+
+        elif action is Action.SURRENDER:
+            results[index] = GameResult.SURRENDER
+            index += 1
+
+        elif action is Action.SPLIT:
+            rank = firsts[index]
+            first_card = deal()
+            second_card = deal()
+
+            seconds[index] = first_card
+            hards[index] = points[rank] + points[first_card]
+            has_aces[index] = rank == 0 or first_card == 0
+            splits[index] = True
+
+            firsts.append(rank)
+            seconds.append(second_card)
+            sizes.append(2)
+            hards.append(points[rank] + points[second_card])
+            has_aces.append(rank == 0 or second_card == 0)
+            splits.append(True)
+            bets.append(bets[index])
+            results.append(None)
+
+    if None in results:
+        dealer_total = play_out(dealer_hard, dealer_ace, lambda: points[deal()], rules)
+    else:
+        dealer_total = hand_value(dealer_hard, dealer_ace)[0]
+
+    dealer_busted = dealer_total > 21
+    for i, result in enumerate(results):
+        if result is not None:
+            continue
+
+        player_total = hand_value(hards[i], has_aces[i])[0]
+        if dealer_busted or player_total > dealer_total:
+            results[i] = GameResult.WIN
+        elif player_total == dealer_total:
+            results[i] = GameResult.PUSH
+        else:
+            results[i] = GameResult.LOSE
+
+    multipliers = payout_multipliers(rules)
+    payout = sum(int(b * multipliers[r]) for b, r in zip(bets, results))
+    return bets, results, payout, actions, dealer_total
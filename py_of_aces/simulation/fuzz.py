@@ -0,0 +1,354 @@
+"""
+Differential fuzzing of the simulation engines against BlackjackGame.
+
+Each case is a random rule set, a shoe of rank indices and a seed for the
+bets and actions. Every engine plays the shoe through to the reshuffle point
+(or until it runs dry) and must report the same bets, results, payouts and
+actions as BlackjackGame, round by round. A failing case is shrunk to the
+fewest cards that still disagree.
+
+    python -m py_of_aces.simulation.fuzz --rounds 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import Callable
+from ..game_logic import (
+    Action,
+    BlackjackDeck,
+    BlackjackGame,
+    GameState,
+    Modes,
+    Rules,
+)
+from .batch import TableBatch
+from .engine import RoundOutcome, play_round, ranks_to_cards
+from .shoe import RankShoe
+
+EXHAUSTED = "exhausted"
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    One fuzz input.
+
+    args:
+        rules: The table rules.
+        shoe: Rank indices in dealing order.
+        seed: Seeds the stream the bets and actions are drawn from, and
+        separately the continuous shuffler.
+    """
+
+    rules: Rules
+    shoe: tuple[int, ...]
+    seed: int
+
+    @property
+    def max_rounds(self) -> int:
+        # A continuous shuffler never reaches the reshuffle point
+        return max(1, len(self.shoe) // 4)
+
+    def shuffler_rng(self) -> random.Random:
+        return random.Random(self.seed + 1)
+
+    def describe(self) -> str:
+        ranks = "".join("A23456789TJQK"[rank] for rank in self.shoe)
+        return f"{self.rules}\nseed={self.seed} shoe={ranks}"
+
+
+@dataclass
+class Mismatch:
+    case: Case
+    engine: str
+    round_index: int
+    expected: object
+    actual: object
+
+    def describe(self) -> str:
+        return (
+            f"{self.engine} disagrees with BlackjackGame in round "
+            f"{self.round_index}\n{self.case.describe()}\n"
+            f"expected: {self.expected}\nactual:   {self.actual}"
+        )
+
+
+def _bet(rng: random.Random) -> int:
+    return 1 + int(rng.random() * 99)
+
+
+def _choose(rng: random.Random, legal: list[Action]) -> Action:
+    # One draw per decision whatever the number of choices, so engines that
+    # disagree on legality still consume the stream in step.
+    return legal[int(rng.random() * len(legal))]
+
+
+def run_reference(case: Case) -> list:
+    """Play a case through BlackjackGame."""
+    game = BlackjackGame(rules=case.rules)
+    game.select_mode(Modes.PRACTICE)
+    game.deck = BlackjackDeck.stacked(
+        ranks_to_cards(case.shoe), rules=case.rules, rng=case.shuffler_rng()
+    )
+    rng = random.Random(case.seed)
+    outcomes: list = []
+
+    while len(outcomes) < case.max_rounds:
+        try:
+            game.place_bet(_bet(rng))
+            game.deal_initial_cards()
+            while game.state == GameState.PLAYER_TURN:
+                action = _choose(rng, game.legal_actions)
+                if not game.apply(action):
+                    raise AssertionError(f"legal action {action} refused")
+        except ValueError:
+            outcomes.append(EXHAUSTED)
+            break
+
+        outcomes.append(
+            (
+                list(game.bets),
+                list(game.results),
+                game.get_winnings(),
+                game.actions,
+                game.dealer_hand.get_value(),
+            )
+        )
+        game.finish_round()
+        if game.will_reshuffle:
+            break
+
+        game.start_new_round()
+
+    return outcomes
+
+
+def run_fast(case: Case) -> list:
+    """Play a case through engine.play_round."""
+    rng = random.Random(case.seed)
+    shoe = RankShoe.stacked(case.shoe, case.rules, case.shuffler_rng())
+    outcomes: list = []
+
+    def choose(hard_total, has_ace, pair, upcard, legal: list[Action]) -> Action:
+        return _choose(rng, legal)
+
+    while len(outcomes) < case.max_rounds:
+        try:
+            outcome = play_round(shoe, _bet(rng), case.rules, choose)
+        except IndexError:
+            outcomes.append(EXHAUSTED)
+            break
+
+        outcomes.append(outcome)
+        if shoe.needs_reshuffle:
+            break
+
+        shoe.collect()
+
+    return outcomes
+
+
+def run_batch(case: Case) -> list:
+    """Play a case on a one-table TableBatch."""
+    rng = random.Random(case.seed)
+    batch = TableBatch(1, case.rules)
+    shoe = batch.shoes[0] = RankShoe.stacked(case.shoe, case.rules, case.shuffler_rng())
+    outcomes: list = []
+
+    while len(outcomes) < case.max_rounds:
+        actions = []
+        try:
+            batch.deal([_bet(rng)])
+            while batch.states[0] == GameState.PLAYER_TURN.value:
+                action = _choose(rng, batch.decision(0)[4])
+                actions.append((batch.current[0], action))
+                batch.step([action])
+        except IndexError:
+            outcomes.append(EXHAUSTED)
+            break
+
+        bets, results = batch.hand_results(0)
+        outcomes.append(
+            (bets, results, batch.payouts[0], actions, batch.dealer_totals[0])
+        )
+        if shoe.needs_reshuffle:
+            break
+
+        batch.finish_round()
+
+    return outcomes
+
+
+# Engine name -> runner checked against run_reference
+engines: dict[str, Callable[[Case], list[RoundOutcome | str]]] = {
+    "fast": run_fast,
+    "batch": run_batch,
+}
+
+
+def random_case(seed: int) -> Case:
+    """Random rules and shoe. Half the shoes are drawn from one to three ranks,
+    which makes pairs, resplits and odd totals common."""
+    rng = random.Random(seed)
+    rules = Rules(
+        num_decks=rng.randint(1, 8),
+        penetration=rng.choice([0.5, 0.75, 0.9, 1.0]),
+        dealer_hits_soft_17=rng.random() < 0.5,
+        dealer_stand_value=rng.choice([16, 17, 17, 17, 18]),
+        blackjack_payout=rng.choice([1.5, 1.2, 1.0]),
+        double_after_split=rng.random() < 0.5,
+        resplit_aces=rng.random() < 0.5,
+        surrender=rng.random() < 0.5,
+        max_splits=rng.randint(0, 4),
+        continuous_shuffle=rng.random() < 0.25,
+    )
+
+    if rng.random() < 0.5:
+        shoe = list(range(13)) * 4 * rules.num_decks
+        rng.shuffle(shoe)
+    else:
+        ranks = rng.sample(range(13), rng.randint(1, 3))
+        shoe = [rng.choice(ranks) for _ in range(rules.shoe_size)]
+
+    return Case(rules, tuple(shoe), rng.getrandbits(32))
+
+
+def _outcomes(runner: Callable[[Case], list], case: Case) -> list:
+    try:
+        return runner(case)
+    except Exception as error:
+        return [f"raised {error!r}"]
+
+
+def compare(case: Case, engine: str, expected: list = None) -> Mismatch | None:
+    """
+    Run case through the reference and engine, returning the first difference.
+
+    args:
+        expected: The reference outcomes, if already known.
+    """
+    if expected is None:
+        expected = _outcomes(run_reference, case)
+    actual = _outcomes(engines[engine], case)
+
+    for index in range(max(len(expected), len(actual))):
+        want = expected[index] if index < len(expected) else None
+        got = actual[index] if index < len(actual) else None
+        if want != got:
+            return Mismatch(case, engine, index, want, got)
+
+    return None
+
+
+def shrink(case: Case, engine: str) -> Case:
+    """
+    Delta-debug the shoe of a failing case: drop ever smaller chunks of
+    cards while the engine still disagrees with the reference.
+    """
+    shoe = list(case.shoe)
+
+    def fails(candidate: list[int]) -> bool:
+        return compare(replace(case, shoe=tuple(candidate)), engine) is not None
+
+    chunks = 2
+    while len(shoe) >= 2:
+        size = -(-len(shoe) // chunks)
+        for start in range(0, len(shoe), size):
+            candidate = shoe[:start] + shoe[start + size :]
+            if fails(candidate):
+                shoe = candidate
+                chunks = max(chunks - 1, 2)
+                break
+        else:
+            if size == 1:
+                break
+            chunks = min(chunks * 2, len(shoe))
+
+    return replace(case, shoe=tuple(shoe))
+
+
+def fuzz_seeds(seeds: range, engine_names: list[str]) -> tuple[int, list[tuple]]:
+    """
+    Compare the engines on the cases generated from seeds.
+
+    Returns:
+        Rounds played and (seed, engine) for every failing case.
+    """
+    rounds = 0
+    failures = []
+    for seed in seeds:
+        case = random_case(seed)
+        expected = _outcomes(run_reference, case)
+        rounds += len(expected)
+        for name in engine_names:
+            if compare(case, name, expected):
+                failures.append((seed, name))
+
+    return rounds, failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Fuzz the simulation engines against BlackjackGame"
+    )
+    parser.add_argument("--rounds", type=int, default=100_000, help="rounds to play")
+    parser.add_argument("--seconds", type=float, help="stop after this long")
+    parser.add_argument("--seed", type=int, default=0, help="first case seed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch", type=int, default=200, help="cases per task")
+    parser.add_argument(
+        "--engine", action="append", choices=sorted(engines), help="default: all"
+    )
+    args = parser.parse_args(argv)
+    engine_names = args.engine or sorted(engines)
+
+    started = time.perf_counter()
+    deadline = started + args.seconds if args.seconds else float("inf")
+    rounds = 0
+    failures: list[tuple] = []
+    next_seed = args.seed
+
+    def more() -> bool:
+        return not failures and rounds < args.rounds and time.perf_counter() < deadline
+
+    with ProcessPoolExecutor(args.workers) as pool:
+        pending = set()
+        while True:
+            # Keep every worker busy with one batch queued behind it
+            while more() and len(pending) < args.workers * 2:
+                seeds = range(next_seed, next_seed + args.batch)
+                pending.add(pool.submit(fuzz_seeds, seeds, engine_names))
+                next_seed += args.batch
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch_rounds, batch_failures = future.result()
+                rounds += batch_rounds
+                failures += batch_failures
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"{rounds} rounds in {elapsed:.1f}s ({rounds / elapsed:,.0f} rounds/s), "
+        f"{len(failures)} failing cases"
+    )
+
+    if not failures:
+        return 0
+
+    seed, name = min(failures)
+    case = shrink(random_case(seed), name)
+    print(f"case seed {seed}, shrunk to {len(case.shoe)} cards:")
+    print(compare(case, name).describe())
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+Count-based deviation indices from composition-dependent EVs.
+
+For every starting hand against every upcard, the shoe is skewed to each
+Hi-Lo true count in a range (low cards swapped for tens and aces, or the
+reverse) and every action is valued exactly with game_logic.ev. The best
+action per count is turned into a chart code, and the counts where it
+changes become the index breakpoints of an IndexTable.
+
+Cells are computed in parallel and cached in a JSON file keyed by the rules,
+so an interrupted or repeated run only computes what is missing.
+
+    python -m py_of_aces.simulation.indices --decks 6 --output indices.json
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ..game_logic.blackjack_game import Action
+from ..game_logic.deck import full_shoe_counts
+from ..game_logic.ev import action_evs
+from ..game_logic.rules import Rules
+from ..game_logic.strategy import IndexTable
+
+# Card indices (point value - 1) Hi-Lo counts as low and high cards; four
+# tens to every ace keeps the high cards in shoe proportion.
+low_cycle = (1, 2, 3, 4, 5)
+high_cycle = (9, 9, 9, 9, 0)
+
+
+def hand_cases() -> list[tuple[str, int, tuple[int, int]]]:
+    """(kind, total or pair points, representative two cards) to index."""
+    cases = []
+    for total in range(8, 18):
+        if total <= 11:
+            low = total // 2 - 1 if total % 2 == 0 else total // 2
+            cards = (total - low, low)
+        else:
+            cards = (10, total - 10)
+        cases.append(("hard", total, cards))
+
+    for total in range(13, 21):
+        cases.append(("soft", total, (1, total - 11)))
+
+    for points in range(1, 11):
+        cases.append(("pair", points, (points, points)))
+
+    return cases
+
+
+def skewed_counts(rules: Rules, true_count: int, decks_left: int) -> list[int]:
+    """
+    The unseen cards of a shoe with decks_left decks remaining at a Hi-Lo
+    true count, before the player's and dealer's cards are removed.
+    """
+    counts = list(full_shoe_counts(decks_left))
+    swaps = round(true_count * decks_left / 2)
+    step = 1 if swaps > 0 else -1
+    for i in range(abs(swaps)):
+        counts[low_cycle[i % len(low_cycle)]] -= step
+        counts[high_cycle[i % len(high_cycle)]] += step
+
+    if min(counts) < 0:
+        raise ValueError(f"True count {true_count} is out of reach")
+    return counts
+
+
+def best_code(evs: dict[Action, float], pair: bool) -> str:
+    """The chart code of the best action."""
+    best = max(evs, key=evs.__getitem__)
+    if pair:
+        return "P" if best is Action.SPLIT else "-"
+
+    match best:
+        case Action.STAND:
+            return "S"
+        case Action.DOUBLE:
+            return "D" if evs[Action.HIT] >= evs[Action.STAND] else "d"
+        case Action.SURRENDER:
+            return "R"
+
+    return "H"
+
+
+def cell_codes(
+    rules: Rules,
+    kind: str,
+    cards: tuple[int, int],
+    upcard: int,
+    counts_range: range,
+    decks_left: int,
+) -> list[str]:
+    """The best code at every true count in counts_range."""
+    legal = [Action.HIT, Action.STAND, Action.DOUBLE]
+    if kind == "pair":
+        legal.append(Action.SPLIT)
+    if rules.surrender:
+        legal.append(Action.SURRENDER)
+
+    hard_total = sum(cards)
+    has_ace = 1 in cards
+    pair = cards[0] if kind == "pair" else None
+
+    codes = []
+    for true_count in counts_range:
+        counts = skewed_counts(rules, true_count, decks_left)
+        for points in (*cards, upcard):
+            counts[points - 1] -= 1
+
+        evs = action_evs(hard_total, has_ace, pair, counts, upcard, rules, legal)
+        codes.append(best_code(evs, kind == "pair"))
+
+    return codes
+
+
+def breakpoints(codes: list[str], counts_range: range) -> list[tuple]:
+    """Collapse per-count codes into IndexTable breakpoints."""
+    cell: list[tuple] = [(None, codes[0])]
+    for true_count, code in zip(counts_range, codes):
+        if code != cell[-1][1]:
+            cell.append((true_count, code))
+    return cell
+
+
+def cache_key(rules: Rules, decks_left: int, counts_range: range) -> str:
+    return json.dumps(
+        [dataclasses.asdict(rules), decks_left, counts_range.start, counts_range.stop]
+    )
+
+
+def generate(
+    rules: Rules,
+    counts_range: range = range(-10, 11),
+    decks_left: int = None,
+    workers: int = 1,
+    cache: dict = None,
+    on_cell=None,
+) -> IndexTable:
+    """
+    Build the index table for rules.
+
+    args:
+        rules: The table rules.
+        counts_range: True counts to evaluate.
+        decks_left: Decks remaining the counts are taken at, half the shoe
+        by default.
+        workers: Processes computing cells in parallel.
+        cache: Computed cells by cell name, read and filled in.
+        on_cell: Called with the cell name after each new cell.
+    """
+    decks_left = decks_left or max(1, rules.num_decks // 2)
+    cache = {} if cache is None else cache
+
+    tasks = {}
+    for kind, key, cards in hand_cases():
+        for upcard in range(1, 11):
+            name = f"{kind} {key} {upcard}"
+            if name not in cache:
+                tasks[name] = (rules, kind, cards, upcard, counts_range, decks_left)
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            futures = {
+                pool.submit(cell_codes, *task): name for name, task in tasks.items()
+            }
+            for future in as_completed(futures):
+                cache[futures[future]] = future.result()
+                if on_cell:
+                    on_cell(futures[future])
+    else:
+        for name, task in tasks.items():
+            cache[name] = cell_codes(*task)
+            if on_cell:
+                on_cell(name)
+
+    cells = {}
+    for name, codes in cache.items():
+        kind, key, upcard = name.split()
+        cells[(kind, int(key), int(upcard))] = breakpoints(codes, counts_range)
+    return IndexTable(cells)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Generate count deviation indices")
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--h17", action="store_true", help="dealer hits soft 17")
+    parser.add_argument("--surrender", action="store_true")
+    parser.add_argument("--no-das", action="store_true")
+    parser.add_argument("--min-count", type=int, default=-10)
+    parser.add_argument("--max-count", type=int, default=10)
+    parser.add_argument("--decks-left", type=int, help="default: half the shoe")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--cache", metavar="FILE", help="cell cache, JSON")
+    parser.add_argument("--output", metavar="FILE", default="indices.json")
+    args = parser.parse_args(argv)
+
+    rules = Rules(
+        num_decks=args.decks,
+        dealer_hits_soft_17=args.h17,
+        surrender=args.surrender,
+        double_after_split=not args.no_das,
+    )
+    counts_range = range(args.min_count, args.max_count + 1)
+
+    caches = {}
+    if args.cache and os.path.exists(args.cache):
+        with open(args.cache) as file:
+            caches = json.load(file)
+    key = cache_key(
+        rules, args.decks_left or max(1, rules.num_decks // 2), counts_range
+    )
+    cache = caches.setdefault(key, {})
+    done = len(cache)
+
+    def save_cache(name: str) -> None:
+        print(f"\r{len(cache)} cells", end="", flush=True)
+        # Saving every cell keeps an interrupted run's work
+        if args.cache:
+            with open(args.cache, "w") as file:
+                json.dump(caches, file)
+
+    table = generate(
+        rules, counts_range, args.decks_left, args.workers, cache, save_cache
+    )
+    print(f"\r{len(cache)} cells, {len(cache) - done} computed")
+
+    with open(args.output, "w") as file:
+        json.dump(
+            {"rules": dataclasses.asdict(rules), **table.to_dict()}, file, indent=1
+        )
+
+    deviations = [
+        (kind, key, upcard, cell)
+        for (kind, key, upcard), cell in sorted(table.cells.items())
+        if len(cell) > 1
+    ]
+    print(f"{len(deviations)} cells change with the count, written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
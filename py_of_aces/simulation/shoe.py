@@ -0,0 +1,97 @@
+import random
+from typing import Iterator, Sequence
+from ..game_logic.deck import BlackjackDeck
+from ..game_logic.rules import Rules
+
+# Rank of each card index (suit * 13 + rank)
+rank_of_index: tuple[int, ...] = tuple(range(13)) * 4
+
+
+class RankShoe:
+    """
+    The simulation engine's counterpart of BlackjackDeck.
+
+    Cards are rank indices into BlackjackDeck.ranks (0 is an ace, 12 a king).
+    The dealing order, reshuffle point and continuous shuffling match
+    BlackjackDeck card for card given the same rng or pre-shuffled shoes.
+    """
+
+    def __init__(
+        self,
+        shuffle: bool = True,
+        rules: Rules = None,
+        rng: random.Random = None,
+        shoes: Iterator[Sequence[int]] = None,
+    ):
+        self.rules = rules or Rules()
+        self.rng = rng or random.Random()
+        self.shoes = shoes
+        self.cards: list[int] = []
+        self.in_play: list[int] = []
+        self.shuffles = 0
+
+        self.reset_deck(shuffle=shuffle)
+
+    @classmethod
+    def stacked(
+        cls, ranks: Sequence[int], rules: Rules = None, rng: random.Random = None
+    ) -> "RankShoe":
+        """A shoe that deals ranks in the given order."""
+        shoe = cls(shuffle=False, rules=rules, rng=rng)
+        shoe.cards = list(ranks)[::-1]
+        return shoe
+
+    def reset_deck(self, shuffle: bool = True) -> None:
+        """Reset to a full shoe, taking the next pre-shuffled one if any."""
+        if shuffle and self.shoes is not None:
+            shoe = next(self.shoes)
+            if len(shoe) != self.rules.shoe_size:
+                raise ValueError(
+                    f"Shoe of {len(shoe)} cards for a {self.rules.shoe_size} card shoe"
+                )
+
+            self.cards = list(map(rank_of_index.__getitem__, shoe))
+            self.in_play = []
+            self.shuffles += 1
+            return
+
+        self.cards = list(range(len(BlackjackDeck.ranks))) * (
+            len(BlackjackDeck.suits) * self.rules.num_decks
+        )
+        self.in_play = []
+        if shuffle:
+            self.rng.shuffle(self.cards)
+            self.shuffles += 1
+
+    def deal(self) -> int:
+        """
+        Deal one card.
+
+        Raises:
+            IndexError: The shoe is empty.
+        """
+        card = self.cards.pop()
+        self.in_play.append(card)
+        return card
+
+    def collect(self) -> None:
+        """Clear the round's cards, see BlackjackDeck.collect."""
+        if self.rules.continuous_shuffle:
+            cards = self.cards
+            randrange = self.rng.randrange
+            for card in self.in_play:
+                cards.append(card)
+                position = randrange(len(cards))
+                cards[position], cards[-1] = cards[-1], cards[position]
+
+        self.in_play = []
+
+    @property
+    def needs_reshuffle(self) -> bool:
+        if self.rules.continuous_shuffle:
+            return False
+
+        return len(self.cards) < self.rules.reshuffle_at
+
+    def __len__(self) -> int:
+        return len(self.cards)
@@ -0,0 +1,109 @@
+"""
+A file of pre-shuffled shoes shared by simulation workers.
+
+Each shoe is stored as one row of card indices (suit * 13 + rank), one byte
+per card, with the first card to deal last: the order BlackjackDeck and
+RankShoe keep their cards in. The file is memory-mapped read-only, so any
+number of processes share one copy in the page cache and read rows as
+memoryviews without copying, shuffling or pickling. The same file replays
+identical shoes across experiments.
+
+    python -m py_of_aces.simulation.shoe_bank shoes.bin --decks 6 --count 100000
+"""
+
+import argparse
+import itertools
+import mmap
+import random
+import struct
+from typing import Iterator
+from ..game_logic.rules import Rules
+
+MAGIC = b"POASHOE1"
+# Magic, decks per shoe, number of shoes
+_header = struct.Struct("<8sHI")
+
+
+class ShoeBank:
+    """
+    A read-only, memory-mapped shoe bank. Open it with ShoeBank(path) and
+    build one with ShoeBank.create.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.num_decks, self.count = _header.unpack_from(self.__map)
+        if magic != MAGIC:
+            self.__map.close()
+            raise ValueError(f"{path} is not a shoe bank")
+
+        self.shoe_size = self.num_decks * 52
+        self.__rows = memoryview(self.__map)[_header.size :]
+
+    @classmethod
+    def create(
+        cls, path: str, num_decks: int, count: int, seed: int = None
+    ) -> "ShoeBank":
+        """Write count shuffled shoes of num_decks decks to path and open it."""
+        rng = random.Random(seed)
+        shoe = bytearray(range(52)) * num_decks
+
+        with open(path, "wb") as file:
+            file.write(_header.pack(MAGIC, num_decks, count))
+            for _ in range(count):
+                rng.shuffle(shoe)
+                file.write(shoe)
+
+        return cls(path)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def shoe(self, index: int) -> memoryview:
+        """Row index as a zero-copy view."""
+        start = (index % self.count) * self.shoe_size
+        return self.__rows[start : start + self.shoe_size]
+
+    def stream(self, start: int = 0, step: int = 1) -> Iterator[memoryview]:
+        """
+        Endless shoes start, start + step, ... wrapping around the bank.
+
+        Worker k of n takes stream(k, n) for shoes no other worker plays;
+        runs that should see the same shoes take the same stream.
+        """
+        for index in itertools.count(start, step):
+            yield self.shoe(index)
+
+    def matches(self, rules: Rules) -> bool:
+        return rules.num_decks == self.num_decks
+
+    def close(self) -> None:
+        """Unmap the file. Views handed out must be released first."""
+        self.__rows.release()
+        self.__map.close()
+
+    def __enter__(self) -> "ShoeBank":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Build a pre-shuffled shoe bank")
+    parser.add_argument("path")
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    with ShoeBank.create(args.path, args.decks, args.count, args.seed) as bank:
+        size = bank.count * bank.shoe_size / 2**20
+        print(f"wrote {bank.count} {bank.num_decks}-deck shoes ({size:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
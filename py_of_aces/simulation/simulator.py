@@ -0,0 +1,188 @@
+"""
+Monte Carlo simulation of a playing strategy with a Hi-Lo counter.
+
+Every round is played with the strategy (basic strategy by default) and
+recorded twice: flat at one unit, and with a bet ramped by the true count
+the counter saw before the deal. Comparing the two measures how much a
+count is worth under a rule set, for example with and without a continuous
+shuffler.
+"""
+
+import math
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Sequence
+from ..game_logic.blackjack_game import Action
+from ..game_logic.dealer import dealer_should_hit, hand_value
+from ..game_logic.histogram import OutcomeHistograms
+from ..game_logic.rules import Rules
+from ..game_logic.session_stats import SessionStats
+from ..game_logic.strategy import IndexTable, basic_action
+from .engine import play_round
+from .shoe import RankShoe
+
+# Hi-Lo tag per rank index, ace first
+hi_lo_tags: tuple[int, ...] = (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1)
+
+# Chooses actions for play_round, see its `choose` argument
+Player = Callable[[int, bool, int | None, int, list[Action]], Action]
+
+
+def basic_player(rules: Rules) -> Player:
+    def choose(hard_total, has_ace, pair, upcard, legal) -> Action:
+        return basic_action(hard_total, has_ace, pair, upcard, legal, rules)
+
+    return choose
+
+
+def mimic_dealer_player(rules: Rules) -> Player:
+    """Hits and stands like the dealer, never doubles or splits."""
+
+    def choose(hard_total, has_ace, pair, upcard, legal) -> Action:
+        total, soft = hand_value(hard_total, has_ace)
+        return Action.HIT if dealer_should_hit(total, soft, rules) else Action.STAND
+
+    return choose
+
+
+def never_bust_player(rules: Rules) -> Player:
+    """Stands on any total that could bust, doubles 10 and 11."""
+
+    def choose(hard_total, has_ace, pair, upcard, legal) -> Action:
+        total, soft = hand_value(hard_total, has_ace)
+        if total in (10, 11) and not soft and Action.DOUBLE in legal:
+            return Action.DOUBLE
+
+        return Action.HIT if total < 12 or soft and total < 18 else Action.STAND
+
+    return choose
+
+
+# Strategy name -> builds a player for a rule set
+strategies: dict[str, Callable[[Rules], Player]] = {
+    "basic": basic_player,
+    "mimic-dealer": mimic_dealer_player,
+    "never-bust": never_bust_player,
+}
+
+
+@dataclass
+class SimulationResult:
+    """
+    args:
+        rules: The rules simulated.
+        unit: Money per betting unit.
+        flat: Results betting one unit every round.
+        spread: Results betting the true count in units, 1 to the spread.
+        by_true_count: Flat results by true count (floored) before the deal.
+        histograms: Distributions of the flat net per round, the flat
+        bankroll since the first round and the dealer's final totals.
+        seconds: Wall time taken.
+    """
+
+    rules: Rules
+    unit: int
+    flat: SessionStats = field(default_factory=SessionStats)
+    spread: SessionStats = field(default_factory=SessionStats)
+    by_true_count: dict[int, SessionStats] = field(
+        default_factory=lambda: defaultdict(SessionStats)
+    )
+    histograms: OutcomeHistograms = field(default_factory=OutcomeHistograms)
+    seconds: float = 0.0
+
+    @property
+    def rounds_per_second(self) -> float:
+        return self.flat.rounds / self.seconds if self.seconds else 0.0
+
+    def share_at(self, true_count: int) -> float:
+        """Fraction of rounds dealt at or above true_count."""
+        if not self.flat.rounds:
+            return 0.0
+
+        rounds = sum(
+            stats.rounds
+            for count, stats in self.by_true_count.items()
+            if count >= true_count
+        )
+        return rounds / self.flat.rounds
+
+
+def simulate(
+    rules: Rules,
+    rounds: int,
+    seed: int = None,
+    spread: int = 8,
+    unit: int = 10,
+    shoes: Iterator[Sequence[int]] = None,
+    strategy: str = "basic",
+    indices: IndexTable = None,
+) -> SimulationResult:
+    """
+    Play rounds with basic strategy on a fresh shoe.
+
+    args:
+        rules: The table rules.
+        rounds: Number of rounds to play.
+        seed: Seeds the shuffles, for reproducible runs.
+        spread: Largest bet, in units.
+        unit: Money per unit. Keep it even so 3:2 payouts stay whole.
+        shoes: Pre-shuffled shoes, such as ShoeBank.stream(), used instead of
+        shuffling.
+        strategy: A name from `strategies`.
+        indices: Count deviations played instead of the strategy, at the true
+        count before the deal.
+    """
+    shoe = RankShoe(rules=rules, rng=random.Random(seed), shoes=shoes)
+    result = SimulationResult(rules, unit)
+    tags = hi_lo_tags
+    running = 0
+    true_count = 0.0
+    bankroll = 0
+
+    if indices is None:
+        choose = strategies[strategy](rules)
+    else:
+
+        def choose(hard_total, has_ace, pair, upcard, legal) -> Action:
+            return indices.action(
+                hard_total, has_ace, pair, upcard, true_count, legal, rules
+            )
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        decks_left = max(len(shoe) / 52, 0.5)
+        true_count = running / decks_left
+        units = min(max(int(true_count), 1), spread)
+
+        bets, results, payout, actions, dealer_total = play_round(
+            shoe, unit, rules, choose
+        )
+        net = payout - sum(bets)
+        doubles = sum(action is Action.DOUBLE for _, action in actions)
+        splits = len(bets) - 1
+
+        result.flat.record_round(net, unit, results, doubles, splits)
+        result.spread.record_round(
+            net * units, unit * units, results, doubles, splits
+        )
+        result.by_true_count[math.floor(true_count)].record_round(
+            net, unit, results, doubles, splits
+        )
+
+        bankroll += net
+        result.histograms.record_round(net, bankroll, dealer_total)
+
+        seen = sum(tags[card] for card in shoe.in_play)
+        running += seen
+        shoe.collect()
+        if rules.continuous_shuffle:
+            # The cards went back in the shoe, taking their count with them
+            running -= seen
+        elif shoe.needs_reshuffle:
+            shoe.reset_deck()
+            running = 0
+
+    result.seconds = time.perf_counter() - started
+    return result
@@ -0,0 +1,370 @@
+"""
+Tournament of strategy and betting bots on shared shoes.
+
+Every table seats all the bots at BlackjackGame instances dealing from one
+shoe, so the cards one bot takes are gone for the next and a counting bot
+reads the whole table. Seats play their rounds against the dealer in turn,
+the order rotating every round so no bot keeps the first seat.
+
+Tables are batches of rounds on fresh shoes, each seeded from the tournament
+seed and its index and merged in index order, so a seeded tournament gives
+the same leaderboard with any number of workers. Per-bot stats stream back
+as tables finish.
+
+    python -m py_of_aces.simulation.tournament basic basic:hi-lo never-bust:martingale
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Callable
+from ..game_logic.blackjack_game import BlackjackGame, GameState
+from ..game_logic.deck import BlackjackDeck
+from ..game_logic.game_modes import Modes
+from ..game_logic.histogram import LogHistogram
+from ..game_logic.rules import Rules
+from ..game_logic.running_stats import RunningStats
+from .simulator import hi_lo_tags, strategies
+
+# Picks the next bet in units, called as bet(true_count, last_net) with the
+# table's Hi-Lo true count and the bot's net result last round, in units
+Bettor = Callable[[float, float], int]
+
+
+def flat_bettor(spread: int) -> Bettor:
+    def bet(true_count: float, last_net: float) -> int:
+        return 1
+
+    return bet
+
+
+def hi_lo_bettor(spread: int) -> Bettor:
+    """Bets the true count in units, 1 to the spread."""
+
+    def bet(true_count: float, last_net: float) -> int:
+        return min(max(int(true_count), 1), spread)
+
+    return bet
+
+
+def martingale_bettor(spread: int) -> Bettor:
+    """Doubles after every loss up to the spread, back to 1 after anything else."""
+    units = 1
+
+    def bet(true_count: float, last_net: float) -> int:
+        nonlocal units
+        units = min(units * 2, spread) if last_net < 0 else 1
+        return units
+
+    return bet
+
+
+# Betting name -> builds a bettor for a bet spread
+bettors: dict[str, Callable[[int], Bettor]] = {
+    "flat": flat_bettor,
+    "hi-lo": hi_lo_bettor,
+    "martingale": martingale_bettor,
+}
+
+
+@dataclass(frozen=True)
+class Bot:
+    """
+    A playing strategy and a betting scheme.
+
+    args:
+        name: Label on the leaderboard.
+        strategy: A name from simulator.strategies.
+        betting: A name from bettors.
+    """
+
+    name: str
+    strategy: str = "basic"
+    betting: str = "flat"
+
+    @classmethod
+    def parse(cls, spec: str) -> "Bot":
+        """Build a bot from "strategy[:betting]", e.g. "basic:hi-lo"."""
+        strategy, _, betting = spec.partition(":")
+        betting = betting or "flat"
+        if strategy not in strategies:
+            raise ValueError(f"Unknown strategy {strategy!r}")
+        if betting not in bettors:
+            raise ValueError(f"Unknown betting {betting!r}")
+
+        return cls(f"{strategy}:{betting}", strategy, betting)
+
+
+@dataclass
+class BotStats:
+    """
+    A bot's results, mergeable across tables.
+
+    args:
+        results: Net result per round, in units.
+        wagered: Initial bets placed, in units.
+        distribution: Histogram of the net result per round, in units.
+    """
+
+    results: RunningStats = field(default_factory=RunningStats)
+    wagered: float = 0.0
+    distribution: LogHistogram = field(
+        default_factory=lambda: LogHistogram(smallest=0.5, largest=1e4)
+    )
+
+    def add(self, net: float, units: int) -> None:
+        self.results.add(net)
+        self.wagered += units
+        self.distribution.add(net)
+
+    def merge(self, other: "BotStats") -> None:
+        self.results.merge(other.results)
+        self.wagered += other.wagered
+        self.distribution.merge(other.distribution)
+
+    @property
+    def edge(self) -> float:
+        """Net result per unit of initial bet."""
+        if not self.wagered:
+            return 0.0
+
+        return self.results.mean * self.results.count / self.wagered
+
+    def interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        """Confidence interval on the net result per round, in units."""
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        margin = z * self.results.std_error
+        return self.results.mean - margin, self.results.mean + margin
+
+
+def play_table(
+    rules: Rules,
+    bots: list[Bot],
+    rounds: int,
+    seed: int,
+    spread: int = 8,
+    unit: int = 10,
+) -> list[BotStats]:
+    """
+    Seat every bot at one table and play rounds from a fresh shoe.
+
+    args:
+        rules: The table rules.
+        bots: One seat per bot.
+        rounds: Rounds every bot plays.
+        seed: Seeds the shoe.
+        spread: Largest bet, in units.
+        unit: Money per unit. Keep it even so 3:2 payouts stay whole.
+
+    Returns:
+        Stats per bot, in the order of bots.
+    """
+    deck = BlackjackDeck(rules=rules, rng=random.Random(seed))
+    seats = []
+    for bot in bots:
+        game = BlackjackGame(rules=rules, deck=deck)
+        game.select_mode(Modes.PRACTICE)
+        player = strategies[bot.strategy](rules)
+        seats.append((game, player, bettors[bot.betting](spread)))
+
+    stats = [BotStats() for _ in bots]
+    last_nets = [0.0] * len(bots)
+    tags = hi_lo_tags
+    running = 0
+
+    for round_index in range(rounds):
+        for offset in range(len(seats)):
+            seat = (round_index + offset) % len(seats)
+            game, player, bettor = seats[seat]
+
+            decks_left = max(len(deck) / 52, 0.5)
+            units = bettor(running / decks_left, last_nets[seat])
+            game.place_bet(units * unit)
+            game.deal_initial_cards()
+
+            upcard = game.dealer_hand.cards[0].points
+            while game.state == GameState.PLAYER_TURN:
+                hand = game.current_hand
+                pair = hand.cards[0].points if hand.can_split else None
+                legal = game.legal_actions
+                game.apply(player(hand.hard_total, hand.aces > 0, pair, upcard, legal))
+
+            net = (game.get_winnings() - game.total_bet) / unit
+            stats[seat].add(net, units)
+            last_nets[seat] = net
+
+            seen = sum(tags[card.index % 13] for card in deck.in_play)
+            game.finish_round()
+            game.start_new_round()
+            if rules.continuous_shuffle:
+                # The cards went back in the shoe, taking their count with them
+                continue
+            running = 0 if len(deck) == rules.shoe_size else running + seen
+
+    return stats
+
+
+def run_tournament(
+    bots: list[Bot],
+    rules: Rules,
+    rounds: int,
+    table_rounds: int = 5_000,
+    seed: int = None,
+    workers: int = 1,
+    spread: int = 8,
+    unit: int = 10,
+    progress: Callable[[int, int, list[BotStats]], None] = None,
+) -> list[BotStats]:
+    """
+    Play rounds per bot over as many tables as it takes.
+
+    args:
+        bots: The entrants, each taking a seat at every table.
+        rules: The table rules.
+        rounds: Rounds every bot plays in all.
+        table_rounds: Rounds per table, the granularity of progress.
+        seed: Seeds the tables, for reproducible tournaments.
+        workers: Processes playing tables in parallel.
+        spread: Largest bet, in units.
+        unit: Money per unit.
+        progress: Called as progress(tables done, tables, stats) after every
+        table is merged.
+
+    Returns:
+        Stats per bot, in the order of bots.
+    """
+    seed = random.randrange(2**32) if seed is None else seed
+    tables = math.ceil(rounds / table_rounds)
+    totals = [BotStats() for _ in bots]
+
+    def table_args(index: int) -> tuple:
+        table_seed = hash((seed, index)) & 0xFFFFFFFF
+        size = min(table_rounds, rounds - index * table_rounds)
+        return rules, bots, size, table_seed, spread, unit
+
+    def merge(index: int, stats: list[BotStats]) -> None:
+        for total, table in zip(totals, stats):
+            total.merge(table)
+        if progress:
+            progress(index + 1, tables, totals)
+
+    if workers <= 1:
+        for index in range(tables):
+            merge(index, play_table(*table_args(index)))
+        return totals
+
+    with ProcessPoolExecutor(workers) as pool:
+        pending = []
+        submitted = 0
+        for index in range(tables):
+            # Keep a table queued behind every worker
+            while submitted < tables and len(pending) < workers * 2:
+                pending.append(pool.submit(play_table, *table_args(submitted)))
+                submitted += 1
+
+            merge(index, pending.pop(0).result())
+
+    return totals
+
+
+def leaderboard(
+    bots: list[Bot], stats: list[BotStats], confidence: float = 0.95
+) -> list[str]:
+    """
+    Bots ranked by net result per round, with its confidence interval and
+    the worst 1% of rounds.
+    """
+    ranked = sorted(
+        zip(bots, stats), key=lambda entry: entry[1].results.mean, reverse=True
+    )
+    lines = [
+        f"{'#':>2} {'bot':<24} {'rounds':>9} {'net/round':>10} "
+        f"{f'{confidence:.0%} CI':>21} {'edge':>8} {'SD':>6} {'1%':>6}"
+    ]
+    for place, (bot, bot_stats) in enumerate(ranked, 1):
+        results = bot_stats.results
+        low, high = bot_stats.interval(confidence)
+        lines.append(
+            f"{place:>2} {bot.name:<24} {results.count:>9,} {results.mean:>+10.4f} "
+            f"[{low:>+8.4f}, {high:>+8.4f}] {bot_stats.edge:>+8.3%} "
+            f"{results.std_dev:>6.2f} {bot_stats.distribution.quantile(0.01):>+6.1f}"
+        )
+
+    return lines
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Play strategy and betting bots against each other on shared shoes"
+    )
+    parser.add_argument(
+        "bots",
+        nargs="+",
+        metavar="BOT",
+        help=f"strategy[:betting] (strategies: {', '.join(strategies)}; "
+        f"betting: {', '.join(bettors)})",
+    )
+    parser.add_argument("--rounds", type=int, default=100_000, help="per bot")
+    parser.add_argument("--table-rounds", type=int, default=5_000)
+    parser.add_argument("--spread", type=int, default=8)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--decks", type=int, default=6)
+    parser.add_argument("--penetration", type=float, default=0.75)
+    parser.add_argument("--h17", action="store_true", help="dealer hits soft 17")
+    parser.add_argument("--surrender", action="store_true")
+    args = parser.parse_args(argv)
+
+    try:
+        bots = [Bot.parse(spec) for spec in args.bots]
+    except ValueError as error:
+        parser.error(str(error))
+
+    names = [bot.name for bot in bots]
+    if len(set(names)) != len(names):
+        parser.error("Every bot must be different")
+
+    rules = Rules(
+        num_decks=args.decks,
+        penetration=args.penetration,
+        dealer_hits_soft_17=args.h17,
+        surrender=args.surrender,
+    )
+    seed = random.randrange(2**32) if args.seed is None else args.seed
+
+    def show(done: int, tables: int, stats: list[BotStats]) -> None:
+        leader = max(range(len(bots)), key=lambda i: stats[i].results.mean)
+        print(
+            f"\rtable {done}/{tables}  {stats[0].results.count:,} rounds per bot  "
+            f"leader {bots[leader].name} {stats[leader].results.mean:+.4f}/round",
+            end="",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    started = time.perf_counter()
+    stats = run_tournament(
+        bots,
+        rules,
+        args.rounds,
+        table_rounds=args.table_rounds,
+        seed=seed,
+        workers=args.workers,
+        spread=args.spread,
+        progress=show,
+    )
+    print(file=sys.stderr)
+
+    print(f"seed {seed}, {time.perf_counter() - started:.1f}s, net in units per round")
+    print("\n".join(leaderboard(bots, stats, args.confidence)))
+
+
+if __name__ == "__main__":
+    main()
@@ -90,6 +90,9 @@ class TuiHandler:
         while self.running:
             key = self.term.inkey(timeout=0.2)
             if not key:
+                # Results computed in the background show up without a key press
+                if self.active_window.is_stale():
+                    self.active_window.render()
                 continue
 
             self.active_window.handle_input(key.name or key)
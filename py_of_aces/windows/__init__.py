@@ -1,5 +1,25 @@
-from .menu_win import *
-from .game_win import *
-from .betting_win import *
-from .size_warning import *
-from .utils import *
+from importlib import import_module
+
+# Window classes are imported on first access
+lazy_names: dict[str, str] = {
+    "MenuWindow": "menu_win",
+    "GameWindow": "game_win",
+    "result_text_mapping": "game_win",
+    "BettingWindow": "betting_win",
+    "SizeWarningWindow": "size_warning",
+    "StatsWindow": "stats_win",
+    "DrillWindow": "drill_win",
+    "HistoryWindow": "history_win",
+    "BaseWindow": "utils",
+}
+
+__all__ = list(lazy_names)
+
+
+def __getattr__(name: str):
+    if name not in lazy_names:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{lazy_names[name]}", __name__), name)
+    globals()[name] = value
+    return value
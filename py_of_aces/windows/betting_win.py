@@ -16,12 +16,23 @@ class BettingWindow(BaseWindow):
     bet_options = init_bet_options
 
     def __init__(
-        self, game: BlackjackGame, menu_window: str, game_window: str, **kwargs
+        self,
+        game: BlackjackGame,
+        menu_window: str,
+        game_window: str,
+        stats_window: str = None,
+        history_window: str = None,
+        **kwargs,
     ):
         super().__init__(**kwargs)
         self.game = game
         self.menu_window = menu_window
         self.game_window = game_window
+        self.stats_window = stats_window
+        self.history_window = history_window
+
+    def draw_key(self):
+        return (self.game.revision, self.message, self.bet_amount)
 
     def draw(self) -> None:
         if self.__is_game_ongoing():
@@ -67,6 +78,10 @@ class BettingWindow(BaseWindow):
             lines.append("")
 
         controls = "[q] Quit  [↑↓] Adjust bet  [1-4] Quick bets  [ENTER] Deal"
+        if self.stats_window:
+            controls += "  [t] Stats"
+        if self.history_window:
+            controls += "  [h] History"
         lines.append(controls)
 
         return lines
@@ -98,3 +113,9 @@ class BettingWindow(BaseWindow):
 
         elif key in self.bet_options:
             self.bet_amount = min(self.bet_options[key], available_money)
+
+        elif key == "t" and self.stats_window:
+            self.switch_win(self.stats_window)
+
+        elif key == "h" and self.history_window:
+            self.switch_win(self.history_window)
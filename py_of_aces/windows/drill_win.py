@@ -0,0 +1,110 @@
+from .utils import BaseWindow
+from .game_win import hand_lines, hint_labels
+from ..game_logic import Action
+from ..game_logic.drill import Drill, Scenario
+from ..config import quit_keys
+
+drill_keys: dict[str, Action] = {
+    "h": Action.HIT,
+    " ": Action.STAND,
+    "d": Action.DOUBLE,
+    "p": Action.SPLIT,
+    "u": Action.SURRENDER,
+}
+
+
+def scenario_text(scenario: Scenario) -> str:
+    """Short name of a scenario, "A,7 v 9"."""
+    names = ["A" if points == 1 else str(points) for points in scenario]
+    return f"{names[0]},{names[1]} v {names[2]}"
+
+
+class DrillWindow(BaseWindow):
+    """
+    Rapid-fire decision drill: one starting hand after another, each answer
+    checked against basic strategy at once.
+
+    args:
+        drill: The Drill dealing the scenarios.
+        menu_window: The name of the window to go back to.
+    """
+
+    def __init__(self, drill: Drill, menu_window: str, **kwargs):
+        super().__init__(**kwargs)
+        self.drill = drill
+        self.menu_window = menu_window
+
+    def draw_key(self):
+        return self.drill.revision
+
+    def draw(self) -> list[str]:
+        lines: list[str] = []
+        drill = self.drill
+
+        title = self.term.bold(f"{self.term.reverse}DRILL{self.term.normal}")
+        lines.append(title)
+        lines.append("")
+
+        lines.append(
+            f"Correct: {drill.correct}/{drill.attempts} ({drill.hit_rate:.1%})"
+        )
+        lines.append("")
+
+        lines.append("DEALER")
+        lines.extend(hand_lines(drill.dealer_hand))
+        lines.append("")
+        lines.append("PLAYER")
+        lines.extend(hand_lines(drill.player_hand))
+        lines.append("")
+
+        lines.extend(self.__draw_last_answer())
+
+        weakest = drill.weakest()
+        if weakest:
+            parts = []
+            for scenario in weakest:
+                correct, attempts = drill.accuracy[scenario]
+                parts.append(f"{scenario_text(scenario)} {correct}/{attempts}")
+            lines.append("Weakest: " + "  ".join(parts))
+            lines.append("")
+
+        controls = "[h] Hit  [SPACE] Stand  [d] Double Down"
+        if Action.SPLIT in drill.legal_actions:
+            controls += "  [p] Split"
+
+        if Action.SURRENDER in drill.legal_actions:
+            controls += "  [u] Surrender"
+
+        controls += "  [q] Back"
+        lines.append(controls)
+
+        return lines
+
+    def __draw_last_answer(self) -> list[str]:
+        if self.drill.last is None:
+            return []
+
+        scenario, answer, expected = self.drill.last
+        correct, attempts = self.drill.accuracy[scenario]
+        score = f"({correct}/{attempts} on {scenario_text(scenario)})"
+
+        if answer is expected:
+            text = self.term.bold_green(f"Correct: {hint_labels[expected]} {score}")
+        else:
+            text = self.term.red(
+                f"{hint_labels[answer]} was wrong, "
+                f"basic strategy says {hint_labels[expected]} {score}"
+            )
+
+        return [text, ""]
+
+    def handle_input(self, key: str) -> None:
+        key = key.lower()
+
+        if key in quit_keys:
+            self.switch_win(self.menu_window)
+            return
+
+        action = drill_keys.get(key)
+        if action in self.drill.legal_actions:
+            self.drill.answer(action)
@@ -1,15 +1,60 @@
 from .utils import BaseWindow
 from ..utils import get_card_ascii, join_cards
-from ..game_logic import BlackjackGame, GameResult, GameState, Hand, Modes
-from ..config import enter_keys, quit_keys
+from ..game_logic import Action, BlackjackGame, GameResult, GameState, Hand, Modes
+from ..config import quit_keys
+from ..hint_worker import HintWorker, hint_key
 
 result_text_mapping = {
     GameResult.WIN: "YOU WIN",
     GameResult.BLACKJACK: "BLACKJACK! You win",
     GameResult.LOSE: "Dealer wins. You lose",
     GameResult.PUSH: "PUSH! Bet returned",
+    GameResult.SURRENDER: "SURRENDERED. Half bet returned",
 }
 
+hint_labels = {
+    Action.HIT: "Hit",
+    Action.STAND: "Stand",
+    Action.DOUBLE: "Double",
+    Action.SPLIT: "Split",
+    Action.SURRENDER: "Surrender",
+}
+
+
+def hand_lines(hand: Hand) -> list[str]:
+    """The hand's cards side by side as ASCII art, then its total."""
+    lines: list[str] = []
+    card_arts = []
+    has_hidden = hand.has_hidden_card
+
+    for card in hand.get_showing_cards():
+        card_art = get_card_ascii(card.rank, card.suit)
+        card_arts.append(card_art)
+
+    if has_hidden:
+        hidden_art = get_card_ascii("?", "?", face_down_text="HIDDEN")
+        card_arts.append(hidden_art)
+
+    combined_cards = join_cards(*card_arts)
+    for line in combined_cards.splitlines():
+        lines.append(line)
+
+    hand_info = ""
+    if has_hidden:
+        hand_info += f"Showing: {hand.get_showing_value()}"
+        lines.append(hand_info)
+        return lines
+
+    hand_info += f"Total: {hand.get_showing_value()}"
+    if hand.is_blackjack:
+        hand_info += " (BLACKJACK!)"
+
+    elif hand.is_bust:
+        hand_info += " (BUST!)"
+
+    lines.append(hand_info)
+    return lines
+
 
 class GameWindow(BaseWindow):
     def __init__(
@@ -20,6 +65,10 @@ class GameWindow(BaseWindow):
         self.message = ""
         self.menu_window = menu_window
         self.betting_window = betting_window
+        self.hints = HintWorker()
+
+    def draw_key(self):
+        return (self.game.revision, self.message, self.hints.completed)
 
     def draw(self):
         lines: list[str] = []
@@ -68,7 +117,7 @@ class GameWindow(BaseWindow):
         lines.append("DEALER")
 
         dealer_hand = self.game.dealer_hand
-        lines.extend(self.__draw_cards(dealer_hand))
+        lines.extend(hand_lines(dealer_hand))
         lines.append("")
 
         lines.append("PLAYER")
@@ -82,41 +131,8 @@ class GameWindow(BaseWindow):
 
                 lines.append(hand_title)
 
-            lines.extend(self.__draw_cards(hand))
-
-        return lines
-
-    def __draw_cards(self, hand: Hand) -> list[str]:
-        lines: list[str] = []
-        card_arts = []
-        has_hidden = hand.has_hidden_card
-
-        for card in hand.get_showing_cards():
-            card_art = get_card_ascii(card.rank, card.suit)
-            card_arts.append(card_art)
-
-        if has_hidden:
-            hidden_art = get_card_ascii("?", "?", face_down_text="HIDDEN")
-            card_arts.append(hidden_art)
-
-        combined_cards = join_cards(*card_arts)
-        for line in combined_cards.splitlines():
-            lines.append(line)
-
-        hand_info = ""
-        if has_hidden:
-            hand_info += f"Showing: {hand.get_showing_value()}"
-            lines.append(hand_info)
-            return lines
-
-        hand_info += f"Total: {hand.get_showing_value()}"
-        if hand.is_blackjack:
-            hand_info += " (BLACKJACK!)"
+            lines.extend(hand_lines(hand))
 
-        elif hand.is_bust:
-            hand_info += " (BUST!)"
-
-        lines.append(hand_info)
         return lines
 
     def __draw_game_result(self) -> list[str]:
@@ -146,8 +162,14 @@ class GameWindow(BaseWindow):
                 if self.game.can_split:
                     controls += "  [p] Split"
 
+                if self.game.can_surrender:
+                    controls += "  [u] Surrender"
+
                 controls += "  [q] Quit"
 
+                if self.game.mode == Modes.PRACTICE:
+                    return [controls, self.__draw_hints()]
+
             case GameState.ROUND_FINISHED:
                 if self.game.available_money > 0:
                     controls += "[ENTER] New Round  "
@@ -156,12 +178,30 @@ class GameWindow(BaseWindow):
 
         return [controls]
 
+    def __draw_hints(self) -> str:
+        """EV of each action for the current hand, computed in the background."""
+        evs = self.hints.request(hint_key(self.game))
+        if evs is None:
+            return self.term.dim("EV: computing...")
+
+        best = max(evs, key=evs.__getitem__)
+        parts = []
+        for action, ev in evs.items():
+            part = f"{hint_labels[action]} {ev:+.3f}"
+            parts.append(self.term.bold_green(part) if action is best else part)
+
+        return "EV: " + "  ".join(parts)
+
     def handle_input(self, key: str) -> None:
         """Handle user input based on the current game state."""
         self.message = ""
         self.info = ""
         key = key.lower()
 
+        if self.game.state == GameState.ROUND_FINISHED:
+            # Settle the round whichever key leaves it; repeats do nothing
+            self.game.finish_round()
+
         if key in quit_keys:
             self.switch_win(self.menu_window)
             return
@@ -176,11 +216,9 @@ class GameWindow(BaseWindow):
         if key == "r":
             self.game.reset_money()
 
-        if key in enter_keys:
-            self.game.finish_round()
-            if self.game.is_game_over:
-                self.message = "Game Over! No money left."
-                return
+        if self.game.is_game_over:
+            self.message = "Game Over! No money left."
+            return
 
         self.game.start_new_round()
         self.switch_win(self.betting_window)
@@ -203,3 +241,7 @@ class GameWindow(BaseWindow):
             case "s":
                 if not self.game.split():
                     self.message = "Cannot split without a pair!"
+
+            case "u":
+                if not self.game.surrender():
+                    self.message = "Cannot surrender now!"
@@ -0,0 +1,134 @@
+import time
+from .utils import BaseWindow
+from ..game_logic.round_history import RoundHistory
+from ..game_logic.round_record import RoundRecord
+from ..config import quit_keys, up_keys, down_keys
+
+page_up_keys: list[str] = ["key_pgup"]
+page_down_keys: list[str] = ["key_pgdown"]
+
+
+def round_summary(number: int, record: RoundRecord) -> str:
+    """One line for a round: "#12  Dealer Ks 7h (17)  You Td 9c (19)  WIN  +25$"."""
+    hands = " | ".join(
+        f"{' '.join(cards)} ({total})"
+        for cards, total in zip(record.player_hands, record.hand_totals)
+    )
+    results = "/".join(result or "-" for result in record.results)
+    return (
+        f"#{number:<5} Dealer {' '.join(record.dealer_cards)} "
+        f"({record.dealer_total})  You {hands}  {results}  {record.net:+}$"
+    )
+
+
+class HistoryWindow(BaseWindow):
+    """
+    Scrollable list of the last rounds played, newest first, with the
+    selected round in full below. Only the rounds on screen are decoded.
+
+    args:
+        history: The RoundHistory to show.
+        return_window: The name of the window to go back to.
+    """
+
+    def __init__(self, history: RoundHistory, return_window: str, **kwargs):
+        super().__init__(**kwargs)
+        self.history = history
+        self.return_window = return_window
+
+        # Rounds back from the latest, 0 being the latest
+        self.selected = 0
+        self.top = 0
+
+    def draw_key(self):
+        return (self.history.revision, self.selected, self.top)
+
+    def draw(self) -> list[str]:
+        lines: list[str] = []
+        history = self.history
+
+        title = self.term.bold(f"{self.term.reverse}ROUND HISTORY{self.term.normal}")
+        lines.append(title)
+        lines.append("")
+
+        if not len(history):
+            lines.append("No rounds played yet.")
+            lines.append("")
+            lines.append("[q] Back")
+            return lines
+
+        lines.append(f"Last {len(history)} rounds, keeping up to {history.capacity}")
+        lines.append("")
+
+        bottom = min(self.top + self.__page_size(), len(history))
+        for back in range(self.top, bottom):
+            index = -1 - back
+            line = round_summary(history.round_number(index), history[index])
+            lines.append(self.term.reverse(line) if back == self.selected else line)
+        lines.append("")
+
+        lines.extend(self.__draw_details(history[-1 - self.selected]))
+        lines.append("")
+
+        lines.append("[↑↓] Scroll  [PgUp/PgDn] Page  [q] Back")
+        return lines
+
+    def __draw_details(self, record: RoundRecord) -> list[str]:
+        played_at = time.strftime("%H:%M:%S", time.localtime(record.played_at))
+        lines = [
+            f"Played at {played_at} ({record.mode.title()})  "
+            f"Dealer: {' '.join(record.dealer_cards)} ({record.dealer_total})"
+        ]
+
+        for i, cards in enumerate(record.player_hands):
+            lines.append(
+                f"Hand {i + 1}: {' '.join(cards)} ({record.hand_totals[i]})  "
+                f"Bet {record.bets[i]}$  {record.results[i] or '-'}  "
+                f"Paid {record.hand_payouts[i]}$"
+            )
+
+        if record.side_bets:
+            lines.append(f"Side bets: {record.side_bets}$")
+
+        if record.actions:
+            actions = [action for _, action in record.actions]
+            if len(record.player_hands) > 1:
+                actions = [
+                    f"{action} (hand {index + 1})" for index, action in record.actions
+                ]
+            lines.append(f"Actions: {', '.join(actions)}")
+
+        lines.append(f"Net: {record.net:+}$")
+        return lines
+
+    def __page_size(self) -> int:
+        # Room left around the title, details and controls
+        height = getattr(self.term, "height", None) or 24
+        return max(int(height) - 20, 3)
+
+    def __scroll_into_view(self) -> None:
+        page = self.__page_size()
+        if self.selected < self.top:
+            self.top = self.selected
+        elif self.selected >= self.top + page:
+            self.top = self.selected - page + 1
+
+    def handle_input(self, key: str) -> None:
+        key = key.lower()
+
+        if key in quit_keys:
+            self.selected = self.top = 0
+            self.switch_win(self.return_window)
+            return
+
+        last = max(len(self.history) - 1, 0)
+        if key in up_keys:
+            self.selected = max(self.selected - 1, 0)
+        elif key in down_keys:
+            self.selected = min(self.selected + 1, last)
+        elif key in page_up_keys:
+            self.selected = max(self.selected - self.__page_size(), 0)
+        elif key in page_down_keys:
+            self.selected = min(self.selected + self.__page_size(), last)
+
+        self.__scroll_into_view()
@@ -11,16 +11,24 @@ class MenuWindow(BaseWindow):
     args:
         game: The BlackjackGame instance to manage game state.
         betting_window: The name of the betting window to switch to.
+        drill_window: The name of the drill window to switch to.
     """
 
-    items = ["Play", "Practice", "Quit"]
+    items = ["Play", "Practice", "Drill", "Quit"]
     item_count = len(items)
     selected_index = 0
 
-    def __init__(self, game: BlackjackGame, betting_window: str, **kwargs):
+    def __init__(
+        self,
+        game: BlackjackGame,
+        betting_window: str,
+        drill_window: str = "drill",
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.game = game
         self.betting_window = betting_window
+        self.drill_window = drill_window
 
     def draw(self) -> list[str]:
         lines: list[str] = []
@@ -64,5 +72,8 @@ class MenuWindow(BaseWindow):
                 self.game.select_mode(Modes.PRACTICE)
                 self.switch_win(self.betting_window)
 
+            case "Drill":
+                self.switch_win(self.drill_window)
+
             case "Quit":
                 self.stop_process()
@@ -0,0 +1,143 @@
+from .utils import BaseWindow
+from ..game_logic import BlackjackGame, GameResult
+from ..game_logic.histogram import chart_lines
+from ..config import quit_keys
+
+# Histogram shown by each chart view, in the order "c" cycles through them
+chart_titles: dict[str, str] = {
+    "net": "NET PER ROUND ($)",
+    "bankroll": "BANKROLL AFTER EACH ROUND ($)",
+    "dealer_total": "DEALER FINAL TOTALS",
+}
+
+
+class StatsWindow(BaseWindow):
+    """
+    Session statistics panel for the current game mode, with charts of the
+    distributions behind them.
+
+    args:
+        game: The BlackjackGame instance whose mode stats are shown.
+        return_window: The name of the window to go back to.
+        export_path: Where [e] writes the histograms as CSV.
+    """
+
+    def __init__(
+        self,
+        game: BlackjackGame,
+        return_window: str,
+        export_path: str = "py_of_aces_histograms.csv",
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.game = game
+        self.return_window = return_window
+        self.export_path = export_path
+
+        # None for the stats, else a key of chart_titles
+        self.chart: str | None = None
+        self.message = ""
+
+    def draw_key(self):
+        return (self.game.revision, self.chart, self.message)
+
+    def draw(self) -> list[str]:
+        if self.chart:
+            return self.__draw_chart()
+
+        lines: list[str] = []
+        stats = self.game.current_mode.stats
+
+        title = self.term.bold(f"{self.term.reverse}SESSION STATS{self.term.normal}")
+        lines.append(title)
+        lines.append("")
+
+        lines.append(f"Rounds: {stats.rounds}  Hands: {stats.hands}")
+        lines.append(f"Win rate: {stats.win_rate:.1%}")
+        lines.append(
+            f"EV per round: {stats.mean:+.2f}$ (± {stats.std_error:.2f}$)"
+            f"  Edge: {stats.ev_per_unit:+.2%}"
+        )
+        lines.append(f"Std dev per round: {stats.std_dev:.2f}$")
+        lines.append("")
+
+        counts = [
+            f"{result.name.title()}: {stats.result_counts[result]}"
+            for result in GameResult
+        ]
+        lines.append("  ".join(counts))
+        lines.append(f"Doubles: {stats.doubles}  Splits: {stats.splits}")
+        lines.append("")
+
+        lines.append(f"Max drawdown: {stats.max_drawdown:.0f}$")
+        lines.append(
+            f"Longest streaks: {stats.longest_win_streak} won, "
+            f"{stats.longest_loss_streak} lost"
+        )
+        lines.append("")
+
+        lines.extend(self.__draw_footer())
+        return lines
+
+    def __draw_chart(self) -> list[str]:
+        histogram = getattr(self.game.current_mode.histograms, self.chart)
+
+        title = f"{self.term.reverse}{chart_titles[self.chart]}{self.term.normal}"
+        lines = [self.term.bold(title), ""]
+
+        height = getattr(self.term, "height", None) or 24
+        width = getattr(self.term, "width", None) or 80
+        lines.extend(
+            chart_lines(
+                histogram,
+                width=max(min(int(width) - 40, 40), 10),
+                rows=max(int(height) - 12, 5),
+            )
+        )
+        lines.append("")
+
+        if histogram.count:
+            lines.append(
+                "  ".join(
+                    f"{percent}%: {histogram.quantile(percent / 100):.0f}"
+                    for percent in (1, 5, 50, 95, 99)
+                )
+            )
+            lines.append("")
+
+        lines.extend(self.__draw_footer())
+        return lines
+
+    def __draw_footer(self) -> list[str]:
+        lines = []
+        if self.message:
+            lines.append(self.term.yellow(self.message))
+            lines.append("")
+
+        lines.append("[c] Charts  [e] Export CSV  [q] Back")
+        return lines
+
+    def __export(self) -> None:
+        try:
+            with open(self.export_path, "w") as file:
+                file.write(self.game.current_mode.histograms.to_csv())
+        except OSError as error:
+            self.message = f"Couldn't export: {error.strerror}"
+            return
+
+        self.message = f"Histograms saved to {self.export_path}"
+
+    def handle_input(self, key: str) -> None:
+        self.message = ""
+        key = key.lower()
+
+        if key in quit_keys:
+            self.chart = None
+            self.switch_win(self.return_window)
+
+        elif key == "c":
+            views = [None, *chart_titles]
+            self.chart = views[(views.index(self.chart) + 1) % len(views)]
+
+        elif key == "e":
+            self.__export()
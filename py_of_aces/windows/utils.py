@@ -1,27 +1,63 @@
-from blessed import Terminal
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from blessed import Terminal
 
 
 class BaseWindow:
     def __init__(
-        self, terminal_instance: Terminal, switch_win: callable, stop_process: callable
+        self,
+        terminal_instance: "Terminal",
+        switch_win: callable,
+        stop_process: callable,
     ):
         self.term = terminal_instance
         self.switch_win = switch_win
         self.stop_process = stop_process
 
+        self.__drawn_key = None
+        self.__drawn_lines: list[str] = []
+
     def draw(self):
         raise NotImplementedError
 
+    def draw_key(self):
+        """
+        Return a value that identifies what draw() would produce, e.g. the
+        game revision. While it stays equal, render() reuses the last lines.
+        None (the default) always redraws.
+        """
+        return None
+
+    def is_stale(self) -> bool:
+        """
+        Whether draw() would produce something new since the last render,
+        going by draw_key(). Windows without a draw key never report stale.
+        """
+        key = self.draw_key()
+        return key is not None and key != self.__drawn_key
+
     def handle_input(self, key: str):
         raise NotImplementedError
 
-    def render(self) -> None:
-        """Renders the lines from draw() centered vertically and horizontally."""
-        lines = self.draw() or []
+    def __get_lines(self) -> list[str]:
+        """Return the lines to render, calling draw() only if stale."""
+        key = self.draw_key()
+        if key is not None and key == self.__drawn_key:
+            return self.__drawn_lines
 
+        lines = self.draw() or []
         if not isinstance(lines, (list, tuple)):
             lines = [str(lines)]
 
+        self.__drawn_key = key
+        self.__drawn_lines = lines
+        return lines
+
+    def render(self) -> None:
+        """Renders the lines from draw() centered vertically and horizontally."""
+        lines = self.__get_lines()
+
         height = getattr(self.term, "height", None) or 24
         pad = max((int(height) - len(lines)) // 2, 0)
 